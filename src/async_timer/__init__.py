@@ -1,2 +1,24 @@
-from . import pacemaker, timer, traget_caller
-from .timer import Timer
+from . import (
+    cache,
+    group,
+    history,
+    hooks,
+    leader,
+    pacemaker,
+    schedule,
+    scheduler,
+    shared,
+    stats,
+    subscription,
+    threaded,
+    timer,
+    traget_caller,
+)
+from .cache import CachedValue
+from .group import TimerGroup
+from .history import HistoryOverrunError
+from .schedule import CronSchedule
+from .scheduler import Scheduler
+from .threaded import ThreadedTimer
+from .timer import Timer, TimerSnapshot
+from .traget_caller import time_left
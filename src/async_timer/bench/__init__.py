@@ -0,0 +1,4 @@
+"""Performance benchmarks for the async timer.
+
+Run with `python -m async_timer.bench [name ...]`, the results are printed as JSON.
+"""
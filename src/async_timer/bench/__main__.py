@@ -0,0 +1,86 @@
+"""Command line entry point for the benchmarks."""
+import argparse
+import datetime
+import importlib
+import json
+import platform
+import sys
+import typing
+
+BENCHMARKS = (
+    "caller",
+    "executor",
+    "fanout",
+    "group",
+    "hooks",
+    "memory",
+    "pacemaker",
+    "scheduler",
+    "slack",
+    "throughput",
+    "waiters",
+)
+
+
+def _package_version() -> typing.Optional[str]:
+    import importlib.metadata
+
+    try:
+        return importlib.metadata.version("async-timer")
+    except importlib.metadata.PackageNotFoundError:
+        return None
+
+
+def environment() -> dict:
+    """Describe the machine and interpreter, so the runs can be compared"""
+    return {
+        "date": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "async_timer": _package_version(),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m async_timer.bench")
+    parser.add_argument(
+        "names",
+        nargs="*",
+        metavar="name",
+        help=f"benchmarks to run: {', '.join(BENCHMARKS)} (all of them by default)",
+    )
+    parser.add_argument(
+        "--quick",
+        action="store_true",
+        help="run with tiny parameters (a smoke test, not a measurement)",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=argparse.FileType("w"),
+        default=sys.stdout,
+        help="write the JSON results to this file (stdout by default)",
+    )
+    args = parser.parse_args(argv)
+    # (`choices` can not be combined with an empty `nargs="*"` in argparse)
+    unknown = sorted(set(args.names) - set(BENCHMARKS))
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(unknown)}")
+    results = {}
+    for name in args.names or BENCHMARKS:
+        module = importlib.import_module(f"async_timer.bench.{name}")
+        results[name] = module.run(**(module.QUICK if args.quick else {}))
+    json.dump(
+        {"environment": environment(), "quick": args.quick, "results": results},
+        args.output,
+        indent=2,
+    )
+    args.output.write("\n")
+    if args.output is not sys.stdout:
+        args.output.close()
+
+
+if __name__ == "__main__":
+    main()
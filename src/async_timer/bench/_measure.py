@@ -0,0 +1,24 @@
+"""Measurement helpers shared by the benchmarks."""
+import multiprocessing
+import pathlib
+import typing
+
+
+def rss_bytes() -> int:
+    """Return the resident set size of the current process"""
+    statm = pathlib.Path("/proc/self/statm")
+    if statm.exists():
+        import os
+
+        return int(statm.read_text().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    import resource
+
+    # Peak (not current) RSS, in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def isolated(fn: typing.Callable[..., dict], **kwargs) -> dict:
+    """Run `fn(**kwargs)` in a fresh interpreter so RSS readings don't leak"""
+    ctx = multiprocessing.get_context("spawn")
+    with ctx.Pool(1) as pool:
+        return pool.apply(fn, kwds=kwargs)
@@ -0,0 +1,61 @@
+"""Per-call overhead of the `Caller` for every kind of the target."""
+import asyncio
+import itertools
+import time
+import typing
+
+from async_timer.traget_caller import Caller
+
+QUICK = {"calls": 1_000}
+
+
+def _sync():
+    return 42
+
+
+async def _coroutine():
+    return 42
+
+
+def _sync_generator():
+    for _ in itertools.count():
+        yield 42
+
+
+async def _async_generator():
+    for _ in itertools.count():
+        yield 42
+
+
+TARGETS = {
+    "sync": _sync,
+    "coroutine": _coroutine,
+    "sync_generator": _sync_generator,
+    "async_generator": _async_generator,
+}
+
+
+def measure(kind: str, calls: int) -> dict:
+    """Call the `kind` target `calls` times through a `Caller`"""
+
+    async def _run():
+        caller = Caller(TARGETS[kind])
+        await caller.next()  # The first call sets the caller up
+        cpu_start = time.process_time()
+        wall_start = time.perf_counter()
+        for _ in range(calls):
+            await caller.next()
+        wall_used = time.perf_counter() - wall_start
+        cpu_used = time.process_time() - cpu_start
+        return {
+            "kind": kind,
+            "calls": calls,
+            "us_per_call": 1e6 * wall_used / calls,
+            "cpu_us_per_call": 1e6 * cpu_used / calls,
+        }
+
+    return asyncio.run(_run())
+
+
+def run(calls: int = 100_000) -> typing.List[dict]:
+    return [measure(kind, calls=calls) for kind in TARGETS]
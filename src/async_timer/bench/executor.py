@@ -0,0 +1,48 @@
+"""Event loop latency while a timer runs a blocking target."""
+import asyncio
+import statistics
+import time
+import typing
+
+import async_timer
+
+QUICK = {"block_for": 0.01, "duration": 0.1}
+
+
+def measure(
+    executor: "async_timer.traget_caller.ExecutorT",
+    block_for: float,
+    duration: float,
+    probe_interval: float = 1e-3,
+) -> dict:
+    """Probe the event loop lag while the timer target blocks for `block_for`"""
+
+    async def _run():
+        loop = asyncio.get_running_loop()
+        lags = []
+        async with async_timer.Timer(
+            block_for, target=lambda: time.sleep(block_for), executor=executor
+        ) as timer:
+            end_time = loop.time() + duration
+            while loop.time() < end_time:
+                start = loop.time()
+                await asyncio.sleep(probe_interval)
+                lags.append(loop.time() - start - probe_interval)
+            hits = timer.hit_count
+        lags.sort()
+        return {
+            "executor": str(executor),
+            "target_calls": hits,
+            "lag_p50_ms": 1e3 * statistics.median(lags),
+            "lag_p99_ms": 1e3 * lags[int(len(lags) * 0.99)],
+            "lag_max_ms": 1e3 * lags[-1],
+        }
+
+    return asyncio.run(_run())
+
+
+def run(block_for: float = 0.05, duration: float = 2.0) -> typing.List[dict]:
+    return [
+        measure(executor, block_for=block_for, duration=duration)
+        for executor in (None, "default")
+    ]
@@ -0,0 +1,76 @@
+"""Publish latency of the result fanout as the number of waiters grows."""
+import asyncio
+import time
+import typing
+
+from async_timer.timer import FanoutRv
+
+QUICK = {"waiter_counts": (10, 100), "rounds": 2}
+
+
+class LockedFanoutRv:
+    """The original lock-based, future-per-waiter fanout, kept for comparison"""
+
+    def __init__(self):
+        self.futures = []
+        self.lock = asyncio.Lock()
+
+    async def wait(self):
+        future = asyncio.get_running_loop().create_future()
+        async with self.lock:
+            self.futures.append(future)
+        return await future
+
+    async def send_result(self, result):
+        async with self.lock:
+            for future in self.futures:
+                future.set_result(result)
+            self.futures.clear()
+
+
+def measure(fanout_cls: typing.Type, waiters: int, rounds: int) -> dict:
+    """Publish `rounds` results to `waiters` subscribers"""
+
+    async def _run():
+        fanout = fanout_cls()
+        woken = 0
+        subscribe_s = publish_s = wake_all_s = 0.0
+
+        async def _waiter():
+            nonlocal woken
+            await fanout.wait()
+            woken += 1
+
+        for _ in range(rounds):
+            woken = 0
+            tasks = [asyncio.ensure_future(_waiter()) for _ in range(waiters)]
+            start = time.perf_counter()
+            await asyncio.sleep(0)  # All of the waiters subscribe
+            subscribe_s += time.perf_counter() - start
+            start = time.perf_counter()
+            await fanout.send_result(42)
+            publish_s += time.perf_counter() - start
+            while woken < waiters:
+                await asyncio.sleep(0)
+            wake_all_s += time.perf_counter() - start
+            await asyncio.gather(*tasks)
+        return {
+            "fanout": fanout_cls.__name__,
+            "waiters": waiters,
+            "subscribe_us": 1e6 * subscribe_s / rounds,
+            "publish_us": 1e6 * publish_s / rounds,
+            "wake_all_us": 1e6 * wake_all_s / rounds,
+        }
+
+    return asyncio.run(_run())
+
+
+def run(
+    waiter_counts: typing.Sequence[int] = (10, 100, 1_000, 5_000, 20_000),
+    rounds: int = 5,
+) -> typing.List[dict]:
+    return [
+        measure(fanout_cls, waiters=waiters, rounds=rounds)
+        for waiters in waiter_counts
+        for fanout_cls in (LockedFanoutRv, FanoutRv)
+    ]
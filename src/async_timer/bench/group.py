@@ -0,0 +1,43 @@
+"""Shutdown time of many timers, one by one and with a `TimerGroup`."""
+import asyncio
+import time
+import typing
+
+import async_timer
+
+QUICK = {"timers": 100}
+
+
+def _noop():
+    return None
+
+
+def measure(timers: int, grouped: bool) -> dict:
+    """Start `timers` idle timers, then cancel them and wait for them to finish"""
+
+    async def _run():
+        running = [async_timer.Timer(3600, target=_noop) for _ in range(timers)]
+        group = async_timer.TimerGroup(running)
+        group.start()
+        await asyncio.sleep(0)  # The first (immediate) calls
+        start = time.perf_counter()
+        if grouped:
+            await group.cancel()
+        else:
+            tasks = [timer.main_task for timer in running]
+            for timer in running:
+                await timer.cancel()
+            await asyncio.wait(tasks)
+        used = time.perf_counter() - start
+        return {
+            "timers": timers,
+            "grouped": grouped,
+            "cancel_s": used,
+            "cancel_us_per_timer": 1e6 * used / timers,
+        }
+
+    return asyncio.run(_run())
+
+
+def run(timers: int = 20_000) -> typing.List[dict]:
+    return [measure(timers, grouped=grouped) for grouped in (False, True)]
@@ -0,0 +1,44 @@
+"""Timer tick overhead with and without the lifecycle hooks."""
+import asyncio
+import time
+import typing
+
+import async_timer
+
+QUICK = {"ticks": 500}
+
+
+def measure(variant: str, ticks: int, delay: float) -> dict:
+    """Run a no-op timer for `ticks` calls
+
+    `variant` is "disabled" (no hooks), "noop_hooks" or "stats".
+    """
+    kwargs = {
+        "disabled": {},
+        "noop_hooks": {"hooks": async_timer.hooks.TimerHooks()},
+        "stats": {"stats": True},
+    }[variant]
+
+    async def _run():
+        timer = async_timer.Timer(delay, target=lambda: None, **kwargs)
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        async with timer:
+            await timer.wait(hits=ticks)
+        wall_used = time.perf_counter() - wall_start
+        cpu_used = time.process_time() - cpu_start
+        return {
+            "variant": variant,
+            "ticks": timer.hit_count,
+            "ticks_per_s": timer.hit_count / wall_used,
+            "cpu_us_per_tick": 1e6 * cpu_used / timer.hit_count,
+        }
+
+    return asyncio.run(_run())
+
+
+def run(ticks: int = 20_000, delay: float = 1e-6) -> typing.List[dict]:
+    return [
+        measure(variant, ticks=ticks, delay=delay)
+        for variant in ("disabled", "noop_hooks", "stats")
+    ]
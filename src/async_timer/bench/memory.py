@@ -0,0 +1,106 @@
+"""Memory used by idle timers and by the instances of the timer classes."""
+import asyncio
+import gc
+import tracemalloc
+import typing
+
+import async_timer
+from async_timer.bench import _measure
+
+QUICK = {"counts": (100,), "instances": 100}
+
+
+def _noop():
+    return None
+
+
+def unslotted(cls: type) -> type:
+    """Return a copy of `cls` that keeps the attributes in a per-instance dict
+
+    (The baseline the `__slots__` of the class are compared to)
+    """
+    namespace = {
+        key: val
+        for (key, val) in vars(cls).items()
+        if key not in cls.__slots__ and key != "__slots__"
+    }
+    return type(cls.__name__, cls.__bases__, namespace)
+
+
+# The instance factories of the classes that are created for every timer
+#   (a `Timer` includes its pacemaker, caller and fanout, slotted in both variants)
+INSTANCE_FACTORIES: typing.Dict[type, typing.Callable[[type], typing.Any]] = {
+    async_timer.Timer: lambda cls: cls(3600, target=_noop),
+    async_timer.pacemaker.TimerPacemaker: lambda cls: cls(3600),
+    async_timer.traget_caller.Caller: lambda cls: cls(_noop),
+    async_timer.timer.FanoutRv: lambda cls: cls(),
+}
+
+
+def measure(count: int, shared: bool) -> dict:
+    """Start `count` timers that wait for their (distant) next tick"""
+
+    async def _run():
+        scheduler = async_timer.Scheduler() if shared else None
+        gc.collect()
+        tracemalloc.start()
+        rss_before = _measure.rss_bytes()
+        (traced_before, _) = tracemalloc.get_traced_memory()
+        timers = [
+            async_timer.Timer(3600, target=_noop, scheduler=scheduler, start=True)
+            for _ in range(count)
+        ]
+        await asyncio.sleep(0.01)  # Every timer ran once and is now waiting
+        gc.collect()
+        (traced_after, _) = tracemalloc.get_traced_memory()
+        rss_used = _measure.rss_bytes() - rss_before
+        tracemalloc.stop()
+        assert all(timer.hit_count == 1 for timer in timers)
+        for timer in timers:
+            await timer.cancel()
+        return {
+            "timers": count,
+            "shared_scheduler": shared,
+            "bytes_per_timer": (traced_after - traced_before) / count,
+            "rss_bytes_per_timer": rss_used / count,
+        }
+
+    return asyncio.run(_run())
+
+
+def measure_instances(cls: type, count: int, slots: bool) -> dict:
+    """Create `count` instances of `cls` (or of its dict-based copy)"""
+    factory = INSTANCE_FACTORIES[cls]
+    instance_cls = cls if slots else unslotted(cls)
+
+    async def _run():
+        gc.collect()
+        tracemalloc.start()
+        (traced_before, _) = tracemalloc.get_traced_memory()
+        instances = [factory(instance_cls) for _ in range(count)]
+        gc.collect()
+        (traced_after, _) = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del instances
+        return {
+            "class": cls.__name__,
+            "slots": slots,
+            "instances": count,
+            "bytes_per_instance": (traced_after - traced_before) / count,
+        }
+
+    return asyncio.run(_run())
+
+
+def run(
+    counts: typing.Sequence[int] = (10_000, 100_000), instances: int = 10_000
+) -> typing.List[dict]:
+    return [
+        _measure.isolated(measure, count=count, shared=shared)
+        for count in counts
+        for shared in (False, True)
+    ] + [
+        measure_instances(cls, count=instances, slots=slots)
+        for cls in INSTANCE_FACTORIES
+        for slots in (False, True)
+    ]
@@ -0,0 +1,78 @@
+"""Tick throughput and per-tick asyncio allocations of the pacemaker wait path."""
+import asyncio
+import time
+import typing
+
+import async_timer
+
+QUICK = {"ticks": 500}
+
+
+class _CountingLoop(asyncio.SelectorEventLoop):
+    """An event loop that counts the futures, tasks and timer handles it creates"""
+
+    created: int = 0
+
+    def create_future(self):
+        self.created += 1
+        return super().create_future()
+
+    def create_task(self, *args, **kwargs):
+        self.created += 1
+        return super().create_task(*args, **kwargs)
+
+    def call_at(self, *args, **kwargs):
+        self.created += 1
+        return super().call_at(*args, **kwargs)
+
+
+class WaitForPacemaker(async_timer.pacemaker.TimerPacemaker):
+    """The original `asyncio.wait_for()` based wait path, kept for comparison"""
+
+    async def _try_wait(self, delay: float, deadline: float):
+        try:
+            await asyncio.wait_for(self._cancel_evt.wait(), timeout=delay)
+        except asyncio.TimeoutError:
+            return None
+        raise StopAsyncIteration()
+
+
+def measure(
+    pacemaker_cls: typing.Type[async_timer.pacemaker.TimerPacemaker],
+    ticks: int,
+    delay: float,
+) -> dict:
+    """Iterate a `pacemaker_cls` for `ticks` iterations"""
+    loop = _CountingLoop()
+
+    async def _run():
+        pm = pacemaker_cls(delay)
+        iter_count = 0
+        created_start = loop.created
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        async for _ in pm:
+            iter_count += 1
+            if iter_count >= ticks:
+                break
+        wall_used = time.perf_counter() - wall_start
+        cpu_used = time.process_time() - cpu_start
+        return {
+            "pacemaker": pacemaker_cls.__name__,
+            "ticks": iter_count,
+            "ticks_per_s": iter_count / wall_used,
+            "cpu_us_per_tick": 1e6 * cpu_used / iter_count,
+            "asyncio_objects_per_tick": (loop.created - created_start) / iter_count,
+        }
+
+    try:
+        return loop.run_until_complete(_run())
+    finally:
+        loop.close()
+
+
+def run(ticks: int = 20_000, delay: float = 1e-6) -> typing.List[dict]:
+    return [
+        measure(pacemaker_cls, ticks=ticks, delay=delay)
+        for pacemaker_cls in (WaitForPacemaker, async_timer.pacemaker.TimerPacemaker)
+    ]
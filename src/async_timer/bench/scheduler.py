@@ -0,0 +1,58 @@
+"""CPU and RSS cost of many timers with and without a shared `Scheduler`."""
+import asyncio
+import time
+import typing
+
+import async_timer
+from async_timer.bench import _measure
+
+QUICK = {"counts": (100,), "duration": 0.1, "delay": 0.01}
+
+
+def _noop():
+    return None
+
+
+def measure(count: int, shared: bool, duration: float, delay: float) -> dict:
+    """Run `count` timers for `duration` seconds in the current process"""
+
+    async def _run():
+        scheduler = async_timer.Scheduler() if shared else None
+        rss_before = _measure.rss_bytes()
+        timers = [
+            async_timer.Timer(delay, target=_noop, scheduler=scheduler, start=True)
+            for _ in range(count)
+        ]
+        await asyncio.sleep(0)
+        cpu_start = time.process_time()
+        await asyncio.sleep(duration)
+        cpu_used = time.process_time() - cpu_start
+        rss_used = _measure.rss_bytes() - rss_before
+        hits = sum(timer.hit_count for timer in timers)
+        for timer in timers:
+            await timer.cancel()
+        return {
+            "timers": count,
+            "shared_scheduler": shared,
+            "ticks": hits,
+            "cpu_s": cpu_used,
+            "cpu_us_per_tick": 1e6 * cpu_used / max(hits, 1),
+            "rss_bytes": rss_used,
+            "rss_bytes_per_timer": rss_used / count,
+        }
+
+    return asyncio.run(_run())
+
+
+def run(
+    counts: typing.Sequence[int] = (1_000, 10_000, 100_000),
+    duration: float = 2.0,
+    delay: float = 0.5,
+) -> typing.List[dict]:
+    return [
+        _measure.isolated(
+            measure, count=count, shared=shared, duration=duration, delay=delay
+        )
+        for count in counts
+        for shared in (False, True)
+    ]
@@ -0,0 +1,79 @@
+"""Event loop wake ups and CPU of many timers at different `slack` values."""
+import asyncio
+import random
+import selectors
+import time
+import typing
+
+import async_timer
+
+QUICK = {"slacks": (0.0, 0.01), "timers": 100, "duration": 0.2, "delay": 0.1}
+
+
+class _CountingSelector(selectors.DefaultSelector):
+    """Counts the event loop iterations (one `select()` each)"""
+
+    selects = 0
+
+    def select(self, timeout=None):
+        self.selects += 1
+        return super().select(timeout)
+
+
+def _noop():
+    return None
+
+
+def measure(slack: float, timers: int, duration: float, delay: float) -> dict:
+    """Run `timers` fixed rate timers with random phases for `duration` seconds"""
+    rnd = random.Random(42)
+    selector = _CountingSelector()
+
+    async def _run():
+        running = [
+            async_timer.Timer(
+                delay,
+                target=_noop,
+                mode="fixed_rate",
+                initial_delay=rnd.uniform(0, delay),
+                slack=slack,
+                start=True,
+            )
+            for _ in range(timers)
+        ]
+        await asyncio.sleep(delay)  # All timers are past their initial delay
+        hits_start = sum(timer.hit_count for timer in running)
+        selects_start = selector.selects
+        cpu_start = time.process_time()
+        await asyncio.sleep(duration)
+        cpu_used = time.process_time() - cpu_start
+        wakeups = selector.selects - selects_start
+        hits = sum(timer.hit_count for timer in running) - hits_start
+        await async_timer.TimerGroup(running).cancel()
+        return {
+            "slack": slack,
+            "timers": timers,
+            "ticks": hits,
+            "loop_wakeups": wakeups,
+            "loop_wakeups_per_s": wakeups / duration,
+            "cpu_s": cpu_used,
+            "cpu_us_per_tick": 1e6 * cpu_used / max(hits, 1),
+        }
+
+    loop = asyncio.SelectorEventLoop(selector)
+    try:
+        return loop.run_until_complete(_run())
+    finally:
+        loop.close()
+
+
+def run(
+    slacks: typing.Sequence[float] = (0.0, 0.001, 0.01),
+    timers: int = 10_000,
+    duration: float = 3.0,
+    delay: float = 1.0,
+) -> typing.List[dict]:
+    return [
+        measure(slack, timers=timers, duration=duration, delay=delay)
+        for slack in slacks
+    ]
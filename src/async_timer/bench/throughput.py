@@ -0,0 +1,47 @@
+"""Tick throughput per timer as the number of concurrently running timers grows."""
+import asyncio
+import time
+import typing
+
+import async_timer
+
+QUICK = {"timer_counts": (1, 10), "duration": 0.1}
+
+
+def _noop():
+    return None
+
+
+def measure(timers: int, duration: float, delay: float = 0) -> dict:
+    """Run `timers` no-op timers back-to-back for `duration` seconds"""
+
+    async def _run():
+        running = [
+            async_timer.Timer(delay, target=_noop, start=True) for _ in range(timers)
+        ]
+        await asyncio.sleep(0)
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        hits_start = sum(timer.hit_count for timer in running)
+        await asyncio.sleep(duration)
+        hits = sum(timer.hit_count for timer in running) - hits_start
+        wall_used = time.perf_counter() - wall_start
+        cpu_used = time.process_time() - cpu_start
+        for timer in running:
+            await timer.cancel()
+        return {
+            "timers": timers,
+            "ticks": hits,
+            "ticks_per_s": hits / wall_used,
+            "ticks_per_s_per_timer": hits / wall_used / timers,
+            "cpu_us_per_tick": 1e6 * cpu_used / max(hits, 1),
+        }
+
+    return asyncio.run(_run())
+
+
+def run(
+    timer_counts: typing.Sequence[int] = (1, 10, 100, 1_000),
+    duration: float = 2.0,
+) -> typing.List[dict]:
+    return [measure(timers, duration=duration) for timers in timer_counts]
@@ -0,0 +1,52 @@
+"""Publish-to-wake latency of a timer as the number of `join()` waiters grows."""
+import asyncio
+import statistics
+import time
+import typing
+
+import async_timer
+
+QUICK = {"waiter_counts": (1, 10), "rounds": 3}
+
+
+def measure(waiters: int, rounds: int, delay: float = 1e-3) -> dict:
+    """Let `waiters` tasks `join()` a timer for `rounds` ticks
+
+    The target returns its call time, so every waiter can tell
+        how long the result took to reach it.
+    """
+
+    async def _run():
+        timer = async_timer.Timer(delay, target=time.perf_counter)
+        first_wake = []
+        last_wake = []
+
+        async def _waiter(latencies: typing.List[float]):
+            published_at = await timer.join()
+            latencies.append(time.perf_counter() - published_at)
+
+        async with timer:
+            for _ in range(rounds):
+                latencies = []
+                tasks = [
+                    asyncio.ensure_future(_waiter(latencies)) for _ in range(waiters)
+                ]
+                await asyncio.gather(*tasks)
+                first_wake.append(latencies[0])
+                last_wake.append(latencies[-1])
+        return {
+            "waiters": waiters,
+            "rounds": rounds,
+            "first_wake_us": 1e6 * statistics.median(first_wake),
+            "last_wake_us": 1e6 * statistics.median(last_wake),
+            "last_wake_max_us": 1e6 * max(last_wake),
+        }
+
+    return asyncio.run(_run())
+
+
+def run(
+    waiter_counts: typing.Sequence[int] = (1, 10, 100, 1_000, 10_000),
+    rounds: int = 20,
+) -> typing.List[dict]:
+    return [measure(waiters, rounds=rounds) for waiters in waiter_counts]
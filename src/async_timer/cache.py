@@ -0,0 +1,142 @@
+"""A value refreshed in the background (stale-while-revalidate)."""
+import time
+import typing
+
+import async_timer
+import async_timer.hooks  # (Subclassed at the import time)
+
+T = typing.TypeVar("T")
+
+
+class _CacheHooks(async_timer.hooks.ChainedHooks):
+    """Stores the results of the cache timer"""
+
+    cache: "CachedValue"
+
+    def __init__(
+        self,
+        cache: "CachedValue",
+        inner: typing.Optional["async_timer.hooks.TimerHooks"] = None,
+    ):
+        super().__init__(inner)
+        self.cache = cache
+
+    def on_publish(self, timer, result, failed):
+        cache = self.cache
+        if failed:
+            cache.errors += 1
+            cache.last_error = result
+        else:
+            cache.value = result
+            cache.loaded = True
+            cache.updated_at = time.monotonic()
+            cache.refreshes += 1
+        super().on_publish(timer, result, failed)
+
+
+class CachedValue(typing.Generic[T]):
+    """A value that a `Timer` reloads every `delay` seconds.
+
+    The request handlers read the `value` attribute: no awaiting, no locking.
+        The readers that need a loaded (and fresh enough) value
+        `await get()` instead, all of them share a single target call.
+    A failed reload keeps serving the last good value.
+    """
+
+    value: typing.Optional[T]  # The last loaded value (the `default` until then)
+    loaded: bool  # The target returned a value at least once
+    updated_at: typing.Optional[float]  # `time.monotonic()` of the last load
+    max_staleness: typing.Optional[float]
+    refreshes: int  # Successful loads
+    errors: int  # Failed loads
+    last_error: typing.Optional[Exception]
+    blocked_reads: int  # `get()` calls that had to wait for a load
+    timer: "async_timer.Timer[T]"
+
+    def __init__(
+        self,
+        delay: typing.Optional[float],
+        target: "async_timer.timer.TimerMainTaskT[T]",
+        max_staleness: typing.Optional[float] = None,
+        default: typing.Optional[T] = None,
+        **timer_kwargs,
+    ):
+        """Create the cache (the timer starts with `start()` or `async with`).
+
+        Parameters:
+            `delay` - number of seconds between the reloads
+            `target` - the function/generator that loads the value
+            `max_staleness` - `get()` waits for a reload once the `value`
+                            is older than this many seconds
+                            (it only waits for the first load if `None`)
+            `default` - the `value` before the first load
+            `timer_kwargs` - the other `async_timer.Timer` arguments,
+                            `on_error` is "continue" by default
+        """
+        if max_staleness is not None and max_staleness <= 0:
+            raise ValueError(f"max_staleness must be positive: {max_staleness!r}")
+        timer_kwargs.setdefault("on_error", "continue")
+        hooks = _CacheHooks(self, timer_kwargs.pop("hooks", None))
+        self.value = default
+        self.loaded = False
+        self.updated_at = None
+        self.max_staleness = max_staleness
+        self.refreshes = 0
+        self.errors = 0
+        self.last_error = None
+        self.blocked_reads = 0
+        self.timer = async_timer.Timer(delay, target, hooks=hooks, **timer_kwargs)
+
+    @property
+    def age(self) -> typing.Optional[float]:
+        """Number of seconds since the last load (`None` if nothing was loaded)"""
+        if self.updated_at is None:
+            return None
+        return time.monotonic() - self.updated_at
+
+    def is_fresh(self) -> bool:
+        """Return `True` if `get()` would return the `value` right away"""
+        if not self.loaded:
+            return False
+        return self.max_staleness is None or self.age <= self.max_staleness
+
+    async def get(self) -> T:
+        """Return the `value`, wait for a load if it is missing or too stale.
+
+        Raises the exception of the load if it failed
+            and `RuntimeError` if the cache is not running.
+        """
+        if self.is_fresh():
+            return self.value
+        if not self.timer.is_running():
+            raise RuntimeError("The cache is not running.")
+        self.blocked_reads += 1
+        if self.refreshes or self.errors:
+            # Stale (or failing), reload now instead of at the next tick
+            #   (the readers that come before the reload starts share it)
+            return await self.timer.trigger_now()
+        # The first load starts with the timer
+        return await self.timer.join()
+
+    def start(self):
+        """Start reloading the value"""
+        self.timer.start()
+
+    async def cancel(self):
+        """Stop reloading the value (the `value` stays)"""
+        await self.timer.cancel()
+
+    async def __aenter__(self) -> "CachedValue[T]":
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.cancel()
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__} value={self.value!r}"
+            f" age={self.age!r}"
+            f" max_staleness={self.max_staleness!r}"
+            ">"
+        )
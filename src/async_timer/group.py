@@ -0,0 +1,153 @@
+"""Start, cancel and wait for many timers at once."""
+import asyncio
+import typing
+
+import async_timer
+import async_timer.hooks  # (Subclassed at the import time)
+
+
+class _GroupHooks(async_timer.hooks.ChainedHooks):
+    """Counts the publications of the group timers"""
+
+    group: "TimerGroup"
+
+    def __init__(
+        self,
+        group: "TimerGroup",
+        inner: typing.Optional["async_timer.hooks.TimerHooks"] = None,
+    ):
+        super().__init__(inner)
+        self.group = group
+
+    def on_publish(self, timer, result, failed):
+        self.group.hits += 1
+        if failed:
+            self.group.errors += 1
+        super().on_publish(timer, result, failed)
+
+
+class TimerGroup:
+    """An async context manager that owns many timers.
+
+    The group starts the timers in one pass and cancels them in one batch.
+        The `hits`, `errors` and `running` counters are kept up to date
+        by the timers themselves, so reading them is O(1).
+    """
+
+    timers: typing.List["async_timer.Timer"]
+    hits: int  # Results (and exceptions) published by the timers so far
+    errors: int  # Exceptions published by the timers so far
+    running: int  # Timers started by the group that are still running
+    _hooks: _GroupHooks  # Shared by the timers without their own hooks
+
+    def __init__(self, timers: typing.Iterable["async_timer.Timer"] = ()):
+        self.timers = []
+        self.hits = 0
+        self.errors = 0
+        self.running = 0
+        self._hooks = _GroupHooks(self)
+        for timer in timers:
+            self.add(timer)
+
+    def __len__(self) -> int:
+        return len(self.timers)
+
+    def __iter__(self) -> typing.Iterator["async_timer.Timer"]:
+        return iter(self.timers)
+
+    def add(self, timer: "async_timer.Timer") -> "async_timer.Timer":
+        """Add the `timer` to the group (and return it).
+
+        A timer that is already running stays running.
+        The group counts the hits through the timer `hooks` (wrapping
+            the timer's own), so the grouped timers take the (slightly
+            slower) hooked call path.
+        """
+        if timer.hooks is None:
+            timer.hooks = self._hooks
+        else:
+            timer.hooks = _GroupHooks(self, timer.hooks)
+        self.timers.append(timer)
+        if timer.is_running():
+            self._track(timer.main_task)
+        return timer
+
+    def start(self):
+        """Start all timers that are not running yet"""
+        for timer in self.timers:
+            if timer.main_task is None:
+                timer.start()
+                self._track(timer.main_task)
+
+    def _track(self, task: asyncio.Task):
+        self.running += 1
+        task.add_done_callback(self._on_timer_done)
+
+    def _on_timer_done(self, _task: asyncio.Task):
+        self.running -= 1
+
+    async def cancel(self):
+        """Cancel all timers and wait for them to finish"""
+        # (All timers are cancelled before the first `await`)
+        tasks = [timer._cancel_now() for timer in self.timers]
+        tasks = [task for task in tasks if task is not None]
+        if tasks:
+            await asyncio.wait(tasks)
+
+    async def wait_all(
+        self, hit_count: int = None, hits: int = None, timeout: float = None
+    ) -> typing.List[typing.Any]:
+        """`Timer.wait()` for all timers, return their results (in the group order).
+
+        Raises `asyncio.TimeoutError` if they did not all make it in time.
+        """
+        return await asyncio.wait_for(
+            asyncio.gather(
+                *(timer.wait(hit_count=hit_count, hits=hits) for timer in self.timers)
+            ),
+            timeout,
+        )
+
+    async def wait_any(
+        self, hit_count: int = None, hits: int = None, timeout: float = None
+    ) -> "async_timer.Timer":
+        """`Timer.wait()` for all timers, return the first one that is done.
+
+        The timers that stop before they are done are ignored.
+        Raises `asyncio.TimeoutError` if none of them made it in time,
+            `RuntimeError` if all of them stopped
+            (and the exception of the first timer that failed).
+        """
+        loop = asyncio.get_running_loop()
+        waits = {
+            loop.create_task(timer.wait(hit_count=hit_count, hits=hits)): timer
+            for timer in self.timers
+        }
+        if not waits:
+            raise ValueError("The group has no timers")
+        deadline = None if timeout is None else loop.time() + timeout
+        pending = set(waits)
+        try:
+            while pending:
+                left = None if deadline is None else max(0.0, deadline - loop.time())
+                (done, pending) = await asyncio.wait(
+                    pending, timeout=left, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    raise asyncio.TimeoutError()
+                # (The waits of the stopped timers are cancelled)
+                finished = [task for task in done if not task.cancelled()]
+                if finished:
+                    finished[0].result()  # Raise the timer exception
+                    return waits[finished[0]]
+        finally:
+            for task in waits:
+                task.cancel()
+        raise RuntimeError("All timers of the group stopped")
+
+    async def __aenter__(self) -> "TimerGroup":
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.cancel()
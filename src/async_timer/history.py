@@ -0,0 +1,150 @@
+"""A bounded history of the timer results."""
+import array
+import asyncio
+import time
+import typing
+
+import async_timer
+
+T = typing.TypeVar("T")
+
+
+class HistoryOverrunError(Exception):
+    """Raised when a reader falls behind the history window.
+
+    The reader is moved to the oldest available entry,
+        so it can continue reading afterwards.
+    """
+
+    missed: int  # Number of entries the reader has lost
+
+    def __init__(self, missed: int):
+        super().__init__(f"{missed} result(s) fell out of the history window")
+        self.missed = missed
+
+
+class HistoryEntry(typing.NamedTuple):
+    hit_index: int  # 0-based timer hit the result belongs to
+    timestamp: float  # `time.monotonic()` at the moment of the publication
+    result: typing.Any  # The result (or the exception if `failed`)
+    failed: bool
+
+
+class ResultHistory(typing.Generic[T]):
+    """A preallocated ring buffer of the last `size` published results."""
+
+    size: int
+    count: int  # Number of entries ever appended
+    _hit_index: "array.array[int]"
+    _timestamp: "array.array[float]"
+    _failed: bytearray
+    _result: typing.List[typing.Any]
+
+    def __init__(self, size: int):
+        if size < 1:
+            raise ValueError(f"History size must be positive, got {size!r}")
+        self.size = size
+        self.count = 0
+        self._hit_index = array.array("q", bytes(8 * size))
+        self._timestamp = array.array("d", bytes(8 * size))
+        self._failed = bytearray(size)
+        self._result = [None] * size
+
+    def append(self, hit_index: int, result: typing.Any, failed: bool = False):
+        """Record a result (or an exception if `failed`)"""
+        slot = self.count % self.size
+        self._hit_index[slot] = hit_index
+        self._timestamp[slot] = time.monotonic()
+        self._failed[slot] = failed
+        self._result[slot] = result
+        self.count += 1
+
+    @property
+    def oldest(self) -> int:
+        """Sequence number of the oldest entry that is still available"""
+        return max(0, self.count - self.size)
+
+    def get(self, seq: int) -> HistoryEntry:
+        """Return the entry with the sequence number `seq`
+
+        Raises `HistoryOverrunError` if the entry was already overwritten.
+        """
+        if seq < self.oldest:
+            raise HistoryOverrunError(self.oldest - seq)
+        elif seq >= self.count:
+            raise IndexError(seq)
+        slot = seq % self.size
+        return HistoryEntry(
+            self._hit_index[slot],
+            self._timestamp[slot],
+            self._result[slot],
+            bool(self._failed[slot]),
+        )
+
+    def cursor(self) -> "HistoryCursor":
+        """Create a reader that sees the entries appended from now on"""
+        return HistoryCursor(self, self.count)
+
+
+class HistoryCursor:
+    """A reader position in a `ResultHistory`"""
+
+    history: ResultHistory
+    position: int  # Sequence number of the next entry to read
+
+    def __init__(self, history: ResultHistory, position: int):
+        self.history = history
+        self.position = position
+
+    def pending(self) -> int:
+        """Number of entries that are available to read"""
+        return self.history.count - max(self.position, self.history.oldest)
+
+    def read(self) -> typing.Optional[HistoryEntry]:
+        """Return the next entry or `None` if the reader has caught up
+
+        Raises `HistoryOverrunError` if the reader fell behind the window.
+        """
+        if self.position >= self.history.count:
+            return None
+        oldest = self.history.oldest
+        if self.position < oldest:
+            missed = oldest - self.position
+            self.position = oldest
+            raise HistoryOverrunError(missed)
+        entry = self.history.get(self.position)
+        self.position += 1
+        return entry
+
+
+class HistoryIterator(typing.Generic[T]):
+    """Iterates the timer results without missing any of them.
+
+    (As long as the reader keeps up with the history size)
+    """
+
+    timer: "async_timer.Timer[T]"
+    cursor: HistoryCursor
+
+    def __init__(self, timer: "async_timer.Timer[T]"):
+        self.timer = timer
+        self.cursor = timer.history.cursor()
+
+    def __aiter__(self) -> "HistoryIterator[T]":
+        return self
+
+    async def __anext__(self) -> T:
+        while True:
+            entry = self.cursor.read()
+            if entry is not None:
+                if entry.failed:
+                    raise entry.result
+                return entry.result
+            try:
+                await self.timer.join()
+            except asyncio.CancelledError as err:
+                if not self.cursor.pending():
+                    raise StopAsyncIteration() from err
+            except Exception:
+                # Delivered through the history
+                pass
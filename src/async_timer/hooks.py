@@ -0,0 +1,64 @@
+"""Timer lifecycle hooks for the profilers and tracers."""
+import typing
+
+import async_timer
+
+
+class TimerHooks:
+    """Callbacks around the timer lifecycle, override the ones you need.
+
+    The hooks are called synchronously from the timer task, keep them fast.
+        A timer without the hooks does not pay for them beyond an `is None` check.
+    """
+
+    def on_tick_scheduled(self, timer: "async_timer.Timer", deadline: float):
+        """The timer started waiting for the tick due at `deadline` (loop time)"""
+
+    def on_target_start(self, timer: "async_timer.Timer"):
+        """The target is about to be called"""
+
+    def on_target_end(
+        self, timer: "async_timer.Timer", result: typing.Any, failed: bool
+    ):
+        """The target call returned the `result` (or raised it if `failed`)"""
+
+    def on_publish(self, timer: "async_timer.Timer", result: typing.Any, failed: bool):
+        """The `result` was delivered to the waiters, history and subscriptions"""
+
+    def on_stop(self, timer: "async_timer.Timer"):
+        """The timer loop finished"""
+
+
+class ChainedHooks(TimerHooks):
+    """Hooks that pass every event on to the `inner` hooks (if there are any).
+
+    For the helpers that need the hooks of the timers they manage
+        without taking them away from the user.
+    """
+
+    inner: typing.Optional[TimerHooks]
+
+    def __init__(self, inner: typing.Optional[TimerHooks] = None):
+        self.inner = inner
+
+    def on_tick_scheduled(self, timer: "async_timer.Timer", deadline: float):
+        if self.inner is not None:
+            self.inner.on_tick_scheduled(timer, deadline)
+
+    def on_target_start(self, timer: "async_timer.Timer"):
+        if self.inner is not None:
+            self.inner.on_target_start(timer)
+
+    def on_target_end(
+        self, timer: "async_timer.Timer", result: typing.Any, failed: bool
+    ):
+        if self.inner is not None:
+            self.inner.on_target_end(timer, result, failed)
+
+    def on_publish(self, timer: "async_timer.Timer", result: typing.Any, failed: bool):
+        if self.inner is not None:
+            self.inner.on_publish(timer, result, failed)
+
+    def on_stop(self, timer: "async_timer.Timer"):
+        if self.inner is not None:
+            self.inner.on_stop(timer)
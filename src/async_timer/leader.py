@@ -0,0 +1,103 @@
+"""Host-wide leader election, so only one process runs a timer."""
+import logging
+import os
+import pathlib
+import re
+import tempfile
+import typing
+
+try:
+    import fcntl
+except ImportError:  # Not a POSIX system
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+def file_safe(name: str) -> str:
+    """Return the `name` with the characters unsafe in the file names replaced"""
+    return re.sub(r"[^\w.-]", "_", name)
+
+
+class FileLeaderLock:
+    """The leadership of a timer name, held through an advisory `fcntl.flock()`.
+
+    The lock file lives in the `directory` (the temporary one by default).
+        The operating system releases the lock when the leader process
+        dies, so a follower that keeps calling `try_acquire()` takes over.
+    """
+
+    name: str
+    path: pathlib.Path
+    is_leader: bool
+    _fd: typing.Optional[int]  # The lock file, open while trying or leading
+
+    def __init__(
+        self,
+        name: str,
+        directory: typing.Union[str, os.PathLike, None] = None,
+    ):
+        """Create the lock.
+
+        Parameters:
+            `name` - the timer name, the processes that share it share the lock
+            `directory` - the directory of the lock files (it has to be
+                            on a local file system for `flock()` to work)
+        """
+        if fcntl is None:
+            raise RuntimeError("The leader election needs fcntl.flock()")
+        if not name:
+            raise ValueError("The leader lock needs a name")
+        if directory is None:
+            directory = tempfile.gettempdir()
+        directory = pathlib.Path(directory)
+        if not directory.is_dir():
+            raise FileNotFoundError(f"No lock directory {str(directory)!r}")
+        self.name = name
+        self.path = directory / f"async-timer-{file_safe(name)}.lock"
+        self.is_leader = False
+        self._fd = None
+
+    def try_acquire(self) -> bool:
+        """Return `True` if this process is (or just became) the leader.
+
+        The lock file errors (e.g. a file of another user) are logged,
+            the process stays a follower.
+        """
+        if self.is_leader:
+            return True
+        try:
+            if self._fd is None:
+                self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            fcntl.flock(self._fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return False
+        except OSError as err:
+            logger.warning("Can not lock %s: %s", self.path, err)
+            self.release()
+            return False
+        self.is_leader = True
+        return True
+
+    def release(self):
+        """Give up the leadership (or stop trying)"""
+        (fd, self._fd) = (self._fd, None)
+        self.is_leader = False
+        if fd is not None:
+            # (Closing the file releases the lock)
+            os.close(fd)
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__} path={str(self.path)!r}"
+            f" is_leader={self.is_leader!r}>"
+        )
+
+
+def as_leader_lock(
+    leader: typing.Union[str, FileLeaderLock, None]
+) -> typing.Optional[FileLeaderLock]:
+    """Return the lock of the `leader` timer argument (a name or a lock)"""
+    if isinstance(leader, str):
+        return FileLeaderLock(leader)
+    return leader
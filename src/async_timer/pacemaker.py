@@ -1,7 +1,38 @@
 import asyncio
 import dataclasses
+import hashlib
+import math
+import random
+import time
 import typing
 
+import async_timer
+
+PacemakerModeT = typing.Literal["fixed_delay", "fixed_rate"]
+MissedTickPolicyT = typing.Literal["skip", "catch_up", "coalesce"]
+# A hashable key, or an explicit `(index, count)` slot
+SplayKeyT = typing.Union[str, bytes, int, typing.Tuple[int, int]]
+
+
+def _tick(fut: asyncio.Future):
+    if not fut.done():
+        fut.set_result(True)
+
+
+def splay_fraction(key: SplayKeyT) -> float:
+    """Map the `key` to a stable phase fraction in [0, 1)
+
+    An `(index, count)` tuple spreads `count` slots evenly,
+        any other key is hashed (the same in every process).
+    """
+    if isinstance(key, tuple):
+        (index, count) = key
+        return (index % count) / count
+    elif not isinstance(key, bytes):
+        key = str(key).encode()
+    digest = hashlib.blake2b(key, digest_size=8).digest()
+    return int.from_bytes(digest, "big") / 2**64
+
 
 @dataclasses.dataclass()
 class ConfigurationChanged:
@@ -11,61 +42,354 @@ class ConfigurationChanged:
 class TimerPacemaker:
     """A helper object that controls the timers' iterations."""
 
-    delay: float
-    _first_iter: bool = True
-    _running: bool = True
-    _cancel_futs: typing.List[asyncio.futures.Future]
-    _cancel_evt: asyncio.Event
+    __slots__ = (
+        "delay",
+        "schedule",
+        "mode",
+        "missed_tick_policy",
+        "initial_delay",
+        "jitter",
+        "jitter_ratio",
+        "splay_key",
+        "slack",
+        "backoff_factor",
+        "backoff_max",
+        "backoff_jitter",
+        "scheduler",
+        "deadline",
+        "missed_ticks",
+        "failures",
+        "on_tick_scheduled",
+        "_first_iter",
+        "_running",
+        "_cancel_futs",
+        "_cancel_event",
+        "_wait_fut",
+        "_woken",
+        "_anchor",
+        "_anchor_slot",
+        "_anchor_delay",
+        "_fire_at",
+        "_backoff_delay",
+    )
 
-    def __init__(self, delay: float):
+    delay: typing.Optional[float]
+    schedule: typing.Optional["async_timer.schedule.Schedule"]
+    mode: PacemakerModeT
+    missed_tick_policy: MissedTickPolicyT
+    initial_delay: float
+    jitter: float
+    jitter_ratio: float
+    splay_key: typing.Optional[SplayKeyT]
+    slack: float
+    backoff_factor: float
+    backoff_max: float
+    backoff_jitter: float
+    scheduler: typing.Optional["async_timer.scheduler.Scheduler"]
+    deadline: typing.Optional[float]  # Scheduled loop time of the last tick
+    missed_ticks: int  # Total number of skipped or coalesced ticks
+    failures: int  # Number of consecutive `back_off()` calls
+    # Called with the deadline (loop time) of every tick before waiting for it
+    on_tick_scheduled: typing.Optional[typing.Callable[[float], None]]
+    _first_iter: bool
+    _running: bool
+    _cancel_futs: typing.Optional[typing.List[asyncio.futures.Future]]
+    _cancel_event: typing.Optional[asyncio.Event]  # See `_cancel_evt`
+    _wait_fut: typing.Optional[asyncio.Future]
+    _woken: bool  # `wake()` was called while there was no wait to cut short
+    # Fixed rate deadlines are `_anchor + _anchor_slot * _anchor_delay`
+    _anchor: float
+    _anchor_slot: int
+    _anchor_delay: typing.Optional[float]
+    _fire_at: float  # `time.time()` of the last scheduled tick
+    _backoff_delay: typing.Optional[float]  # Replaces `delay` after failures
+
+    def __init__(
+        self,
+        delay: typing.Optional[float],
+        scheduler: typing.Optional["async_timer.scheduler.Scheduler"] = None,
+        mode: PacemakerModeT = "fixed_delay",
+        missed_tick_policy: MissedTickPolicyT = "skip",
+        initial_delay: float = 0.0,
+        jitter: float = 0.0,
+        jitter_ratio: float = 0.0,
+        splay_key: typing.Optional[SplayKeyT] = None,
+        schedule: typing.Optional["async_timer.schedule.Schedule"] = None,
+        slack: float = 0.0,
+        backoff_factor: float = 2.0,
+        backoff_max: float = 300.0,
+        backoff_jitter: float = 0.1,
+    ):
+        """Create the pacemaker.
+
+        Parameters:
+            `delay` - number of seconds between iterations
+                        (can be `None` if there is a `schedule`)
+            `scheduler` - an optional shared scheduler to park the waits on
+            `mode` - "fixed_delay" sleeps the `delay` after each iteration is done,
+                        "fixed_rate" ticks at the `delay` intervals from the start
+            `missed_tick_policy` - what "fixed_rate" does after an overrun:
+                        "skip" the missed ticks and wait for the next one,
+                        "catch_up" by firing them back-to-back, or
+                        "coalesce" them into a single immediate tick
+            `initial_delay` - number of seconds to wait before the first tick
+            `jitter` - add a random [0, jitter) seconds to every wait
+            `jitter_ratio` - add a random [0, jitter_ratio * delay) to every wait
+            `splay_key` - delay the first tick to a stable wall clock phase
+                        derived from the key (see `splay_fraction()`),
+                        so the timers sharing the `delay` fire spread out
+                        across the processes
+            `schedule` - tick at the times of this `async_timer.schedule.Schedule`
+                        (e.g. a `CronSchedule`) instead of every `delay`
+            `slack` - let the waits end up to this many seconds late, rounding
+                        the wake up times to the multiples of the `slack`
+                        (of the loop time), so the timers that are due
+                        within the same window wake up the loop only once
+            `backoff_factor` - multiply the wait by this after each `back_off()`
+            `backoff_max` - the longest backoff wait (unless the `delay` is longer)
+            `backoff_jitter` - add a random [0, backoff_jitter) fraction
+                        to every backoff wait
+        """
+        if mode not in typing.get_args(PacemakerModeT):
+            raise ValueError(f"Unexpected mode: {mode!r}")
+        if missed_tick_policy not in typing.get_args(MissedTickPolicyT):
+            raise ValueError(f"Unexpected missed tick policy: {missed_tick_policy!r}")
+        if delay is None and schedule is None:
+            raise ValueError("Either the delay or the schedule is required")
+        if schedule is not None and splay_key is not None:
+            raise ValueError("splay_key needs a fixed delay, use jitter instead")
+        if min(initial_delay, jitter, jitter_ratio, slack) < 0:
+            raise ValueError(
+                "initial_delay, jitter, jitter_ratio and slack can not be negative"
+            )
+        if backoff_factor < 1 or backoff_max < 0 or backoff_jitter < 0:
+            raise ValueError("Unexpected backoff parameters")
+        if isinstance(splay_key, tuple) and splay_key[1] < 1:
+            raise ValueError(f"Unexpected splay slot: {splay_key!r}")
         self.delay = delay
-        self._cancel_futs = []
-        self._cancel_evt = asyncio.Event()
+        self.scheduler = scheduler
+        self.mode = mode
+        self.missed_tick_policy = missed_tick_policy
+        self.initial_delay = initial_delay
+        self.jitter = jitter
+        self.jitter_ratio = jitter_ratio
+        self.splay_key = splay_key
+        self.schedule = schedule
+        self.slack = slack
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+        self.backoff_jitter = backoff_jitter
+        self.deadline = None
+        self.missed_ticks = 0
+        self.failures = 0
+        self.on_tick_scheduled = None
+        self._first_iter = True
+        self._running = True
+        self._cancel_futs = None
+        self._cancel_event = None
+        self._wait_fut = None
+        self._woken = False
+        self._anchor = 0.0
+        self._anchor_slot = 0
+        self._anchor_delay = None
+        self._fire_at = 0.0
+        self._backoff_delay = None
+
+    @property
+    def _cancel_evt(self) -> asyncio.Event:
+        """An event that is set once the pacemaker is stopped.
+
+        (Created on demand, `stop()` does not need it)
+        """
+        if self._cancel_event is None:
+            self._cancel_event = asyncio.Event()
+            if not self._running:
+                self._cancel_event.set()
+        return self._cancel_event
 
     def stop_on(self, aws: typing.Sequence[asyncio.Future]):
         for el in aws:
             fut = asyncio.ensure_future(el)
             fut.add_done_callback(lambda _fut: self.stop())
+            if self._cancel_futs is None:
+                self._cancel_futs = []
             self._cancel_futs.append(fut)
 
     def stop(self):
         """Stop the iterator."""
-        for fut in self._cancel_futs:
-            fut.cancel()
-        self._cancel_futs.clear()
-        self._cancel_evt.set()
+        if self._cancel_futs:
+            for fut in self._cancel_futs:
+                fut.cancel()
+        self._cancel_futs = None
+        if self._cancel_event is not None:
+            self._cancel_event.set()
         self._running = False
+        if self._wait_fut is None:
+            pass
+        elif self.scheduler is not None:
+            self.scheduler.cancel(self._wait_fut)
+        elif not self._wait_fut.done():
+            self._wait_fut.set_result(False)
+
+    def wake(self):
+        """Fire the pending tick right away (or the next one if there is none)"""
+        fut = self._wait_fut
+        if fut is None:
+            self._woken = True
+        elif self.scheduler is not None:
+            self.scheduler.fire(fut)
+        elif not fut.done():
+            fut.set_result(True)
+
+    def back_off(self):
+        """Grow the wait before the next tick (after a failure)"""
+        self.failures += 1
+        if self.delay is None:
+            # The schedule decides
+            return
+        cap = max(self.backoff_max, self.delay)
+        base = self.delay if self._backoff_delay is None else self._backoff_delay
+        self._backoff_delay = min(base * self.backoff_factor, cap)
+
+    def reset_backoff(self):
+        """Return to the normal `delay` (after a success)"""
+        if self.failures:
+            self.failures = 0
+            self._backoff_delay = None
+            # Restart the fixed rate grid instead of catching up the backoff
+            self._anchor_delay = None
 
     def __aiter__(self):
         """The core funtionality - return the iterator"""
         return self
 
-    async def __anext__(self):
-        # Do not sleep at the first iter
-        # (so the timer hits the target function at startup)
+    async def __anext__(self) -> int:
+        """Wait for the next tick.
+
+        Returns the number of ticks that were missed right before this one.
+        """
         if not self._running:
             raise StopAsyncIteration()
-        elif self._first_iter:
+        now = asyncio.get_running_loop().time()
+        missed = 0
+        delay = None
+        first_iter = self._first_iter
+        if self.schedule is not None:
             self._first_iter = False
+            deadline = now + self._next_scheduled_delay(first_iter) + self._jitter()
+        elif first_iter:
+            self._first_iter = False
+            # Unless asked otherwise, do not sleep at the first iter
+            # (so the timer hits the target function at startup)
+            deadline = now + self._first_delay()
+        elif self._backoff_delay is not None:
+            deadline = now + self._backoff_delay * (
+                1 + random.uniform(0, self.backoff_jitter)
+            )
+        elif self.mode == "fixed_rate":
+            (deadline, missed) = self._next_fixed_rate_deadline(now)
+            deadline += self._jitter()
         else:
+            delay = self.delay + self._jitter()
+            # The delay runs from the end of the iteration, let the callbacks
+            #   it made ready (e.g. the waiters of the result) run first, so
+            #   the `async for` consumers that sleep a bit between the results
+            #   are back before a short wait is over
+            await asyncio.sleep(0)
+            now = asyncio.get_running_loop().time()
+            deadline = now + delay
+        if self.on_tick_scheduled is not None:
+            self.on_tick_scheduled(deadline)
+        if delay is None:
+            delay = deadline - now
+        if delay > 0 or not first_iter:
             try:
-                await self._try_wait(self.delay)
+                await self._try_wait(delay, deadline)
             except StopAsyncIteration:
                 self.stop()
                 raise
-        return None
+        # The tick answers the `wake()` calls so far (even if it did not wait)
+        self._woken = False
+        self.deadline = deadline
+        self.missed_ticks += missed
+        return missed
+
+    def _next_scheduled_delay(self, first_iter: bool) -> float:
+        """Return the number of seconds till the next `schedule` fire time"""
+        wall_now = time.time()
+        if first_iter:
+            after = wall_now + self.initial_delay
+        else:
+            # Never fire twice for the same time even if the loop clock
+            #   woke us up a bit ahead of the wall clock
+            after = max(wall_now, self._fire_at)
+        self._fire_at = self.schedule.next_fire(after)
+        return self._fire_at - wall_now
 
-    async def _try_wait(self, delay: float):
-        """Try waiting for the `delay`.
+    def _first_delay(self) -> float:
+        """Return the number of seconds to wait before the first tick"""
+        delay = self.initial_delay + self._jitter()
+        if self.splay_key is not None and self.delay > 0:
+            phase = splay_fraction(self.splay_key) * self.delay
+            delay += (phase - time.time() - delay) % self.delay
+        return delay
+
+    def _jitter(self) -> float:
+        """Return a random extra delay for the next wait"""
+        if not (self.jitter or self.jitter_ratio):
+            return 0.0
+        return random.uniform(0, self.jitter + self.jitter_ratio * (self.delay or 0))
+
+    def _next_fixed_rate_deadline(self, now: float) -> typing.Tuple[float, int]:
+        """Return the deadline of the next fixed rate tick and the missed tick count"""
+        if self._anchor_delay != self.delay:
+            # (Re)start the grid from the last tick
+            self._anchor = self.deadline
+            self._anchor_slot = 0
+            self._anchor_delay = self.delay
+        self._anchor_slot += 1
+        deadline = self._anchor + self._anchor_slot * self.delay
+        if deadline >= now or self.delay <= 0 or self.missed_tick_policy == "catch_up":
+            return (deadline, 0)
+        # Number of the grid ticks that are already in the past
+        passed = math.ceil((now - deadline) / self.delay)
+        if self.missed_tick_policy == "skip":
+            self._anchor_slot += passed
+            missed = passed
+        else:
+            # "coalesce" - fire right away for the most recent grid tick
+            self._anchor_slot += passed - 1
+            missed = passed - 1
+        return (self._anchor + self._anchor_slot * self.delay, missed)
+
+    async def _try_wait(self, delay: float, deadline: float):
+        """Try waiting for the `delay` (till the `deadline` loop time).
 
         Raises `StopAsyncIteration` if the sleep was cancelled
         """
+        if not self._running or (
+            self._cancel_event is not None and self._cancel_event.is_set()
+        ):
+            raise StopAsyncIteration()
+        if self._woken:
+            self._woken = False
+            return
+        loop = asyncio.get_running_loop()
+        if self.slack:
+            # The same boundary for all timers due within the `slack` window
+            deadline = math.ceil(deadline / self.slack) * self.slack
+        if self.scheduler is not None:
+            handle = None
+            self._wait_fut = self.scheduler.schedule_at(deadline)
+        else:
+            self._wait_fut = loop.create_future()
+            handle = loop.call_at(deadline, _tick, self._wait_fut)
         try:
-            await asyncio.wait_for(self._cancel_evt.wait(), timeout=delay)
-        except asyncio.TimeoutError:
-            # Sleep succeeded
-            return None
-        # the cancel event was triggered if no timout was raised
-        assert self._cancel_evt.is_set()
-        # So, raise StopIteration
-        raise StopAsyncIteration()
+            # Resolves to `True` on the deadline or to `False` by `stop()`
+            ticked = await self._wait_fut
+        finally:
+            self._wait_fut = None
+            if handle is not None:
+                handle.cancel()
+        if not ticked:
+            raise StopAsyncIteration()
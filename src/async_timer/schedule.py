@@ -0,0 +1,193 @@
+"""Calendar schedules for the pacemaker."""
+import abc
+import calendar
+import datetime
+import typing
+
+# (name, min, max, value names)
+_FIELDS = (
+    ("minute", 0, 59, ()),
+    ("hour", 0, 23, ()),
+    ("day of month", 1, 31, ()),
+    (
+        "month",
+        1,
+        12,
+        ("jan", "feb", "mar", "apr", "may", "jun")
+        + ("jul", "aug", "sep", "oct", "nov", "dec"),
+    ),
+    ("day of week", 0, 7, ("sun", "mon", "tue", "wed", "thu", "fri", "sat")),
+)
+_MACROS = {
+    "@yearly": "0 0 1 1 *",
+    "@annually": "0 0 1 1 *",
+    "@monthly": "0 0 1 * *",
+    "@weekly": "0 0 * * 0",
+    "@daily": "0 0 * * *",
+    "@midnight": "0 0 * * *",
+    "@hourly": "0 * * * *",
+}
+# Give up looking for the next fire time after this many years
+_MAX_YEARS = 400
+
+
+def _next_bit(mask: int, start: int) -> typing.Optional[int]:
+    """Return the lowest set bit of the `mask` that is >= `start`"""
+    mask >>= start
+    if not mask:
+        return None
+    return start + (mask & -mask).bit_length() - 1
+
+
+class Schedule(abc.ABC):
+    """The interface of the pacemaker schedules."""
+
+    @abc.abstractmethod
+    def next_fire(self, after: float) -> float:
+        """Return the first fire time (a `time.time()` timestamp) after `after`"""
+
+
+class CronSchedule(Schedule):
+    """A schedule defined by a cron expression.
+
+    Supports the standard five fields ("minute hour day-of-month month day-of-week")
+        with the `*`, `,`, `-` and `/` syntax, the month and day of week names
+        and the `@hourly`, `@daily`, `@weekly`, `@monthly`, `@yearly` macros.
+        As in cron, a day matches either of the day fields if both are restricted.
+
+    Every field is compiled into a bitmap, so the next fire time is found
+        with a few bit operations per field rather than by scanning the calendar.
+    """
+
+    expr: str
+    tz: datetime.tzinfo
+    _minutes: int
+    _hours: int
+    _days: int
+    _months: int
+    _weekdays: int  # Bit 0 is Sunday
+    _any_day: bool  # The day of month field is "*"
+    _any_weekday: bool  # The day of week field is "*"
+
+    def __init__(self, expr: str, tz: datetime.tzinfo = datetime.timezone.utc):
+        """Compile the cron expression.
+
+        Parameters:
+            `expr` - the cron expression (e.g. "*/15 * * * *")
+            `tz` - the time zone the expression is evaluated in
+        """
+        fields = _MACROS.get(expr.strip().lower(), expr).split()
+        if len(fields) != len(_FIELDS):
+            raise ValueError(f"Expected {len(_FIELDS)} cron fields, got {expr!r}")
+        self.expr = expr
+        self.tz = tz
+        (
+            self._minutes,
+            self._hours,
+            self._days,
+            self._months,
+            weekdays,
+        ) = (_parse_field(text, *spec) for (text, spec) in zip(fields, _FIELDS))
+        # 7 is an alias of Sunday
+        self._weekdays = (weekdays | (weekdays >> 7)) & 0x7F
+        self._any_day = fields[2].startswith("*")
+        self._any_weekday = fields[4].startswith("*")
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {self.expr!r}>"
+
+    def next_fire(self, after: float) -> float:
+        # The cron resolution is one minute
+        start = datetime.datetime.fromtimestamp(after, self.tz).replace(
+            tzinfo=None, second=0, microsecond=0
+        ) + datetime.timedelta(minutes=1)
+        when = start
+        while when.year - start.year <= _MAX_YEARS:
+            aligned = self._align(when)
+            if aligned == when:
+                out = when.replace(tzinfo=self.tz).timestamp()
+                if out > after:
+                    return out
+                # The wall clock went backwards (DST), look further
+                aligned = when + datetime.timedelta(minutes=1)
+            when = aligned
+        raise ValueError(f"{self!r} does not fire after {after!r}")
+
+    def _align(self, when: datetime.datetime) -> datetime.datetime:
+        """Return `when` if it matches, the earliest time that might match otherwise"""
+        month = _next_bit(self._months, when.month)
+        if month is None:
+            return datetime.datetime(when.year + 1, 1, 1)
+        elif month != when.month:
+            return datetime.datetime(when.year, month, 1)
+        day = _next_bit(self._day_mask(when.year, when.month), when.day)
+        if day is None:
+            return datetime.datetime(when.year, when.month, 1) + datetime.timedelta(
+                days=calendar.monthrange(when.year, when.month)[1]
+            )
+        elif day != when.day:
+            return datetime.datetime(when.year, when.month, day)
+        hour = _next_bit(self._hours, when.hour)
+        if hour is None:
+            return datetime.datetime(
+                when.year, when.month, when.day
+            ) + datetime.timedelta(days=1)
+        elif hour != when.hour:
+            return when.replace(hour=hour, minute=0)
+        minute = _next_bit(self._minutes, when.minute)
+        if minute is None:
+            return when.replace(minute=0) + datetime.timedelta(hours=1)
+        return when.replace(minute=minute)
+
+    def _day_mask(self, year: int, month: int) -> int:
+        """Return the bitmap of the matching days of the month (bit 1 is the 1st)"""
+        (first_weekday, n_days) = calendar.monthrange(year, month)
+        valid = ((1 << n_days) - 1) << 1
+        if self._any_day and self._any_weekday:
+            return valid
+        # Rotate the weekday bitmap so bit 0 is the 1st of the month
+        shift = (first_weekday + 1) % 7  # Monday is 0 in `calendar`, Sunday in cron
+        week = ((self._weekdays >> shift) | (self._weekdays << (7 - shift))) & 0x7F
+        weekdays = (
+            week | (week << 7) | (week << 14) | (week << 21) | (week << 28)
+        ) << 1
+        if self._any_weekday:
+            out = self._days
+        elif self._any_day:
+            out = weekdays
+        else:
+            out = self._days | weekdays
+        return out & valid
+
+
+def _parse_field(
+    text: str, name: str, low: int, high: int, names: typing.Sequence[str]
+) -> int:
+    """Compile a cron field into a bitmap"""
+    out = 0
+    for part in text.lower().split(","):
+        (span, _, step_text) = part.partition("/")
+        try:
+            step = int(step_text) if step_text else 1
+            if span == "*":
+                (start, stop) = (low, high)
+            else:
+                (start_text, _, stop_text) = span.partition("-")
+                start = _parse_value(start_text, low, names)
+                if stop_text:
+                    stop = _parse_value(stop_text, low, names)
+                else:
+                    stop = high if step_text else start
+        except ValueError:
+            raise ValueError(f"Unexpected {name} field: {text!r}") from None
+        if not (low <= start <= stop <= high) or step < 1:
+            raise ValueError(f"Unexpected {name} field: {text!r}")
+        for value in range(start, stop + 1, step):
+            out |= 1 << value
+    return out
+
+
+def _parse_value(text: str, low: int, names: typing.Sequence[str]) -> int:
+    if text in names:
+        return names.index(text) + low
+    return int(text)
@@ -0,0 +1,114 @@
+"""A shared deadline scheduler for large timer populations."""
+import asyncio
+import heapq
+import itertools
+import time
+import typing
+
+# `loop.call_at()` handles can fire up to one clock tick early
+_CLOCK_RESOLUTION = time.get_clock_info("monotonic").resolution
+
+
+def _set_done(fut: asyncio.Future):
+    if not fut.done():
+        fut.set_result(None)
+
+
+class Scheduler:
+    """Wakes up many pacemakers from a single driver task.
+
+    Pacemakers registered with a scheduler do not arm their own timeouts,
+        they park on a future from `schedule_at()` instead.
+        The driver task sleeps until the earliest deadline is due and
+        then resolves every due future in one batch.
+    """
+
+    _heap: typing.List[typing.Tuple[float, int, asyncio.Future]]
+    _seq: typing.Iterator[int]
+    _stale: int  # (Approximate) number of cancelled entries in the `_heap`
+    _loop: typing.Optional[asyncio.AbstractEventLoop] = None
+    _driver: typing.Optional[asyncio.Task] = None
+    _wakeup: typing.Optional[asyncio.Future] = None
+
+    def __init__(self):
+        self._heap = []
+        self._seq = itertools.count()
+        self._stale = 0
+
+    def __len__(self) -> int:
+        """Return the number of pending deadlines"""
+        return sum(1 for el in self._heap if not el[2].done())
+
+    def schedule_at(self, deadline: float) -> asyncio.Future:
+        """Return a future that resolves to `True` once `deadline` (loop time) is due"""
+        loop = self._get_loop()
+        fut = loop.create_future()
+        heapq.heappush(self._heap, (deadline, next(self._seq), fut))
+        if self._driver is None or self._driver.done():
+            self._driver = loop.create_task(self._drive())
+        elif self._heap[0][2] is fut and self._wakeup is not None:
+            # The new deadline is earlier than the one the driver sleeps for
+            _set_done(self._wakeup)
+        return fut
+
+    def cancel(self, fut: asyncio.Future):
+        """Resolve a scheduled future with `False` ahead of its deadline"""
+        self._resolve_early(fut, False)
+
+    def fire(self, fut: asyncio.Future):
+        """Resolve a scheduled future with `True` ahead of its deadline"""
+        self._resolve_early(fut, True)
+
+    def _resolve_early(self, fut: asyncio.Future, result: bool):
+        if not fut.done():
+            fut.set_result(result)
+        elif not fut.cancelled():
+            # Already dispatched
+            return
+        self._stale += 1
+        if self._stale >= len(self._heap) or (
+            self._stale > 64 and self._stale * 2 > len(self._heap)
+        ):
+            self._compact()
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        loop = asyncio.get_running_loop()
+        if self._loop is None:
+            self._loop = loop
+        elif self._loop is not loop:
+            raise RuntimeError("The scheduler is bound to a different event loop")
+        return loop
+
+    def _compact(self):
+        """Drop the cancelled entries from the heap"""
+        self._heap = [el for el in self._heap if not el[2].done()]
+        heapq.heapify(self._heap)
+        self._stale = 0
+        if self._wakeup is not None:
+            # The deadline the driver sleeps for might be gone
+            _set_done(self._wakeup)
+
+    def _dispatch(self, now: float):
+        """Resolve all futures that are due at `now`"""
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            fut = heapq.heappop(heap)[2]
+            if fut.done():
+                self._stale = max(0, self._stale - 1)
+            else:
+                fut.set_result(True)
+
+    async def _drive(self):
+        loop = self._loop
+        while self._heap:
+            deadline = self._heap[0][0]
+            if deadline > loop.time() + _CLOCK_RESOLUTION:
+                self._wakeup = loop.create_future()
+                handle = loop.call_at(deadline, _set_done, self._wakeup)
+                try:
+                    await self._wakeup
+                finally:
+                    handle.cancel()
+                    self._wakeup = None
+            else:
+                self._dispatch(loop.time() + _CLOCK_RESOLUTION)
@@ -0,0 +1,258 @@
+"""Share the timer results with the other processes through a memory mapped file."""
+import asyncio
+import logging
+import mmap
+import os
+import pathlib
+import pickle
+import struct
+import tempfile
+import time
+import typing
+
+import async_timer
+import async_timer.hooks  # (Subclassed at the import time)
+import async_timer.leader
+import async_timer.timer
+
+logger = logging.getLogger(__name__)
+
+# The segment header: the seqlock sequence (odd while a write is in progress),
+#   the payload length (0 - no value) and `time.monotonic()` of the publication
+_HEADER = struct.Struct("<QQd")
+_SEQ = struct.Struct("<Q")
+_NO_RESULT = async_timer.timer.TimerSnapshot(None, None, None, None)
+# Give up on reading a segment that is being written for this long
+_MAX_READ_RETRIES = 1000
+
+
+def _default_directory() -> pathlib.Path:
+    shm = pathlib.Path("/dev/shm")
+    return shm if shm.is_dir() else pathlib.Path(tempfile.gettempdir())
+
+
+def segment_path(
+    name: str, directory: typing.Union[str, os.PathLike, None] = None
+) -> pathlib.Path:
+    """Return the path of the `name` segment (in `/dev/shm` if there is one)"""
+    if directory is None:
+        directory = _default_directory()
+    file_name = f"async-timer-{async_timer.leader.file_safe(name)}.shm"
+    return pathlib.Path(directory) / file_name
+
+
+def _check_owner(fd: int, path: pathlib.Path):
+    """The results are unpickled, only trust the segments nobody else can write"""
+    stat = os.fstat(fd)
+    if stat.st_uid != os.getuid() or stat.st_mode & 0o022:
+        raise PermissionError(f"{path} is writable by other users")
+
+
+class SharedResultPublisher(async_timer.hooks.ChainedHooks):
+    """Timer hooks that publish every result into a shared memory segment.
+
+    Pass it as the `hooks` of the timer (of the `leader` one usually),
+        the `SharedResultReader`s of the same `name` in the other processes
+        read the results. The failures are not shared, the readers keep
+        the last successful result.
+    The segment is a seqlock: the sequence number is odd while a result
+        is being written, the readers retry if it changed while they read.
+    """
+
+    name: str
+    path: pathlib.Path
+    size: int  # The largest (pickled) result size
+    generation: int  # Number of the results published into the segment so far
+    _mmap: mmap.mmap
+    _seq: int
+
+    def __init__(
+        self,
+        name: str,
+        size: int = 1 << 20,
+        directory: typing.Union[str, os.PathLike, None] = None,
+        inner: typing.Optional["async_timer.hooks.TimerHooks"] = None,
+    ):
+        """Create (or reopen) the segment.
+
+        Parameters:
+            `name` - the name the readers find the segment by
+            `size` - the largest pickled result (in bytes)
+            `directory` - the directory of the segment files
+                            (`/dev/shm` or the temporary one by default)
+            `inner` - the other timer hooks to call
+        """
+        super().__init__(inner)
+        if size <= 0:
+            raise ValueError(f"The size must be positive: {size!r}")
+        self.name = name
+        self.path = segment_path(name, directory)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            _check_owner(fd, self.path)
+            if os.fstat(fd).st_size < _HEADER.size + size:
+                os.ftruncate(fd, _HEADER.size + size)
+            self._mmap = mmap.mmap(fd, 0)
+        finally:
+            os.close(fd)
+        self.size = len(self._mmap) - _HEADER.size
+        # (Carry on the sequence of the previous publisher)
+        (self._seq, _, _) = _HEADER.unpack_from(self._mmap)
+        if self._seq % 2:
+            # The previous publisher died while writing, drop the torn value
+            self._seq += 1
+            _HEADER.pack_into(self._mmap, 0, self._seq, 0, 0.0)
+        self.generation = self._seq // 2
+
+    def publish(self, value: typing.Any):
+        """Write the `value` into the segment.
+
+        Raises `ValueError` if the pickled value does not fit.
+        """
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(payload) > self.size:
+            raise ValueError(
+                f"The result is {len(payload)} bytes, the segment fits {self.size}"
+            )
+        _SEQ.pack_into(self._mmap, 0, self._seq + 1)
+        self._mmap[_HEADER.size : _HEADER.size + len(payload)] = payload
+        _HEADER.pack_into(self._mmap, 0, self._seq + 2, len(payload), time.monotonic())
+        self._seq += 2
+        self.generation += 1
+
+    def on_publish(self, timer, result, failed):
+        if not failed:
+            try:
+                self.publish(result)
+            except Exception:
+                logger.exception("Failed to share the result of %r", timer)
+        super().on_publish(timer, result, failed)
+
+    def close(self):
+        """Unmap the segment (the file stays for the readers)"""
+        self._mmap.close()
+
+    def unlink(self):
+        """Remove the segment file"""
+        self.path.unlink()
+
+
+class SharedResultReader:
+    """Reads the results a `SharedResultPublisher` of another process publishes.
+
+    Mirrors the read side of the `Timer`: `last_result`, `snapshot()`
+        and `join()`. A result is unpickled once per generation.
+    """
+
+    name: str
+    path: pathlib.Path
+    poll_interval: float  # Seconds between the `join()` checks
+    _mmap: typing.Optional[mmap.mmap]  # Mapped once the segment exists
+    _seq: int  # The sequence of the cached value
+    _cached: "async_timer.timer.TimerSnapshot"
+
+    def __init__(
+        self,
+        name: str,
+        directory: typing.Union[str, os.PathLike, None] = None,
+        poll_interval: float = 0.01,
+    ):
+        """Create the reader (the segment does not have to exist yet).
+
+        Parameters:
+            `name` - the name of the `SharedResultPublisher`
+            `directory` - the directory of the segment files
+            `poll_interval` - number of seconds `join()` sleeps between the checks
+        """
+        if poll_interval <= 0:
+            raise ValueError(f"poll_interval must be positive: {poll_interval!r}")
+        self.name = name
+        self.path = segment_path(name, directory)
+        self.poll_interval = poll_interval
+        self._mmap = None
+        self._seq = 0
+        self._cached = _NO_RESULT
+
+    @property
+    def generation(self) -> int:
+        """Number of the results published so far (0 if there were none)"""
+        mapped = self._map()
+        if mapped is None:
+            return 0
+        return _SEQ.unpack_from(mapped)[0] // 2
+
+    @property
+    def last_result(self) -> typing.Any:
+        """The last published result (`None` if there is none yet)"""
+        return self.snapshot().last_result
+
+    @property
+    def last_hit_monotonic(self) -> typing.Optional[float]:
+        """`time.monotonic()` of the last publication (the clock is host-wide)"""
+        return self.snapshot().last_hit_monotonic
+
+    def snapshot(self) -> "async_timer.TimerSnapshot":
+        """Return the last published result as a `TimerSnapshot`"""
+        mapped = self._map()
+        if mapped is not None and _SEQ.unpack_from(mapped)[0] != self._seq:
+            self._refresh(mapped)
+        return self._cached
+
+    async def join(self, timeout: typing.Optional[float] = None) -> typing.Any:
+        """Wait for the next published result (and return it)"""
+        return await asyncio.wait_for(self._next(), timeout)
+
+    async def _next(self) -> typing.Any:
+        generation = self.generation
+        while self.generation == generation:
+            await asyncio.sleep(self.poll_interval)
+        return self.last_result
+
+    def _map(self) -> typing.Optional[mmap.mmap]:
+        if self._mmap is None:
+            try:
+                fd = os.open(self.path, os.O_RDONLY)
+            except FileNotFoundError:
+                return None
+            try:
+                _check_owner(fd, self.path)
+                if os.fstat(fd).st_size < _HEADER.size:
+                    # The publisher is still creating it
+                    return None
+                self._mmap = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+            finally:
+                os.close(fd)
+        return self._mmap
+
+    def _refresh(self, mapped: mmap.mmap):
+        """Read and unpickle a consistent copy of the segment"""
+        for _ in range(_MAX_READ_RETRIES):
+            (seq, length, published_at) = _HEADER.unpack_from(mapped)
+            if seq % 2:
+                # Being written
+                continue
+            if _HEADER.size + length > len(mapped):
+                # The publisher has grown the segment
+                self.close()
+                mapped = self._map()
+                if mapped is None:
+                    return
+                continue
+            payload = mapped[_HEADER.size : _HEADER.size + length]
+            if _SEQ.unpack_from(mapped)[0] == seq:
+                break
+        else:
+            # The publisher is stuck in the middle of a write, keep the old value
+            return
+        self._seq = seq
+        if not length:
+            self._cached = _NO_RESULT
+            return
+        self._cached = async_timer.timer.TimerSnapshot(
+            pickle.loads(payload), None, published_at, None
+        )
+
+    def close(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
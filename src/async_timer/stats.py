@@ -0,0 +1,173 @@
+"""Low overhead timer metrics."""
+import array
+import math
+import typing
+import weakref
+
+# Histogram values are seconds, the smallest bucket is `_RESOLUTION` wide
+_RESOLUTION = 1e-6
+_SUB_BUCKETS = 8  # Linear sub-buckets per power of two
+_MAX_EXPONENT = 42  # 2**42 microseconds (~50 days) and longer overflow
+_OVERFLOW = 1 + _MAX_EXPONENT * _SUB_BUCKETS  # The last bucket, past all the others
+_N_BUCKETS = _OVERFLOW + 1
+
+# All `TimerStats` alive, for the `aggregate()`
+_registry: "weakref.WeakSet[TimerStats]" = weakref.WeakSet()
+
+
+def _bucket_index(value: float) -> int:
+    scaled = value / _RESOLUTION
+    if scaled < 1:
+        return 0
+    (mantissa, exponent) = math.frexp(scaled)  # `mantissa` is in [0.5, 1)
+    if exponent > _MAX_EXPONENT:
+        return _OVERFLOW
+    return 1 + (exponent - 1) * _SUB_BUCKETS + int((mantissa - 0.5) * 2 * _SUB_BUCKETS)
+
+
+def _bucket_upper_bound(index: int) -> float:
+    if index == 0:
+        return _RESOLUTION
+    elif index == _OVERFLOW:
+        return math.inf
+    (exponent, sub) = divmod(index - 1, _SUB_BUCKETS)
+    return (0.5 + (sub + 1) / (2 * _SUB_BUCKETS)) * 2 ** (exponent + 1) * _RESOLUTION
+
+
+class Histogram:
+    """A streaming histogram with log-linear buckets.
+
+    Every power of two (of microseconds) is split into 8 linear buckets,
+        so the quantiles are within ~6% of the recorded values.
+    """
+
+    count: int
+    total: float
+    minimum: float
+    maximum: float
+    _buckets: "array.array[int]"
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+        self._buckets = array.array("q", bytes(8 * _N_BUCKETS))
+
+    def record(self, value: float):
+        """Add a value (in seconds)"""
+        self.count += 1
+        self.total += value
+        if value < self.minimum:
+            self.minimum = value
+        if value > self.maximum:
+            self.maximum = value
+        self._buckets[_bucket_index(value)] += 1
+
+    def merge(self, other: "Histogram"):
+        """Add all values of the `other` histogram to this one"""
+        self.count += other.count
+        self.total += other.total
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        for idx, count in enumerate(other._buckets):
+            if count:
+                self._buckets[idx] += count
+
+    def quantile(self, q: float) -> typing.Optional[float]:
+        """Return the (bucket midpoint) estimate of the `q`-quantile"""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for idx, count in enumerate(self._buckets):
+            seen += count
+            if count and seen >= rank:
+                return self._estimate(idx)
+        return self.maximum
+
+    def _estimate(self, idx: int) -> float:
+        """Return the midpoint of the bucket (clamped by the recorded values)"""
+        if idx == _OVERFLOW:
+            return self.maximum
+        lower = _bucket_upper_bound(idx - 1) if idx else 0.0
+        estimate = (lower + _bucket_upper_bound(idx)) / 2
+        return min(max(estimate, self.minimum), self.maximum)
+
+    def buckets(self) -> typing.Iterator[typing.Tuple[float, int]]:
+        """Yield the `(upper bound, count)` of the non-empty buckets"""
+        for idx, count in enumerate(self._buckets):
+            if count:
+                yield (_bucket_upper_bound(idx), count)
+
+    def as_dict(self) -> dict:
+        """Return a summary of the histogram"""
+        if not self.count:
+            return {"count": 0}
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "mean": self.total / self.count,
+            "min": self.minimum,
+            "max": self.maximum,
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+        }
+
+
+class TimerStats:
+    """The metrics of a single timer (or an `aggregate()` of all timers)"""
+
+    ticks: int  # Pacemaker ticks
+    errors: int  # Failed target calls (including the timeouts)
+    timeouts: int  # Target calls that ran longer than the `target_timeout`
+    skips: int  # Ticks that were skipped (missed or due to the overrun policy)
+    overruns: int  # Ticks that found `max_concurrency` calls running
+    lateness: Histogram  # Seconds between the scheduled and the actual tick
+    duration: Histogram  # Seconds the target calls took
+    fanout_latency: Histogram  # Seconds between a publication and a waiter wake up
+
+    def __init__(self, register: bool = True):
+        self.ticks = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.skips = 0
+        self.overruns = 0
+        self.lateness = Histogram()
+        self.duration = Histogram()
+        self.fanout_latency = Histogram()
+        if register:
+            _registry.add(self)
+
+    def merge(self, other: "TimerStats"):
+        """Add the `other` stats to these ones"""
+        self.ticks += other.ticks
+        self.errors += other.errors
+        self.timeouts += other.timeouts
+        self.skips += other.skips
+        self.overruns += other.overruns
+        self.lateness.merge(other.lateness)
+        self.duration.merge(other.duration)
+        self.fanout_latency.merge(other.fanout_latency)
+
+    def as_dict(self) -> dict:
+        """Return the stats as plain data (for the metrics exporters)"""
+        return {
+            "ticks": self.ticks,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "skips": self.skips,
+            "overruns": self.overruns,
+            "lateness": self.lateness.as_dict(),
+            "duration": self.duration.as_dict(),
+            "fanout_latency": self.fanout_latency.as_dict(),
+        }
+
+
+def aggregate() -> TimerStats:
+    """Return the sum of the stats of all timers that are still alive"""
+    out = TimerStats(register=False)
+    for stats in list(_registry):
+        out.merge(stats)
+    return out
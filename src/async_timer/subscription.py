@@ -0,0 +1,119 @@
+"""Bounded per-subscriber buffers of the timer results."""
+import asyncio
+import collections
+import time
+import typing
+
+import async_timer
+
+T = typing.TypeVar("T")
+SubscriptionPolicyT = typing.Literal[
+    "drop_oldest", "drop_newest", "block_producer", "latest_only"
+]
+
+
+class Subscription(typing.Generic[T]):
+    """An async iterator over the results published after it was created.
+
+    Every subscription has its own bounded buffer, the `policy` decides
+        what happens when the consumer falls behind and the buffer is full:
+            "drop_oldest" - discard the oldest buffered result
+            "drop_newest" - discard the result being published
+            "block_producer" - pause the timer until the consumer catches up
+            "latest_only" - keep just the freshest result (`maxsize` is 1)
+    """
+
+    maxsize: int
+    policy: SubscriptionPolicyT
+    dropped: int  # Number of results discarded due to the buffer being full
+    closed: bool
+    latency: typing.Optional[
+        "async_timer.stats.Histogram"
+    ]  # Seconds between a `put()` and the consumer getting the result
+    _buffer: typing.Deque[
+        typing.Tuple[bool, typing.Any, float]
+    ]  # (failed, result, monotonic time of the `put()`)
+    _item_waiter: typing.Optional[asyncio.Future] = None
+    _space_waiter: typing.Optional[asyncio.Future] = None
+
+    def __init__(
+        self,
+        maxsize: int = 1,
+        policy: SubscriptionPolicyT = "drop_oldest",
+        latency: typing.Optional["async_timer.stats.Histogram"] = None,
+    ):
+        if policy not in typing.get_args(SubscriptionPolicyT):
+            raise ValueError(f"Unexpected subscription policy: {policy!r}")
+        if policy == "latest_only":
+            maxsize = 1
+        if maxsize < 1:
+            raise ValueError(f"Subscription size must be positive, got {maxsize!r}")
+        self.maxsize = maxsize
+        self.policy = policy
+        self.dropped = 0
+        self.closed = False
+        self.latency = latency
+        self._buffer = collections.deque()
+
+    def __len__(self) -> int:
+        """Number of results waiting to be consumed"""
+        return len(self._buffer)
+
+    def __aiter__(self) -> "Subscription[T]":
+        return self
+
+    async def __anext__(self) -> T:
+        while not self._buffer:
+            if self.closed:
+                raise StopAsyncIteration()
+            self._item_waiter = asyncio.get_running_loop().create_future()
+            try:
+                await self._item_waiter
+            finally:
+                self._item_waiter = None
+        (failed, result, put_at) = self._buffer.popleft()
+        _wake(self._space_waiter)
+        if self.latency is not None:
+            self.latency.record(time.monotonic() - put_at)
+        if failed:
+            raise result
+        return result
+
+    async def put(self, result: typing.Any, failed: bool = False):
+        """Buffer a result (or an exception if `failed`)"""
+        if self.closed:
+            return
+        elif len(self._buffer) < self.maxsize:
+            pass
+        elif self.policy == "drop_newest":
+            self.dropped += 1
+            return
+        elif self.policy == "block_producer":
+            while len(self._buffer) >= self.maxsize and not self.closed:
+                self._space_waiter = asyncio.get_running_loop().create_future()
+                try:
+                    await self._space_waiter
+                finally:
+                    self._space_waiter = None
+            if self.closed:
+                return
+        else:
+            self._buffer.popleft()
+            self.dropped += 1
+        put_at = time.monotonic() if self.latency is not None else 0.0
+        self._buffer.append((failed, result, put_at))
+        _wake(self._item_waiter)
+
+    def close(self):
+        """Stop receiving the results.
+
+        The results that are already buffered can still be consumed.
+        """
+        self.closed = True
+        _wake(self._item_waiter)
+        _wake(self._space_waiter)
+
+
+def _wake(fut: typing.Optional[asyncio.Future]):
+    if fut is not None and not fut.done():
+        fut.set_result(None)
@@ -0,0 +1,184 @@
+"""Timers for the sync applications (running on a background event loop thread)."""
+import asyncio
+import concurrent.futures
+import threading
+import typing
+
+import async_timer
+
+T = typing.TypeVar("T")
+
+
+class BackgroundLoop:
+    """An event loop running in a daemon thread, shared by many `ThreadedTimer`s.
+
+    The thread starts with the first timer.
+    """
+
+    _loop: typing.Optional[asyncio.AbstractEventLoop]
+    _thread: typing.Optional[threading.Thread]
+    _lock: threading.Lock
+
+    def __init__(self):
+        self._loop = None
+        self._thread = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The event loop (started on demand)"""
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    name="async-timer-loop",
+                    daemon=True,
+                )
+                self._thread.start()
+            return self._loop
+
+    def run(
+        self,
+        coro: typing.Coroutine[typing.Any, typing.Any, T],
+        timeout: typing.Optional[float] = None,
+    ) -> T:
+        """Run the `coro` in the loop, wait up to `timeout` seconds for its result.
+
+        Raises `concurrent.futures.TimeoutError` (and cancels the `coro`)
+            if it did not finish in time.
+        """
+        loop = self.loop
+        if self._thread is threading.current_thread():
+            coro.close()
+            raise RuntimeError("Can not block the background loop thread")
+        fut = asyncio.run_coroutine_threadsafe(coro, loop)
+        try:
+            return fut.result(timeout)
+        except concurrent.futures.TimeoutError:
+            fut.cancel()
+            raise
+
+    def stop(self):
+        """Cancel the timers, stop the loop and wait for the thread to finish"""
+        with self._lock:
+            (loop, thread) = (self._loop, self._thread)
+            (self._loop, self._thread) = (None, None)
+        if loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(_cancel_all_tasks(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+async def _cancel_all_tasks():
+    tasks = asyncio.all_tasks() - {asyncio.current_task()}
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+# The loop of the `ThreadedTimer`s that do not bring their own
+shared_loop = BackgroundLoop()
+
+
+class ThreadedTimer(typing.Generic[T]):
+    """A thread-safe sync facade of a `Timer` running on a `BackgroundLoop`.
+
+    For the applications without a running event loop (WSGI, Celery, ...):
+        the methods can be called from any thread (but the loop thread).
+    """
+
+    timer: "async_timer.Timer[T]"
+    background: BackgroundLoop
+
+    def __init__(
+        self,
+        delay: typing.Optional[float],
+        target: "async_timer.timer.TimerMainTaskT[T]",
+        background: typing.Optional[BackgroundLoop] = None,
+        start: bool = False,
+        **timer_kwargs,
+    ):
+        """Create the timer.
+
+        Parameters:
+            `delay` - number of seconds between timer invocations
+            `target` - the callable the timer will be invoking
+            `background` - the loop to run the timer in (`shared_loop` by default)
+            `start` - start the timer right away
+            `timer_kwargs` - the other `async_timer.Timer` arguments,
+                            `executor` is "default" unless given, so the
+                            sync targets do not block the shared loop
+        """
+        timer_kwargs.setdefault("executor", "default")
+        self.background = shared_loop if background is None else background
+        self.timer = self.background.run(
+            self._create_timer(delay, target, start=start, **timer_kwargs)
+        )
+
+    @staticmethod
+    async def _create_timer(*args, **kwargs) -> "async_timer.Timer[T]":
+        # (In the loop, the timer might need it right away)
+        return async_timer.Timer(*args, **kwargs)
+
+    def start(self):
+        """Start the timer"""
+        self.background.run(self._start())
+
+    async def _start(self):
+        self.timer.start()
+
+    def is_running(self) -> bool:
+        return self.timer.is_running()
+
+    def join(self, timeout: typing.Optional[float] = None) -> T:
+        """Wait for the next result of the timer (and return it).
+
+        Raises `concurrent.futures.TimeoutError` after `timeout` seconds.
+        """
+        return self.background.run(self.timer.join(), timeout)
+
+    def wait(
+        self,
+        hit_count: typing.Optional[int] = None,
+        hits: typing.Optional[int] = None,
+        timeout: typing.Optional[float] = None,
+    ) -> typing.Optional[T]:
+        """The sync `Timer.wait()`"""
+        return self.background.run(
+            self.timer.wait(hit_count=hit_count, hits=hits, timeout=timeout)
+        )
+
+    def trigger_now(self, debounce: float = 0.0) -> "concurrent.futures.Future[T]":
+        """The sync `Timer.trigger_now()`, returns a future of the result"""
+        return asyncio.run_coroutine_threadsafe(
+            self._trigger_now(debounce), self.background.loop
+        )
+
+    async def _trigger_now(self, debounce: float) -> T:
+        return await self.timer.trigger_now(debounce)
+
+    @property
+    def last_result(self) -> typing.Optional[T]:
+        """The result of the last successful call (read without blocking)"""
+        return self.timer.last_result
+
+    def snapshot(self) -> "async_timer.TimerSnapshot":
+        """The outcome of the last call (read without blocking)"""
+        return self.timer.snapshot()
+
+    def cancel(self):
+        """Stop the timer"""
+        self.background.run(self.timer.cancel())
+
+    def __enter__(self) -> "ThreadedTimer[T]":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.cancel()
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {self.timer!r}>"
@@ -1,8 +1,12 @@
 """Utility async io functions"""
 import asyncio
+import collections
+import functools
+import inspect
 import logging
 import time
 import typing
+import weakref
 
 import async_timer
 
@@ -17,42 +21,83 @@ TimerMainTaskT = typing.Union[
     typing.Generator[T, typing.Any, typing.Any],
 ]
 TimerCallbackT = typing.Callable[["Timer[T]", TimerMainTaskT[T]], None]
+OverrunPolicyT = typing.Literal["queue", "skip", "cancel_previous"]
+PublishOrderT = typing.Literal["hit", "completion"]
+OnErrorT = typing.Literal["stop", "continue", "backoff"]
 
 
 class FanoutRv(typing.Generic[T]):
-    """An object that shares a result actoss all waiters"""
+    """An object that shares a result actoss all waiters.
 
-    lock: asyncio.Lock
-    futures: typing.List[asyncio.Future]
+    Every waiter parks on its own future, registered in the waiters of
+        the current generation. Publishing resolves them in one pass
+        (without a lock), a waiter that is cancelled or times out only
+        unregisters itself: the other waiters stay parked.
+    """
+
+    __slots__ = ("generation", "waiters")
+
+    generation: int  # Number of results published so far
+    # The futures of the current generation waiters (`None` if there are none)
+    waiters: typing.Optional[typing.Dict[asyncio.Future, None]]
 
     def __init__(self):
-        self.futures = []
-        self.lock = asyncio.Lock()
+        self.generation = 0
+        self.waiters = None
 
     async def wait(self) -> T:
         """Wait for result to be posted"""
-        future = asyncio.get_running_loop().create_future()
-        async with self.lock:
-            self.futures.append(future)
-        return await future
+        if self.waiters is None:
+            self.waiters = {}
+        waiters = self.waiters
+        waiter = asyncio.get_running_loop().create_future()
+        waiters[waiter] = None
+        try:
+            return await waiter
+        except asyncio.CancelledError:
+            # (A no-op if the generation is over)
+            waiters.pop(waiter, None)
+            if waiter.done() and not waiter.cancelled():
+                # Published right before the cancellation, do not log it
+                waiter.exception()
+            raise
+
+    def _next_generation(self) -> typing.Dict[asyncio.Future, None]:
+        """Start the next generation, return the waiters of the current one"""
+        (waiters, self.waiters) = (self.waiters, None)
+        self.generation += 1
+        return waiters or {}
 
     async def send_result(self, result: T):
-        async with self.lock:
-            for future in self.futures:
-                future.set_result(result)
-            self.futures.clear()
+        for waiter in self._next_generation():
+            # (Skip the cancelled waiters that did not unregister yet)
+            if not waiter.done():
+                waiter.set_result(result)
 
     async def send_exception(self, exc: Exception):
-        async with self.lock:
-            for future in self.futures:
-                future.set_exception(exc)
-            self.futures.clear()
+        for waiter in self._next_generation():
+            if not waiter.done():
+                waiter.set_exception(exc)
 
     async def cancel(self):
-        async with self.lock:
-            for future in self.futures:
-                future.cancel()
-            self.futures.clear()
+        self.close()
+
+    def close(self):
+        """Cancel the current waiters (the synchronous `cancel()`)"""
+        (waiters, self.waiters) = (self.waiters, None)
+        if waiters:
+            for waiter in waiters:
+                waiter.cancel()
+
+
+def _cancel_pending(fut: typing.Optional[asyncio.Future]):
+    if fut is not None and not fut.done():
+        fut.cancel()
+
+
+def _retrieve_exception(fut: asyncio.Future):
+    if not fut.cancelled():
+        fut.exception()
 
 
 def _noop_cb(*_, **__):
@@ -64,26 +109,104 @@ def _default_main_loop_exception_callback(*_, **__):
     raise
 
 
+def _log_main_loop_exception_callback(*_, **__):
+    logger.exception("An unexpected exception in the timer loop, carrying on.")
+
+
+class TimerSnapshot(typing.NamedTuple):
+    """The outcome of the last timer call (read without awaiting)"""
+
+    last_result: typing.Any  # The last successful result
+    last_exception: typing.Optional[Exception]  # Set if the last call failed
+    last_hit_monotonic: typing.Optional[float]  # `time.monotonic()` of the call
+    last_duration: typing.Optional[float]  # Seconds the call took
+
+
+_NO_SNAPSHOT = TimerSnapshot(None, None, None, None)
+
+
 class Timer(typing.Generic[T]):
     """The main Timer object"""
 
+    __slots__ = (
+        "pacemaker",
+        "hit_count",
+        "overruns",
+        "max_concurrency",
+        "overrun",
+        "publish_order",
+        "on_error",
+        "target_caller",
+        "result_fanout",
+        "history",
+        "stats",
+        "hooks",
+        "leader",
+        "_snapshot",
+        "_subscriptions",
+        "_trigger",
+        "_trigger_handle",
+        "main_task",
+        "exception_callback",
+        "cancel_callback",
+        "__weakref__",
+    )
+
     pacemaker: "async_timer.pacemaker.TimerPacemaker"
-    hit_count: int = 0  # Number of times the timer has run so far
-    target: TimerMainTaskT[T]
+    hit_count: int  # Number of times the timer has run so far
+    overruns: int  # Number of ticks that found `max_concurrency` calls running
+    target_caller: "async_timer.traget_caller.Caller"
+    max_concurrency: int
+    overrun: OverrunPolicyT
+    publish_order: PublishOrderT
+    on_error: OnErrorT
 
     result_fanout: FanoutRv[T]
-    main_task: typing.Optional[asyncio.Task] = None
+    history: typing.Optional["async_timer.history.ResultHistory[T]"]
+    stats: typing.Optional["async_timer.stats.TimerStats"]
+    hooks: typing.Optional["async_timer.hooks.TimerHooks"]
+    leader: typing.Optional["async_timer.leader.FileLeaderLock"]
+    _snapshot: TimerSnapshot  # Replaced (never modified) by every publication
+    _subscriptions: typing.Optional[
+        "weakref.WeakSet[async_timer.subscription.Subscription[T]]"
+    ]  # Created by the first `subscribe()`
+    # The result of the first call that starts after a `trigger_now()`
+    _trigger: typing.Optional[asyncio.Future]
+    _trigger_handle: typing.Optional[asyncio.TimerHandle]  # A debounced wake up
+    main_task: typing.Optional[asyncio.Task]
     exception_callback: TimerCallbackT[T]
     cancel_callback: TimerCallbackT[T]
 
     def __init__(
         self,
-        delay: float,
+        delay: typing.Optional[float],
         target: TimerMainTaskT[T],
         exc_cb: TimerCallbackT[T] = _default_main_loop_exception_callback,
         cancel_cb: TimerCallbackT[T] = _noop_cb,
         cancel_aws: typing.Union[typing.Sequence[typing.Awaitable], None] = None,
         start: bool = False,
+        scheduler: typing.Optional["async_timer.scheduler.Scheduler"] = None,
+        mode: "async_timer.pacemaker.PacemakerModeT" = "fixed_delay",
+        missed_tick_policy: "async_timer.pacemaker.MissedTickPolicyT" = "skip",
+        initial_delay: float = 0.0,
+        jitter: float = 0.0,
+        jitter_ratio: float = 0.0,
+        splay_key: typing.Optional["async_timer.pacemaker.SplayKeyT"] = None,
+        schedule: typing.Optional["async_timer.schedule.Schedule"] = None,
+        slack: float = 0.0,
+        history: int = 0,
+        max_concurrency: int = 1,
+        overrun: OverrunPolicyT = "queue",
+        publish_order: PublishOrderT = "hit",
+        executor: "async_timer.traget_caller.ExecutorT" = None,
+        target_timeout: typing.Optional[float] = None,
+        on_error: OnErrorT = "stop",
+        backoff_factor: float = 2.0,
+        backoff_max: float = 300.0,
+        backoff_jitter: float = 0.1,
+        stats: bool = False,
+        hooks: typing.Optional["async_timer.hooks.TimerHooks"] = None,
+        leader: typing.Union[str, "async_timer.leader.FileLeaderLock", None] = None,
     ):
         """Create the Timer object.
 
@@ -94,22 +217,163 @@ class Timer(typing.Generic[T]):
             `cancel_cb` - callback the timer will call at cancellation
             `cancel_aws` - a list of awaitables, where any
                             one resolving cancels the timer
+            `start` - start the timer right away
+            `scheduler` - a shared `async_timer.Scheduler` that wakes the timer up
+                            (instead of the timer arming its own timeouts)
+            `mode` - "fixed_delay" (the default) waits the `delay` after
+                            each target call, "fixed_rate" fires at the fixed
+                            `delay` intervals regardless of the target duration
+            `missed_tick_policy` - "skip", "catch_up" or "coalesce"
+                            the ticks a "fixed_rate" timer missed due to overruns
+            `initial_delay` - wait this many seconds before the first call
+                            (instead of calling the target right at the start)
+            `jitter`, `jitter_ratio` - add a random [0, jitter) seconds
+                            or [0, jitter_ratio * delay) to every wait
+            `splay_key` - a stable key (or an `(index, count)` slot) that
+                            offsets the timer's phase, so the processes and
+                            timers sharing the `delay` don't fire in lockstep
+            `schedule` - fire at the times of an `async_timer.schedule.Schedule`
+                            (e.g. `CronSchedule("0 2 * * *")`), the `delay`
+                            can be `None` then
+            `slack` - let the ticks fire up to this many seconds late,
+                            so the timers due within the same `slack`
+                            window share a single event loop wake up
+            `history` - keep this many last results, so the `async for` loops
+                            and `wait()` don't miss the results published
+                            while they were busy
+            `max_concurrency` - let up to this many target calls overlap,
+                            so a slow call does not hold the following ticks
+            `overrun` - what a tick does when `max_concurrency` calls
+                            are running: "queue" for a free slot, "skip"
+                            the tick or "cancel_previous" (the oldest) call
+            `publish_order` - publish the overlapping call results in the
+                            "hit" order or in the "completion" order
+            `executor` - run the sync targets (and sync generators) in this
+                            thread/process pool (or "default" for the loop's
+                            default one) instead of blocking the event loop
+            `target_timeout` - fail the target calls that take longer than
+                            this many seconds with `asyncio.TimeoutError`,
+                            `async_timer.time_left()` tells the target how
+                            much time it has left
+            `on_error` - what a target exception does (after being published
+                            and passed to the `exc_cb`): "stop" the timer,
+                            "continue" at the normal `delay` or "backoff" -
+                            continue at an exponentially growing delay
+                            that returns to the `delay` after a success
+                            (the default `exc_cb` only logs unless "stop")
+            `backoff_factor` - the "backoff" delay multiplier
+            `backoff_max` - the longest "backoff" delay (unless `delay` is longer)
+            `backoff_jitter` - add a random [0, backoff_jitter) fraction
+                            to every "backoff" delay
+            `stats` - collect the `async_timer.stats.TimerStats` metrics
+                            (tick lateness, call durations, wake up latency
+                            and the error/skip/overrun counters)
+            `hooks` - an `async_timer.hooks.TimerHooks` instance to call
+                            around the ticks, target calls and publications
+            `leader` - a timer name (or an `async_timer.leader.FileLeaderLock`
+                            for a custom lock directory), only one process
+                            on the host runs the timers of the same name,
+                            the others skip the ticks until it dies
         """
-        self.pacemaker = async_timer.pacemaker.TimerPacemaker(delay)
-        self.target_caller = async_timer.traget_caller.Caller(target)
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be positive: {max_concurrency!r}")
+        if overrun not in typing.get_args(OverrunPolicyT):
+            raise ValueError(f"Unexpected overrun policy: {overrun!r}")
+        if publish_order not in typing.get_args(PublishOrderT):
+            raise ValueError(f"Unexpected publish order: {publish_order!r}")
+        if on_error not in typing.get_args(OnErrorT):
+            raise ValueError(f"Unexpected on_error policy: {on_error!r}")
+        if on_error != "stop" and exc_cb is _default_main_loop_exception_callback:
+            exc_cb = _log_main_loop_exception_callback
+        if max_concurrency > 1 and (
+            inspect.isasyncgen(target) or inspect.isasyncgenfunction(target)
+        ):
+            raise ValueError("Async generator calls can not overlap")
+        self.pacemaker = async_timer.pacemaker.TimerPacemaker(
+            delay,
+            scheduler=scheduler,
+            mode=mode,
+            missed_tick_policy=missed_tick_policy,
+            initial_delay=initial_delay,
+            jitter=jitter,
+            jitter_ratio=jitter_ratio,
+            splay_key=splay_key,
+            schedule=schedule,
+            slack=slack,
+            backoff_factor=backoff_factor,
+            backoff_max=backoff_max,
+            backoff_jitter=backoff_jitter,
+        )
+        self.target_caller = async_timer.traget_caller.Caller(
+            target,
+            executor=executor,
+            timeout=target_timeout,
+            overlapping=max_concurrency > 1,
+        )
         self.result_fanout = FanoutRv()
+        self.history = async_timer.history.ResultHistory(history) if history else None
+        self.stats = async_timer.stats.TimerStats() if stats else None
+        self.hooks = hooks
+        self.leader = async_timer.leader.as_leader_lock(leader)
+        if hooks is not None:
+            self.pacemaker.on_tick_scheduled = functools.partial(
+                hooks.on_tick_scheduled, self
+            )
         self.exception_callback = exc_cb
         self.cancel_callback = cancel_cb
+        self.max_concurrency = max_concurrency
+        self.overrun = overrun
+        self.publish_order = publish_order
+        self.on_error = on_error
+        self.hit_count = 0
+        self.overruns = 0
+        self._snapshot = _NO_SNAPSHOT
+        self._subscriptions = None
+        self._trigger = None
+        self._trigger_handle = None
+        self.main_task = None
         if cancel_aws:
             self.pacemaker.stop_on(list(cancel_aws))
         if start:
             self.start()
 
     @property
-    def delay(self) -> float:
+    def delay(self) -> typing.Optional[float]:
         """A shorthand to access timer firing delay"""
         return self.pacemaker.delay
 
+    def snapshot(self) -> TimerSnapshot:
+        """Return the outcome of the last call.
+
+        A single tuple, so the fields always belong to the same call.
+        """
+        return self._snapshot
+
+    @property
+    def last_result(self) -> typing.Optional[T]:
+        """The result of the last successful call"""
+        return self._snapshot.last_result
+
+    @property
+    def last_exception(self) -> typing.Optional[Exception]:
+        """The exception of the last call (`None` if it succeeded)"""
+        return self._snapshot.last_exception
+
+    @property
+    def last_hit_monotonic(self) -> typing.Optional[float]:
+        """`time.monotonic()` of the last call publication"""
+        return self._snapshot.last_hit_monotonic
+
+    @property
+    def last_duration(self) -> typing.Optional[float]:
+        """Number of seconds the last published target call took"""
+        return self._snapshot.last_duration
+
+    @property
+    def max_duration(self) -> float:
+        """Number of seconds the longest target call took"""
+        return self.target_caller.max_duration
+
     def set_delay(self, new_delay: float):
         """Change the delay."""
         self.pacemaker.delay = new_delay
@@ -134,15 +398,91 @@ class Timer(typing.Generic[T]):
         await self.cancel()
 
     def __aiter__(self) -> typing.AsyncIterator[T]:
+        if self.history is not None:
+            # Every loop reads the history at its own pace
+            return async_timer.history.HistoryIterator(self)
         return self
 
+    def subscribe(
+        self,
+        maxsize: int = 1,
+        policy: "async_timer.subscription.SubscriptionPolicyT" = "drop_oldest",
+    ) -> "async_timer.subscription.Subscription[T]":
+        """Subscribe to the results published from now on.
+
+        Returns an async iterator with its own bounded buffer,
+            see `async_timer.subscription.Subscription` for the `policy` values.
+        The timer forgets the subscription once it is garbage collected.
+        """
+        subscription = async_timer.subscription.Subscription(
+            maxsize,
+            policy,
+            latency=self.stats.fanout_latency if self.stats is not None else None,
+        )
+        if self._subscriptions is None:
+            self._subscriptions = weakref.WeakSet()
+        self._subscriptions.add(subscription)
+        return subscription
+
+    def trigger_now(self, debounce: float = 0.0) -> typing.Awaitable[T]:
+        """Make the timer call the target now instead of at the next tick.
+
+        Returns an awaitable of the result of the first call that starts
+            after the trigger. The triggers that come before that call
+            starts share it: the triggers that arrive during a call
+            get a single follow-up call.
+        A non-zero `debounce` postpones the call until there were no
+            triggers for that many seconds (or until the next tick).
+        The awaitable raises `RuntimeError` if the timer is a `leader`
+            follower (that skips the call).
+        """
+        if not self.is_running():
+            raise RuntimeError("The timer is not running.")
+        if self._trigger is None:
+            self._trigger = asyncio.get_running_loop().create_future()
+        if self._trigger_handle is not None:
+            self._trigger_handle.cancel()
+            self._trigger_handle = None
+        if debounce > 0:
+            self._trigger_handle = asyncio.get_running_loop().call_later(
+                debounce, self._debounced_wake
+            )
+        else:
+            self.pacemaker.wake()
+        # (A cancelled waiter must not cancel the shared future)
+        waiter = asyncio.shield(self._trigger)
+        # The triggers that nobody awaits do not log the target exceptions
+        waiter.add_done_callback(_retrieve_exception)
+        return waiter
+
+    def _debounced_wake(self):
+        self._trigger_handle = None
+        self.pacemaker.wake()
+
+    def _take_trigger(self) -> typing.Optional[asyncio.Future]:
+        """Return the trigger future the call that starts now resolves"""
+        (trigger, self._trigger) = (self._trigger, None)
+        if self._trigger_handle is not None:
+            # The call is starting anyway
+            self._trigger_handle.cancel()
+            self._trigger_handle = None
+        return trigger
+
     async def join(self) -> T:
         """Wait for the next tick of the timer"""
         if not self.is_running():
             raise asyncio.CancelledError("The timer is not running.")
-        return (
-            await self.result_fanout.wait()
-        )  # this can raise `asyncio.CancelledError`
+        if self.stats is None:
+            return (
+                await self.result_fanout.wait()
+            )  # this can raise `asyncio.CancelledError`
+        try:
+            rv = await self.result_fanout.wait()
+        except Exception:
+            self._record_wakeup()
+            raise
+        self._record_wakeup()
+        return rv
 
     async def wait(
         self, /, hit_count: int = None, hits: int = None, timeout: float = None
@@ -159,6 +499,9 @@ class Timer(typing.Generic[T]):
 
         Returns the last generated result IF there was a need to wait.
         Returns `None` otherwise.
+
+        Timers with the `history` return the result of exactly
+            the `hit_count`-th hit (if it is still in the history).
         """
         start_time = time.monotonic()
         timeout_left = timeout
@@ -171,6 +514,12 @@ class Timer(typing.Generic[T]):
             target_hit_count = 0
             infinite_wait = True
         need_to_wait_for = target_hit_count - self.hit_count
+        if self.history is not None and not infinite_wait:
+            if need_to_wait_for <= 0:
+                return None
+            return await asyncio.wait_for(
+                self._wait_history(target_hit_count - 1), timeout
+            )
         last_rv = None
         try:
             while infinite_wait or need_to_wait_for > 0:
@@ -188,6 +537,28 @@ class Timer(typing.Generic[T]):
                 raise
         return last_rv
 
+    async def _wait_history(self, hit_index: int) -> T:
+        """Wait for the result of the `hit_index` hit to appear in the history"""
+        cursor = self.history.cursor()
+        while True:
+            try:
+                entry = cursor.read()
+            except async_timer.history.HistoryOverrunError:
+                continue
+            if entry is None:
+                try:
+                    await self.join()
+                except asyncio.CancelledError:
+                    if not cursor.pending():
+                        raise
+                except Exception:
+                    # Delivered through the history
+                    pass
+            elif entry.failed:
+                raise entry.result
+            elif entry.hit_index >= hit_index:
+                return entry.result
+
     async def __anext__(self) -> T:
         try:
             return await self.join()
@@ -195,31 +566,262 @@ class Timer(typing.Generic[T]):
             raise StopAsyncIteration() from err
 
     async def _loop_callback_routine(self):
+        trigger = None
         try:
-            async for _ in self.pacemaker:
+            if self.max_concurrency > 1:
+                await self._overlapping_loop()
+                return
+            async for missed in self.pacemaker:
+                if not self._start_tick(missed):
+                    continue
+                trigger = None if self._trigger is None else self._take_trigger()
                 try:
-                    rv = await self.target_caller.next()
+                    rv = await self._call_target()
                 except StopAsyncIteration:
                     break
                 except Exception as err:
-                    await self.result_fanout.send_exception(err)
+                    await self._publish_exception(
+                        err, self.target_caller.last_duration, trigger
+                    )
                     self.exception_callback(self, self.target_caller.target)
-                    break
+                    if self.on_error == "stop":
+                        break
+                    self._recover()
                 else:
-                    await self.result_fanout.send_result(rv)
+                    await self._publish_result(
+                        rv, self.target_caller.last_duration, trigger
+                    )
+                    self.pacemaker.reset_backoff()
                 self.hit_count += 1
         finally:
             # Main loop finished - cancel all watchers
             await self.result_fanout.cancel()
+            self._close_subscriptions()
+            _cancel_pending(trigger)
+            _cancel_pending(self._take_trigger())
+            if self.leader is not None:
+                # Let another process take over right away
+                self.leader.release()
+            if self.hooks is not None:
+                self.hooks.on_stop(self)
             self.cancel_callback(self, self.target_caller.target)
 
+    async def _overlapping_loop(self):
+        """The main loop that lets up to `max_concurrency` target calls overlap"""
+        loop = asyncio.get_running_loop()
+        in_flight: typing.Deque[asyncio.Task] = collections.deque()
+        failures: typing.List[Exception] = []
+        try:
+            async for missed in self.pacemaker:
+                if not self._start_tick(missed):
+                    continue
+                if len(in_flight) >= self.max_concurrency:
+                    if not await self._handle_overrun(in_flight):
+                        continue
+                previous = in_flight[-1] if in_flight else None
+                trigger = None if self._trigger is None else self._take_trigger()
+                task = loop.create_task(
+                    self._overlapping_call(previous, failures, trigger)
+                )
+                task.add_done_callback(in_flight.remove)
+                in_flight.append(task)
+            if in_flight:
+                await asyncio.wait(list(in_flight))
+        finally:
+            if in_flight:
+                for task in in_flight:
+                    task.cancel()
+                await asyncio.wait(list(in_flight))
+        if failures:
+            try:
+                raise failures[0]
+            except Exception:
+                self.exception_callback(self, self.target_caller.target)
+
+    async def _handle_overrun(self, in_flight: typing.Deque[asyncio.Task]) -> bool:
+        """Apply the `overrun` policy, return `False` if the tick is to be skipped"""
+        self.overruns += 1
+        if self.stats is not None:
+            self.stats.overruns += 1
+            if self.overrun == "skip":
+                self.stats.skips += 1
+        if self.overrun == "skip":
+            return False
+        elif self.overrun == "cancel_previous":
+            in_flight[0].cancel()
+        else:
+            await asyncio.wait(list(in_flight), return_when=asyncio.FIRST_COMPLETED)
+        return True
+
+    async def _overlapping_call(
+        self,
+        previous: typing.Optional[asyncio.Task],
+        failures: typing.List[Exception],
+        trigger: typing.Optional[asyncio.Future] = None,
+    ):
+        """Call the target once and publish the outcome"""
+        try:
+            await self._overlapping_call_publish(previous, failures, trigger)
+        finally:
+            _cancel_pending(trigger)
+
+    async def _overlapping_call_publish(
+        self,
+        previous: typing.Optional[asyncio.Task],
+        failures: typing.List[Exception],
+        trigger: typing.Optional[asyncio.Future],
+    ):
+        failed = False
+        try:
+            rv = await self._call_target()
+        except StopAsyncIteration:
+            self.pacemaker.stop()
+            return
+        except Exception as err:
+            (rv, failed) = (err, True)
+        # (Of this call, the overlapping calls overwrite the caller's one)
+        duration = self.target_caller.last_duration
+        if previous is not None and self.publish_order == "hit":
+            await asyncio.wait([previous])
+        if failures:
+            # Nothing gets published after the first failure
+            return
+        elif failed and self.on_error == "stop":
+            failures.append(rv)
+            self.pacemaker.stop()
+            await self._publish_exception(rv, duration, trigger)
+            return
+        elif failed:
+            await self._publish_exception(rv, duration, trigger)
+            try:
+                raise rv
+            except Exception:
+                self.exception_callback(self, self.target_caller.target)
+            self._recover()
+        else:
+            await self._publish_result(rv, duration, trigger)
+            self.pacemaker.reset_backoff()
+        self.hit_count += 1
+
+    def _start_tick(self, missed: int) -> bool:
+        """Record the tick, return `False` if it is skipped (by a `leader` follower)"""
+        if self.stats is not None:
+            self._record_tick(missed)
+        if self.leader is None or self.leader.try_acquire():
+            return True
+        if self.stats is not None:
+            self.stats.skips += 1
+        if self._trigger is not None:
+            # The leader process calls the target, not this one
+            self._take_trigger().set_exception(
+                RuntimeError("Not the leader, the target was not called")
+            )
+        return False
+
+    def _recover(self):
+        """Prepare the next tick after a failed call ("continue"/"backoff" modes)"""
+        self.target_caller.reset()
+        if self.on_error == "backoff":
+            self.pacemaker.back_off()
+
+    async def _call_target(self) -> T:
+        """Call the target once (recording the stats and calling the hooks)"""
+        if self.stats is None and self.hooks is None:
+            return await self.target_caller.next()
+        if self.hooks is not None:
+            self.hooks.on_target_start(self)
+        try:
+            rv = await self.target_caller.next()
+        except StopAsyncIteration:
+            raise
+        except Exception as err:
+            self._record_call(err, failed=True)
+            raise
+        self._record_call(rv, failed=False)
+        return rv
+
+    def _record_call(self, rv: typing.Any, failed: bool):
+        if self.stats is not None:
+            if failed:
+                self.stats.errors += 1
+                if isinstance(rv, asyncio.TimeoutError):
+                    self.stats.timeouts += 1
+            self.stats.duration.record(self.target_caller.last_duration)
+        if self.hooks is not None:
+            self.hooks.on_target_end(self, rv, failed)
+
+    def _record_tick(self, missed: int):
+        stats = self.stats
+        stats.ticks += 1
+        stats.skips += missed
+        lateness = asyncio.get_running_loop().time() - self.pacemaker.deadline
+        stats.lateness.record(max(0.0, lateness))
+
+    def _record_wakeup(self):
+        published_at = self._snapshot.last_hit_monotonic
+        self.stats.fanout_latency.record(time.monotonic() - published_at)
+
+    async def _publish_result(
+        self,
+        rv: T,
+        duration: typing.Optional[float],
+        trigger: typing.Optional[asyncio.Future] = None,
+    ):
+        self._snapshot = TimerSnapshot(rv, None, time.monotonic(), duration)
+        if self.history is not None:
+            self.history.append(self.hit_count, rv)
+        await self.result_fanout.send_result(rv)
+        if self._subscriptions:
+            for subscription in list(self._subscriptions):
+                await subscription.put(rv)
+        if trigger is not None and not trigger.done():
+            trigger.set_result(rv)
+        if self.hooks is not None:
+            self.hooks.on_publish(self, rv, False)
+
+    async def _publish_exception(
+        self,
+        err: Exception,
+        duration: typing.Optional[float],
+        trigger: typing.Optional[asyncio.Future] = None,
+    ):
+        self._snapshot = TimerSnapshot(
+            self._snapshot.last_result, err, time.monotonic(), duration
+        )
+        if self.history is not None:
+            self.history.append(self.hit_count, err, failed=True)
+        await self.result_fanout.send_exception(err)
+        if self._subscriptions:
+            for subscription in list(self._subscriptions):
+                await subscription.put(err, failed=True)
+        if trigger is not None and not trigger.done():
+            trigger.set_exception(err)
+            # The `trigger_now()` callers get it anyway, do not log it
+            trigger.exception()
+        if self.hooks is not None:
+            self.hooks.on_publish(self, err, True)
+
+    def _close_subscriptions(self):
+        if self._subscriptions:
+            for subscription in list(self._subscriptions):
+                subscription.close()
+
     async def cancel(self):
         """Unshedule the timer"""
-        if self.main_task:
-            self.main_task.cancel()
-            await self.result_fanout.cancel()
+        self._cancel_now()
+
+    def _cancel_now(self) -> typing.Optional[asyncio.Task]:
+        """Unshedule the timer, return the (cancelled) main task if there was one"""
+        task = self.main_task
+        if task:
+            task.cancel()
+            self.result_fanout.close()
+            self._close_subscriptions()
             self.pacemaker.stop()
             self.main_task = None
+        if self.leader is not None:
+            self.leader.release()
+        return task
 
     async def stop(self):
         """An alias to `cancel()`"""
@@ -1,43 +1,125 @@
 """This module is responsible for the magic behaviour calling the `target` function."""
 
+import asyncio
+import concurrent.futures
+import contextvars
 import inspect
+import threading
+import time
+import typing
 from collections.abc import Iterator
 
+ExecutorT = typing.Union[concurrent.futures.Executor, typing.Literal["default"], None]
+# `time.monotonic()` the current target call times out at
+_deadline: "contextvars.ContextVar[typing.Optional[float]]" = contextvars.ContextVar(
+    "async_timer_deadline", default=None
+)
 
-class Caller:
-    target = None
-    get_next_val = None
-    first_call: bool = True
 
-    def __init__(self, target):
-        self.target = target
+def time_left() -> typing.Optional[float]:
+    """Return the number of seconds before the current target call times out.
 
-    def _wrap_generator(self, maybe_gen):
-        if inspect.isgenerator(maybe_gen):
+    Returns `None` if the call has no `target_timeout` (or outside of the target).
+    """
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
 
-            def _lock_sync_gen_ctx():
-                return lambda: next(maybe_gen)
 
-            gen_next_val = _lock_sync_gen_ctx()
-        elif inspect.isasyncgen(maybe_gen):
+class Caller:
+    __slots__ = (
+        "target",
+        "get_next_val",
+        "first_call",
+        "executor",
+        "timeout",
+        "overlapping",
+        "last_duration",
+        "max_duration",
+        "_offload",
+        "_lock",
+        "_dispatch",
+    )
 
-            def _lock_async_gen_ctx():
-                return lambda: maybe_gen.__anext__()
+    target: typing.Any
+    get_next_val: typing.Optional[typing.Callable[[], typing.Any]]
+    first_call: bool
+    executor: ExecutorT
+    timeout: typing.Optional[float]
+    overlapping: bool  # The calls can overlap (the async generators can not)
+    last_duration: typing.Optional[float]  # Seconds the last call took
+    max_duration: float  # Seconds the longest call took
+    _offload: bool  # Run the sync calls in the `executor`
+    _lock: typing.Optional[threading.Lock]
+    # Returns the awaitable of the next value, specialised for the target kind
+    _dispatch: typing.Callable[[], typing.Awaitable[typing.Any]]
 
-            gen_next_val = _lock_async_gen_ctx()
-        elif isinstance(maybe_gen, Iterator):
+    def __init__(
+        self,
+        target,
+        executor: ExecutorT = None,
+        timeout: typing.Optional[float] = None,
+        overlapping: bool = False,
+    ):
+        """Create the caller.
 
-            def _lock_iterator_ctx():
-                return next(maybe_gen)
+        Parameters:
+            `target` - the function/generator to call
+            `executor` - a thread or process pool executor (or "default" for
+                            the loop's default one) to run the sync calls in
+            `timeout` - raise `asyncio.TimeoutError` if a call takes longer
+                            (the sync calls can only be interrupted if
+                            they are running in the `executor`)
+            `overlapping` - the calls can overlap, so the targets that turn
+                            out to be async generators are rejected
+        """
+        if timeout is not None and timeout <= 0:
+            raise ValueError(f"The timeout must be positive, got {timeout!r}")
+        self.target = target
+        self.get_next_val = None
+        self.first_call = True
+        self.executor = executor
+        self.timeout = timeout
+        self.overlapping = overlapping
+        self.last_duration = None
+        self.max_duration = 0.0
+        self._offload = False
+        self._lock = None
+        self._dispatch = self._next_first
+        if executor is None or (
+            inspect.iscoroutinefunction(target)
+            or inspect.isasyncgenfunction(target)
+            or inspect.isasyncgen(target)
+        ):
+            # Nothing to offload
+            return
+        elif isinstance(executor, concurrent.futures.ProcessPoolExecutor) and (
+            inspect.isgeneratorfunction(target) or isinstance(target, Iterator)
+        ):
+            raise ValueError("Generators can not be advanced in a process pool")
+        self._offload = True
+        self._lock = threading.Lock()
 
-            gen_next_val = _lock_iterator_ctx
-        else:
-            gen_next_val = None
-        return gen_next_val
+    def _wrap_generator(self, maybe_gen):
+        """Return the (bound) method that advances `maybe_gen` or `None`"""
+        if inspect.isasyncgen(maybe_gen):
+            if self.overlapping:
+                # (E.g. a lambda returning one, the `Timer` catches the rest)
+                raise ValueError("Async generator calls can not overlap")
+            # Driven directly by the `__anext__()` awaitables
+            self._dispatch = maybe_gen.__anext__
+            return maybe_gen.__anext__
+        elif isinstance(maybe_gen, Iterator):
+            # (The generators included)
+            self._dispatch = self._next_sync
+            return maybe_gen.__next__
+        return None
 
     def _setup(self, target):
         """Configure `get_next_val` to return next value.
 
+        Also installs the `_dispatch` fast path matching the kind of the target.
         Return the first such next value.
         """
         self.get_next_val = self._wrap_generator(target)
@@ -53,10 +135,16 @@ class Caller:
             return self.get_next_val()
         # Otherwise, target is just a callable that returns values
         self.get_next_val = target
+        if inspect.iscoroutinefunction(target):
+            self._dispatch = target
+        else:
+            # (Any of its values can be awaitable, e.g. the lambdas
+            #   calling a coroutine function now and then)
+            self._dispatch = self._next_sync
         return target_rv
 
-    async def next(self):
-        """Call `target` one more time."""
+    def call(self):
+        """Call `target` one more time, return the value (that can be awaitable)."""
         try:
             if self.first_call:
                 rv = self._setup(self.target)
@@ -65,6 +153,87 @@ class Caller:
                 rv = self.get_next_val()
         except StopIteration as _err:
             raise StopAsyncIteration() from _err
+        return rv
+
+    def reset(self):
+        """Call the `target` anew on the next call.
+
+        (A generator that raised an exception is exhausted, this
+            creates a new one if the `target` is a generator function)
+        """
+        self.first_call = True
+        self._dispatch = self._next_first
+
+    async def next(self):
+        """Call `target` one more time."""
+        start = time.monotonic()
+        try:
+            if self.timeout is None:
+                return await self._next()
+            return await asyncio.wait_for(
+                self._next(start + self.timeout), self.timeout
+            )
+        finally:
+            self.last_duration = time.monotonic() - start
+            self.max_duration = max(self.max_duration, self.last_duration)
+
+    async def _next(self, deadline: typing.Optional[float] = None):
+        if deadline is None:
+            return await self._call_once()
+        # (`wait_for()` runs the call in the caller's task since Python 3.12)
+        token = _deadline.set(deadline)
+        try:
+            return await self._call_once()
+        finally:
+            _deadline.reset(token)
+
+    async def _call_once(self):
+        if self._offload:
+            rv = await self._call_in_executor()
+            if inspect.isawaitable(rv):
+                rv = await rv
+            return rv
+        return await self._dispatch()
+
+    # The `_dispatch` paths for the sync targets, `_setup()` picks one
+    #   by the kind of the target (the async ones are awaited directly)
+
+    async def _next_first(self):
+        rv = self.call()
+        if inspect.isawaitable(rv):
+            rv = await rv
+        return rv
+
+    async def _next_sync(self):
+        """The sync functions and iterators (of values or awaitables)"""
+        try:
+            rv = self.get_next_val()
+        except StopIteration as _err:
+            raise StopAsyncIteration() from _err
         if inspect.isawaitable(rv):
             rv = await rv
         return rv
+
+    async def _call_in_executor(self):
+        executor = None if self.executor == "default" else self.executor
+        loop = asyncio.get_running_loop()
+        if isinstance(executor, concurrent.futures.ProcessPoolExecutor):
+            # Only the plain (picklable) callables can run in other processes
+            return await loop.run_in_executor(executor, self.target)
+        (rv, stopped) = await loop.run_in_executor(
+            executor, contextvars.copy_context().run, self._call_or_stop
+        )
+        if stopped:
+            raise StopAsyncIteration()
+        return rv
+
+    def _call_or_stop(self) -> typing.Tuple[typing.Any, bool]:
+        """`call()` that does not raise `StopAsyncIteration` out of the executor"""
+        try:
+            if self.first_call or self.get_next_val is not self.target:
+                # Generators can not be advanced concurrently
+                with self._lock:
+                    return (self.call(), False)
+            return (self.call(), False)
+        except StopAsyncIteration:
+            return (None, True)
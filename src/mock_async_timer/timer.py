@@ -11,7 +11,7 @@ class MockPacemaker(async_timer.pacemaker.TimerPacemaker):
         super().__init__(*args, **kwargs)
         self.sleep = unittest.mock.AsyncMock(name="mock-timer-sleep")
 
-    async def _try_wait(self, delay: float):
+    async def _try_wait(self, delay: float, deadline: float):
         if self._cancel_evt.is_set():
             raise StopAsyncIteration()
 
@@ -27,8 +27,23 @@ class MockPacemaker(async_timer.pacemaker.TimerPacemaker):
     @classmethod
     def fromPacemaker(cls, original: async_timer.pacemaker.TimerPacemaker):
         """Create MockPacemaker from the non-mock original."""
-        out = cls(delay=original.delay)
-        out.stop_on(original._cancel_futs)
+        out = cls(
+            delay=original.delay,
+            scheduler=original.scheduler,
+            mode=original.mode,
+            missed_tick_policy=original.missed_tick_policy,
+            initial_delay=original.initial_delay,
+            jitter=original.jitter,
+            jitter_ratio=original.jitter_ratio,
+            splay_key=original.splay_key,
+            schedule=original.schedule,
+            slack=original.slack,
+            backoff_factor=original.backoff_factor,
+            backoff_max=original.backoff_max,
+            backoff_jitter=original.backoff_jitter,
+        )
+        out.on_tick_scheduled = original.on_tick_scheduled
+        out.stop_on(original._cancel_futs or ())
         return out
 
 
@@ -1,5 +1,6 @@
 import asyncio
 import itertools
+import selectors
 
 import pytest
 import pytest_asyncio
@@ -49,3 +50,41 @@ async def async_gen(count_iterable):
             yield val
 
     return _iter
+
+
+class _VirtualClockSelector(selectors.DefaultSelector):
+    """Advances the loop clock instead of blocking"""
+
+    loop: "VirtualClockLoop"
+
+    def select(self, timeout=None):
+        if timeout:
+            self.loop.virtual_time += timeout
+        return super().select(0)
+
+
+class VirtualClockLoop(asyncio.SelectorEventLoop):
+    """An event loop where sleeping takes no real time"""
+
+    virtual_time: float = 0.0
+
+    def __init__(self):
+        selector = _VirtualClockSelector()
+        super().__init__(selector=selector)
+        selector.loop = self
+
+    def time(self) -> float:
+        return self.virtual_time
+
+
+@pytest.fixture
+def virtual_loop():
+    loop = VirtualClockLoop()
+    asyncio.set_event_loop(loop)
+    yield loop
+    pending = asyncio.all_tasks(loop)
+    for task in pending:
+        task.cancel()
+    loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+    asyncio.set_event_loop(None)
+    loop.close()
@@ -0,0 +1,108 @@
+"""Smoke-test the benchmarks with tiny parameters"""
+import json
+
+import pytest
+
+from async_timer.bench import (
+    __main__,
+    caller,
+    executor,
+    fanout,
+    group,
+    hooks,
+    memory,
+    pacemaker,
+    scheduler,
+    slack,
+    throughput,
+    waiters,
+)
+
+
+def test_scheduler_bench():
+    for shared in (False, True):
+        rv = scheduler.measure(count=10, shared=shared, duration=0.05, delay=0.01)
+        assert rv["shared_scheduler"] is shared
+        assert rv["ticks"] >= 10
+
+
+def test_pacemaker_bench():
+    (legacy, current) = pacemaker.run(ticks=100)
+    assert legacy["ticks"] == current["ticks"] == 100
+    assert current["asyncio_objects_per_tick"] < legacy["asyncio_objects_per_tick"]
+
+
+def test_fanout_bench():
+    rvs = fanout.run(waiter_counts=[10], rounds=2)
+    assert [rv["fanout"] for rv in rvs] == ["LockedFanoutRv", "FanoutRv"]
+
+
+def test_group_bench():
+    rvs = group.run(timers=10)
+    assert [rv["grouped"] for rv in rvs] == [False, True]
+    assert all(rv["cancel_s"] > 0 for rv in rvs)
+
+
+def test_executor_bench():
+    rv = executor.measure("default", block_for=0.01, duration=0.05)
+    assert rv["target_calls"] > 0
+
+
+def test_hooks_bench():
+    rvs = hooks.run(ticks=50)
+    assert [rv["variant"] for rv in rvs] == ["disabled", "noop_hooks", "stats"]
+    assert all(rv["ticks"] >= 50 for rv in rvs)
+
+
+def test_throughput_bench():
+    rvs = throughput.run(timer_counts=[1, 3], duration=0.05)
+    assert [rv["timers"] for rv in rvs] == [1, 3]
+    assert all(rv["ticks"] > 0 for rv in rvs)
+
+
+def test_waiters_bench():
+    rv = waiters.measure(waiters=5, rounds=2)
+    assert rv["last_wake_us"] >= rv["first_wake_us"] > 0
+
+
+def test_slack_bench():
+    (exact, coalesced) = slack.run(
+        slacks=(0.0, 0.05), timers=20, duration=0.3, delay=0.1
+    )
+    assert exact["ticks"] > 0 and coalesced["ticks"] > 0
+    assert coalesced["loop_wakeups"] < exact["loop_wakeups"]
+
+
+def test_caller_bench():
+    rvs = caller.run(calls=10)
+    assert [rv["kind"] for rv in rvs] == [
+        "sync",
+        "coroutine",
+        "sync_generator",
+        "async_generator",
+    ]
+
+
+def test_bench_cli(tmp_path):
+    out = tmp_path / "bench.json"
+    __main__.main(["--quick", "-o", str(out), "caller", "waiters"])
+    rv = json.loads(out.read_text())
+    assert rv["quick"] is True
+    assert rv["environment"]["python"]
+    assert set(rv["results"]) == {"caller", "waiters"}
+
+
+def test_bench_cli_unknown_name():
+    with pytest.raises(SystemExit):
+        __main__.main(["nope"])
+
+
+def test_memory_bench():
+    rv = memory.measure(count=100, shared=False)
+    assert 0 < rv["bytes_per_timer"] < 100_000
+    for cls in memory.INSTANCE_FACTORIES:
+        (baseline, slotted) = (
+            memory.measure_instances(cls, count=100, slots=slots)
+            for slots in (False, True)
+        )
+        assert 0 < slotted["bytes_per_instance"] < baseline["bytes_per_instance"]
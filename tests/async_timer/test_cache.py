@@ -0,0 +1,139 @@
+"""Test the background refreshed cache"""
+import asyncio
+import itertools
+
+import pytest
+
+import async_timer
+
+
+def test_single_flight_first_load(virtual_loop):
+    calls = []
+
+    async def _load():
+        calls.append(virtual_loop.time())
+        await asyncio.sleep(1)
+        return len(calls)
+
+    async def _main():
+        cache = async_timer.CachedValue(10, _load)
+        assert cache.value is None
+        async with cache:
+            rvs = await asyncio.gather(*(cache.get() for _ in range(5)))
+            # Served from the cache now
+            assert await cache.get() == 1
+        return (cache, rvs)
+
+    (cache, rvs) = virtual_loop.run_until_complete(_main())
+    assert rvs == [1] * 5
+    assert calls == [0.0]
+    assert (cache.value, cache.refreshes, cache.blocked_reads) == (1, 1, 5)
+
+
+def test_stale_while_revalidate(virtual_loop):
+    counter = itertools.count()
+
+    async def _load():
+        await asyncio.sleep(1)
+        return next(counter)
+
+    async def _main():
+        async with async_timer.CachedValue(5, _load) as cache:
+            await cache.get()
+            values = []
+            for _ in range(7):
+                await asyncio.sleep(1)
+                values.append(cache.value)
+        return values
+
+    # The first reload starts at 6 and finishes at 7
+    assert virtual_loop.run_until_complete(_main()) == [0, 0, 0, 0, 0, 1, 1]
+
+
+def test_failed_reload_keeps_the_value(virtual_loop):
+    results = iter([1, ValueError("boom"), 3])
+
+    def _load():
+        rv = next(results)
+        if isinstance(rv, Exception):
+            raise rv
+        return rv
+
+    async def _main():
+        async with async_timer.CachedValue(1, _load, exc_cb=lambda *_: None) as cache:
+            assert await cache.get() == 1
+            await asyncio.sleep(1.5)
+            assert cache.value == 1
+            assert isinstance(cache.last_error, ValueError)
+            await asyncio.sleep(1)
+            assert cache.value == 3
+        return cache
+
+    cache = virtual_loop.run_until_complete(_main())
+    assert (cache.refreshes, cache.errors) == (2, 1)
+
+
+@pytest.mark.asyncio
+async def test_max_staleness():
+    counter = itertools.count()
+    async with async_timer.CachedValue(
+        0.05, counter.__next__, max_staleness=10
+    ) as cache:
+        assert await cache.get() == 0
+        assert cache.is_fresh()
+        assert 0 <= cache.age < 10
+        # Pretend the reloads got stuck
+        cache.updated_at -= 60
+        assert not cache.is_fresh()
+        assert await cache.get() > 0
+        assert cache.blocked_reads == 2
+
+
+def test_stale_get_reloads_now(virtual_loop):
+    counter = itertools.count()
+
+    async def _load():
+        await asyncio.sleep(0.1)
+        return next(counter)
+
+    async def _main():
+        async with async_timer.CachedValue(100, _load, max_staleness=1) as cache:
+            assert await cache.get() == 0
+            cache.updated_at -= 60  # (The age is not on the virtual clock)
+            start = virtual_loop.time()
+            rvs = await asyncio.gather(*(cache.get() for _ in range(3)))
+            return (rvs, virtual_loop.time() - start)
+
+    (rvs, waited) = virtual_loop.run_until_complete(_main())
+    assert rvs == [1] * 3
+    assert waited < 1
+
+
+@pytest.mark.asyncio
+async def test_get_when_not_running():
+    cache = async_timer.CachedValue(1, lambda: 42, max_staleness=10)
+    with pytest.raises(RuntimeError):
+        await cache.get()
+    async with cache:
+        assert await cache.get() == 42
+    cache.updated_at -= 60
+    with pytest.raises(RuntimeError):
+        await cache.get()
+
+
+@pytest.mark.asyncio
+async def test_user_hooks_still_run():
+    published = []
+
+    class _Hooks(async_timer.hooks.TimerHooks):
+        def on_publish(self, timer, result, failed):
+            published.append(result)
+
+    async with async_timer.CachedValue(1, lambda: 42, hooks=_Hooks()) as cache:
+        assert await cache.get() == 42
+    assert published == [42]
+
+
+def test_invalid_max_staleness():
+    with pytest.raises(ValueError):
+        async_timer.CachedValue(1, lambda: None, max_staleness=0)
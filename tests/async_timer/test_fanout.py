@@ -0,0 +1,99 @@
+import asyncio
+
+import pytest
+
+from async_timer.timer import FanoutRv
+
+
+async def _subscribe(fanout: FanoutRv, count: int) -> list:
+    tasks = [asyncio.ensure_future(fanout.wait()) for _ in range(count)]
+    await asyncio.sleep(0)
+    return tasks
+
+
+@pytest.mark.asyncio
+async def test_shared_result():
+    fanout = FanoutRv()
+    tasks = await _subscribe(fanout, 100)
+    assert len(fanout.waiters) == 100
+    await fanout.send_result(42)
+    assert await asyncio.gather(*tasks) == [42] * 100
+    assert fanout.generation == 1
+    assert fanout.waiters is None
+
+
+@pytest.mark.asyncio
+async def test_exception():
+    fanout = FanoutRv()
+    tasks = await _subscribe(fanout, 10)
+    await fanout.send_exception(NameError("boom"))
+    for rv in await asyncio.gather(*tasks, return_exceptions=True):
+        assert isinstance(rv, NameError)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_affect_others():
+    fanout = FanoutRv()
+    (cancelled, *others) = await _subscribe(fanout, 10)
+    cancelled.cancel()
+    await asyncio.sleep(0)
+    await fanout.send_result(42)
+    assert await asyncio.gather(*others) == [42] * 9
+    assert cancelled.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_publish_right_after_waiter_cancel():
+    fanout = FanoutRv()
+    (cancelled, *others) = await _subscribe(fanout, 10)
+    cancelled.cancel()
+    # Publish before the other waiters had a chance to resubscribe
+    await fanout.send_result(42)
+    assert await asyncio.gather(*others) == [42] * 9
+    assert cancelled.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_waiter_timeout():
+    fanout = FanoutRv()
+    others = await _subscribe(fanout, 10)
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(fanout.wait(), 0.01)
+    await fanout.send_result(42)
+    assert await asyncio.gather(*others) == [42] * 10
+
+
+@pytest.mark.asyncio
+async def test_waiter_timeout_leaves_others_parked():
+    fanout = FanoutRv()
+    others = await _subscribe(fanout, 10)
+    waiters = dict(fanout.waiters)
+    for _ in range(3):
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(fanout.wait(), 0.01)
+    # The others were not woken up to re-subscribe
+    assert fanout.waiters == waiters
+    assert not any(waiter.done() for waiter in waiters)
+    await fanout.send_result(42)
+    assert await asyncio.gather(*others) == [42] * 10
+
+
+@pytest.mark.asyncio
+async def test_cancel():
+    fanout = FanoutRv()
+    tasks = await _subscribe(fanout, 10)
+    await fanout.cancel()
+    for rv in await asyncio.gather(*tasks, return_exceptions=True):
+        assert isinstance(rv, asyncio.CancelledError)
+    assert fanout.generation == 0
+
+
+@pytest.mark.asyncio
+async def test_generations():
+    fanout = FanoutRv()
+    for idx in range(5):
+        tasks = await _subscribe(fanout, 3)
+        await fanout.send_result(idx)
+        assert await asyncio.gather(*tasks) == [idx] * 3
+    await fanout.send_result("nobody is listening")
+    assert fanout.generation == 6
@@ -0,0 +1,116 @@
+"""Test the fixed rate pacemaker mode (using the virtual clock loop)"""
+import asyncio
+
+import pytest
+
+import async_timer
+import async_timer.pacemaker as pacemaker
+
+
+def _timer_fire_times(virtual_loop, mode: str, n_ticks: int) -> list:
+    fire_times = []
+
+    async def _target():
+        for _ in range(n_ticks):
+            fire_times.append(virtual_loop.time())
+            await asyncio.sleep(0.3)
+            yield None
+
+    async def _main():
+        timer = async_timer.Timer(1.0, target=_target, mode=mode, start=True)
+        await timer.main_task
+
+    virtual_loop.run_until_complete(_main())
+    return fire_times
+
+
+def test_fixed_rate_does_not_drift(virtual_loop):
+    fire_times = _timer_fire_times(virtual_loop, "fixed_rate", 10_000)
+    assert len(fire_times) == 10_000
+    start = fire_times[0]
+    max_drift = max(abs(val - (start + idx)) for (idx, val) in enumerate(fire_times))
+    assert max_drift < 1e-6
+
+
+def test_fixed_delay_is_the_default(virtual_loop):
+    fire_times = _timer_fire_times(virtual_loop, "fixed_delay", 100)
+    periods = {
+        round(fire_times[idx + 1] - fire_times[idx], 6)
+        for idx in range(len(fire_times) - 1)
+    }
+    assert periods == {1.3}, "fixed delay sleeps after the target is done"
+
+
+@pytest.mark.parametrize(
+    "policy, exp_ticks",
+    [
+        ("catch_up", [(0, 0), (2.5, 0), (2.5, 0), (3, 0), (4, 0)]),
+        ("skip", [(0, 0), (3, 2), (4, 0), (5, 0), (6, 0)]),
+        ("coalesce", [(0, 0), (2.5, 1), (3, 0), (4, 0), (5, 0)]),
+    ],
+)
+def test_missed_tick_policy(virtual_loop, policy, exp_ticks):
+    pm = pacemaker.TimerPacemaker(
+        delay=1.0, mode="fixed_rate", missed_tick_policy=policy
+    )
+    ticks = []
+
+    async def _main():
+        async for missed in pm:
+            ticks.append((virtual_loop.time(), missed))
+            if len(ticks) == 1:
+                await asyncio.sleep(2.5)  # Overrun
+            elif len(ticks) == len(exp_ticks):
+                break
+
+    virtual_loop.run_until_complete(_main())
+    assert ticks == exp_ticks
+    assert pm.missed_ticks == sum(missed for (_, missed) in exp_ticks)
+
+
+def test_fixed_rate_delay_change(virtual_loop):
+    pm = pacemaker.TimerPacemaker(delay=1.0, mode="fixed_rate")
+    ticks = []
+
+    async def _main():
+        async for _ in pm:
+            ticks.append(virtual_loop.time())
+            if len(ticks) == 3:
+                pm.delay = 0.5
+            elif len(ticks) == 6:
+                break
+
+    virtual_loop.run_until_complete(_main())
+    assert ticks == [0, 1, 2, 2.5, 3, 3.5]
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{"mode": "sometimes"}, {"missed_tick_policy": "ignore"}]
+)
+def test_bad_config(kwargs):
+    with pytest.raises(ValueError):
+        pacemaker.TimerPacemaker(delay=1.0, **kwargs)
+
+
+def test_fixed_rate_with_busy_waiters(virtual_loop):
+    fire_times = []
+
+    async def _waiter(timer):
+        async for _ in timer:
+            # Handling the result takes (virtual) time
+            virtual_loop.virtual_time += 0.001
+
+    async def _main():
+        timer = async_timer.Timer(
+            1.0,
+            target=lambda: fire_times.append(virtual_loop.time()),
+            mode="fixed_rate",
+        )
+        async with timer:
+            waiters = [asyncio.create_task(_waiter(timer)) for _ in range(100)]
+            await asyncio.sleep(10.5)
+        await asyncio.gather(*waiters)
+
+    virtual_loop.run_until_complete(_main())
+    # The waiters do not push the ticks off the grid
+    assert fire_times[:10] == pytest.approx(list(range(10)), abs=1e-6)
@@ -0,0 +1,124 @@
+"""Test the bulk timer management"""
+import asyncio
+import itertools
+
+import pytest
+
+import async_timer
+
+
+def _timers(count, delay=1.0, **kwargs):
+    return [
+        async_timer.Timer(
+            delay * (idx + 1), target=itertools.count().__next__, **kwargs
+        )
+        for idx in range(count)
+    ]
+
+
+def test_start_and_cancel(virtual_loop):
+    stopped = []
+
+    async def _main():
+        timers = [
+            async_timer.Timer(
+                1, target=lambda: None, cancel_cb=lambda *_: stopped.append(1)
+            )
+            for _ in range(10)
+        ]
+        async with async_timer.TimerGroup(timers) as group:
+            assert len(group) == 10
+            assert group.running == 10
+            assert all(timer.is_running() for timer in group)
+            await asyncio.sleep(2.5)
+        assert group.running == 0
+        return (group, timers)
+
+    (group, timers) = virtual_loop.run_until_complete(_main())
+    assert not any(timer.is_running() for timer in timers)
+    # The cancellation waited for the timer loops to finish
+    assert len(stopped) == 10
+    assert group.hits == sum(timer.hit_count for timer in timers) == 30
+
+
+def test_wait_all(virtual_loop):
+    async def _main():
+        async with async_timer.TimerGroup(_timers(3)) as group:
+            rvs = await group.wait_all(hit_count=3)
+            return (rvs, asyncio.get_running_loop().time())
+
+    (rvs, now) = virtual_loop.run_until_complete(_main())
+    # The 3rd call of the slowest (3 second) timer
+    assert rvs == [2, 2, 2]
+    assert now == pytest.approx(6, abs=1e-3)
+
+
+def test_wait_any(virtual_loop):
+    async def _main():
+        group = async_timer.TimerGroup()
+        timers = [group.add(timer) for timer in _timers(3)]
+        async with group:
+            first = await group.wait_any(hits=2)
+            with pytest.raises(asyncio.TimeoutError):
+                await group.wait_any(hits=10, timeout=1)
+        return (first, timers)
+
+    (first, timers) = virtual_loop.run_until_complete(_main())
+    assert first is timers[0]
+
+
+def test_wait_any_ignores_stopped(virtual_loop):
+    def _short():
+        yield 1
+
+    async def _main():
+        short = async_timer.Timer(1, target=_short)
+        (ticking,) = _timers(1, delay=2)
+        async with async_timer.TimerGroup([short, ticking]) as group:
+            first = await group.wait_any(hits=2)
+        async with async_timer.TimerGroup(
+            [async_timer.Timer(1, target=_short)]
+        ) as group:
+            with pytest.raises(RuntimeError):
+                await group.wait_any(hits=2)
+        return (first, ticking)
+
+    (first, ticking) = virtual_loop.run_until_complete(_main())
+    assert first is ticking
+
+
+class CountingHooks(async_timer.hooks.TimerHooks):
+    def __init__(self):
+        self.published = 0
+
+    def on_publish(self, timer, result, failed):
+        self.published += 1
+
+
+def test_error_counter(virtual_loop):
+    def _fail():
+        raise ValueError()
+
+    async def _main():
+        hooks = CountingHooks()
+        timer = async_timer.Timer(
+            1, target=_fail, on_error="continue", exc_cb=lambda *_: None, hooks=hooks
+        )
+        async with async_timer.TimerGroup([timer]) as group:
+            await asyncio.sleep(2.5)
+        return (group, hooks)
+
+    (group, hooks) = virtual_loop.run_until_complete(_main())
+    assert group.errors == group.hits == 3
+    # The timer's own hooks still run
+    assert hooks.published == 3
+
+
+@pytest.mark.asyncio
+async def test_add_running_timer():
+    timer = async_timer.Timer(0.01, target=lambda: None, start=True)
+    group = async_timer.TimerGroup([timer])
+    assert group.running == 1
+    await group.cancel()
+    assert group.running == 0
+    assert not timer.is_running()
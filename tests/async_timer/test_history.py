@@ -0,0 +1,121 @@
+import asyncio
+
+import pytest
+
+import async_timer
+from async_timer.history import HistoryOverrunError, ResultHistory
+
+
+class TestResultHistory:
+    def test_ring_buffer(self):
+        history = ResultHistory(3)
+        for idx in range(5):
+            history.append(idx, f"rv-{idx}")
+        assert history.count == 5
+        assert history.oldest == 2
+        assert [history.get(seq).result for seq in range(2, 5)] == [
+            "rv-2",
+            "rv-3",
+            "rv-4",
+        ]
+        assert history.get(4).hit_index == 4
+        with pytest.raises(HistoryOverrunError) as err:
+            history.get(0)
+        assert err.value.missed == 2
+        with pytest.raises(IndexError):
+            history.get(5)
+
+    def test_cursor(self):
+        history = ResultHistory(3)
+        history.append(0, "before")
+        cursor = history.cursor()
+        assert cursor.read() is None
+        history.append(1, "one")
+        history.append(2, NameError("two"), failed=True)
+        assert cursor.pending() == 2
+        assert cursor.read().result == "one"
+        entry = cursor.read()
+        assert entry.failed and isinstance(entry.result, NameError)
+        assert cursor.read() is None
+
+    def test_cursor_overrun(self):
+        history = ResultHistory(3)
+        cursor = history.cursor()
+        for idx in range(10):
+            history.append(idx, idx)
+        assert cursor.pending() == 3
+        with pytest.raises(HistoryOverrunError) as err:
+            cursor.read()
+        assert err.value.missed == 7
+        assert [cursor.read().result for _ in range(3)] == [7, 8, 9]
+
+    def test_bad_size(self):
+        with pytest.raises(ValueError):
+            ResultHistory(0)
+
+
+async def _slow_reader(timer, count: int) -> list:
+    out = []
+    async for val in timer:
+        out.append(val)
+        await asyncio.sleep(5e-3)
+        if len(out) >= count:
+            break
+    return out
+
+
+@pytest.mark.asyncio
+async def test_slow_readers_do_not_miss_results(count_fn):
+    async with async_timer.Timer(10e-5, target=count_fn, history=1_000) as timer:
+        (rv1, rv2) = await asyncio.gather(
+            _slow_reader(timer, 10), _slow_reader(timer, 15)
+        )
+    assert rv1 == list(range(rv1[0], rv1[0] + 10))
+    assert rv2 == list(range(rv2[0], rv2[0] + 15))
+
+
+@pytest.mark.asyncio
+async def test_overrun(count_fn):
+    async with async_timer.Timer(10e-5, target=count_fn, history=2) as timer:
+        with pytest.raises(async_timer.HistoryOverrunError) as err:
+            await _slow_reader(timer, 10)
+    assert err.value.missed > 0
+
+
+@pytest.mark.asyncio
+async def test_drains_history_after_stop():
+    def _target():
+        for idx in range(5):
+            yield idx
+        raise NameError("Something went wrong")
+
+    out = []
+    timer = async_timer.Timer(
+        10e-5, target=_target, history=10, exc_cb=lambda *_: None, start=True
+    )
+    with pytest.raises(NameError):
+        async for val in timer:
+            out.append(val)
+            await asyncio.sleep(5e-3)
+    assert out == list(range(5))
+
+
+@pytest.mark.asyncio
+async def test_iteration_ends_with_the_timer():
+    def _target():
+        yield from range(5)
+
+    out = []
+    async with async_timer.Timer(10e-5, target=_target, history=10) as timer:
+        async for val in timer:
+            out.append(val)
+            await asyncio.sleep(5e-3)
+    assert out == list(range(5))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("hit_count, exp_rv", [(1, 0), (50, 49), (100, 99)])
+async def test_wait_for_hit_count(count_fn, hit_count, exp_rv):
+    async with async_timer.Timer(10e-15, target=count_fn, history=5) as timer:
+        assert await timer.wait(hit_count=hit_count) == exp_rv
+        assert await timer.wait(hit_count=hit_count) is None
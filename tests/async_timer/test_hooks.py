@@ -0,0 +1,105 @@
+"""Test the timer lifecycle hooks"""
+import asyncio
+
+import pytest
+
+import async_timer
+import mock_async_timer
+
+
+class RecordingHooks(async_timer.hooks.TimerHooks):
+    def __init__(self):
+        self.events = []
+
+    def on_tick_scheduled(self, timer, deadline):
+        self.events.append(("scheduled", round(deadline, 6)))
+
+    def on_target_start(self, timer):
+        self.events.append(("start", timer.hit_count))
+
+    def on_target_end(self, timer, result, failed):
+        self.events.append(("end", result if not failed else type(result)))
+
+    def on_publish(self, timer, result, failed):
+        self.events.append(("publish", result if not failed else type(result)))
+
+    def on_stop(self, timer):
+        self.events.append(("stop",))
+
+
+def test_hook_order(virtual_loop):
+    hooks = RecordingHooks()
+    results = iter([10, 20, ValueError()])
+
+    def _target():
+        rv = next(results)
+        if isinstance(rv, Exception):
+            raise rv
+        return rv
+
+    async def _main():
+        start = asyncio.get_running_loop().time()
+        timer = async_timer.Timer(
+            1.0, target=_target, hooks=hooks, exc_cb=lambda *_: None
+        )
+        async with timer:
+            await timer.main_task
+        return start
+
+    start = virtual_loop.run_until_complete(_main())
+    events = [
+        (name, round(val[0] - start, 6)) if name == "scheduled" else (name, *val)
+        for (name, *val) in hooks.events
+    ]
+    assert events == [
+        ("scheduled", 0.0),
+        ("start", 0),
+        ("end", 10),
+        ("publish", 10),
+        ("scheduled", 1.0),
+        ("start", 1),
+        ("end", 20),
+        ("publish", 20),
+        ("scheduled", 2.0),
+        ("start", 2),
+        ("end", ValueError),
+        ("publish", ValueError),
+        ("stop",),
+    ]
+
+
+def test_overlapping_calls_hooks(virtual_loop):
+    hooks = RecordingHooks()
+
+    async def _target():
+        await asyncio.sleep(1.5)
+        return 42
+
+    async def _main():
+        timer = async_timer.Timer(1.0, target=_target, hooks=hooks, max_concurrency=2)
+        async with timer:
+            await asyncio.sleep(3.9)
+            main_task = timer.main_task
+        await asyncio.wait([main_task])
+
+    virtual_loop.run_until_complete(_main())
+    names = [event[0] for event in hooks.events]
+    assert names.count("start") == 4
+    assert names.count("end") == names.count("publish") == 3
+    assert names[-1] == "stop"
+
+
+@pytest.mark.asyncio
+async def test_no_hooks_by_default():
+    timer = async_timer.Timer(1, target=lambda: None)
+    assert timer.hooks is None
+    assert timer.pacemaker.on_tick_scheduled is None
+
+
+@pytest.mark.asyncio
+async def test_mock_timer_keeps_the_hooks():
+    hooks = RecordingHooks()
+    timer = mock_async_timer.MockTimer(1, target=lambda: 42, hooks=hooks)
+    async with timer:
+        assert await timer.join() == 42
+    assert ("scheduled",) == hooks.events[0][:1]
@@ -0,0 +1,150 @@
+"""Test the host-wide leader election (with real processes)"""
+import asyncio
+import multiprocessing
+import os
+import pathlib
+import signal
+import sys
+import time
+import unittest.mock
+
+import pytest
+
+import async_timer
+from async_timer.leader import FileLeaderLock
+
+pytestmark = pytest.mark.skipif(
+    sys.platform == "win32", reason="The leader election needs fcntl.flock()"
+)
+
+
+def _run_worker(name: str, directory: str, log_path: str, duration: float):
+    """A worker process running the same timer as all others"""
+
+    def _target():
+        with pathlib.Path(log_path).open("a") as log:
+            log.write(f"{os.getpid()}\n")
+
+    async def _main():
+        leader = FileLeaderLock(name, directory)
+        async with async_timer.Timer(0.02, target=_target, leader=leader):
+            await asyncio.sleep(duration)
+
+    asyncio.run(_main())
+
+
+def _start_worker(tmp_path, duration: float) -> multiprocessing.Process:
+    ctx = multiprocessing.get_context("fork")
+    proc = ctx.Process(
+        target=_run_worker,
+        args=("refresh-db", str(tmp_path), str(tmp_path / "calls.log"), duration),
+    )
+    proc.start()
+    return proc
+
+
+def _callers(tmp_path) -> list:
+    log = tmp_path / "calls.log"
+    if not log.exists():
+        return []
+    return [int(line) for line in log.read_text().split()]
+
+
+def _wait_for(condition, timeout: float = 1.0):
+    give_up_at = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < give_up_at, "Timed out"
+        time.sleep(0.01)
+
+
+def test_single_leader(tmp_path):
+    workers = [_start_worker(tmp_path, duration=0.5) for _ in range(3)]
+    for proc in workers:
+        proc.join()
+    callers = _callers(tmp_path)
+    assert callers
+    # The other workers can only take over as the leader is shutting down
+    switches = sum(1 for (a, b) in zip(callers, callers[1:]) if a != b)
+    assert switches <= 2
+    assert callers.count(callers[0]) > len(callers) / 2
+
+
+def test_follower_takes_over(tmp_path):
+    leader = _start_worker(tmp_path, duration=10)
+    _wait_for(lambda: _callers(tmp_path))
+    follower = _start_worker(tmp_path, duration=1)
+    time.sleep(0.1)
+    assert set(_callers(tmp_path)) == {leader.pid}
+    os.kill(leader.pid, signal.SIGKILL)
+    leader.join()
+    _wait_for(lambda: follower.pid in _callers(tmp_path))
+    follower.join()
+
+
+@pytest.mark.asyncio
+async def test_same_process(tmp_path):
+    calls = []
+    (first, second) = (
+        async_timer.Timer(
+            0.01,
+            target=lambda idx=idx: calls.append(idx),
+            leader=FileLeaderLock("name", tmp_path),
+            stats=True,
+        )
+        for idx in range(2)
+    )
+    async with first, second:
+        await asyncio.sleep(0.1)
+        assert first.leader.is_leader != second.leader.is_leader
+        assert len(set(calls)) == 1
+        follower = second if first.leader.is_leader else first
+        assert follower.hit_count == 0
+        assert follower.stats.skips > 0
+    assert not first.leader.is_leader
+
+
+def test_lock_file_name(tmp_path):
+    lock = FileLeaderLock("db/refresh job", tmp_path)
+    assert lock.path == tmp_path / "async-timer-db_refresh_job.lock"
+    assert lock.try_acquire()
+    assert not FileLeaderLock("db/refresh job", tmp_path).try_acquire()
+    lock.release()
+    assert FileLeaderLock("db/refresh job", tmp_path).try_acquire()
+
+
+@pytest.mark.asyncio
+async def test_leader_by_name():
+    timer = async_timer.Timer(1, target=lambda: None, leader="async-timer-test")
+    assert isinstance(timer.leader, FileLeaderLock)
+    assert timer.leader.name == "async-timer-test"
+
+
+def test_missing_lock_directory(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        FileLeaderLock("name", tmp_path / "missing")
+
+
+def test_lock_file_error(tmp_path, caplog):
+    lock = FileLeaderLock("name", tmp_path)
+    with unittest.mock.patch.object(os, "open", side_effect=PermissionError()):
+        assert not lock.try_acquire()
+    assert "Can not lock" in caplog.text
+    assert not lock.is_leader
+    # Tries again at the next tick
+    assert lock.try_acquire()
+    lock.release()
+
+
+@pytest.mark.asyncio
+async def test_follower_trigger(tmp_path):
+    leader = FileLeaderLock("name", tmp_path)
+    assert leader.try_acquire()
+    calls = []
+    timer = async_timer.Timer(
+        10, target=lambda: calls.append(1), leader=FileLeaderLock("name", tmp_path)
+    )
+    async with timer:
+        with pytest.raises(RuntimeError):
+            await asyncio.wait_for(timer.trigger_now(), 1)
+    leader.release()
+    assert calls == []
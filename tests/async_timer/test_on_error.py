@@ -0,0 +1,164 @@
+"""Test the timers that survive the target exceptions (using the virtual clock loop)"""
+import asyncio
+
+import pytest
+
+import async_timer
+
+
+class Flaky:
+    """A target that fails on the listed calls"""
+
+    def __init__(self, failing_calls):
+        self.failing_calls = set(failing_calls)
+        self.calls = []
+
+    def __call__(self):
+        idx = len(self.calls)
+        self.calls.append(asyncio.get_running_loop().time())
+        if idx in self.failing_calls:
+            raise ValueError(idx)
+        return idx
+
+
+def _run(virtual_loop, target, n_calls: int, **kwargs):
+    errors = []
+    results = []
+
+    async def _main():
+        timer = async_timer.Timer(
+            1.0,
+            target=target,
+            exc_cb=lambda timer, _: errors.append(timer.hit_count),
+            **kwargs,
+        )
+        async with timer:
+            while len(target.calls) < n_calls:
+                try:
+                    results.append(await timer.join())
+                except ValueError as err:
+                    results.append(err)
+        return timer
+
+    timer = virtual_loop.run_until_complete(_main())
+    periods = [round(b - a, 6) for (a, b) in zip(target.calls, target.calls[1:])]
+    return (timer, results, errors, periods)
+
+
+def test_continue(virtual_loop):
+    target = Flaky({1, 3})
+    (timer, results, errors, periods) = _run(
+        virtual_loop, target, 5, on_error="continue"
+    )
+    assert [isinstance(el, ValueError) for el in results] == [
+        False,
+        True,
+        False,
+        True,
+        False,
+    ]
+    assert errors == [1, 3]
+    assert periods == [1.0] * 4
+    assert timer.hit_count == 5
+
+
+def test_backoff(virtual_loop):
+    target = Flaky({0, 1, 2, 3})
+    (timer, _, errors, periods) = _run(
+        virtual_loop, target, 7, on_error="backoff", backoff_jitter=0
+    )
+    assert errors == [0, 1, 2, 3]
+    assert periods == [2.0, 4.0, 8.0, 16.0, 1.0, 1.0]
+    assert timer.pacemaker.failures == 0
+
+
+def test_backoff_cap(virtual_loop):
+    target = Flaky(range(5))
+    (_, _, _, periods) = _run(
+        virtual_loop, target, 6, on_error="backoff", backoff_max=5, backoff_jitter=0
+    )
+    assert periods == [2.0, 4.0, 5.0, 5.0, 5.0]
+
+
+def test_backoff_jitter(virtual_loop):
+    target = Flaky(range(20))
+    (_, _, _, periods) = _run(
+        virtual_loop, target, 20, on_error="backoff", backoff_max=4, backoff_jitter=0.5
+    )
+    assert all(4.0 <= val < 6.0 for val in periods[2:])
+    assert len(set(periods[2:])) > 1
+
+
+def test_backoff_restarts_fixed_rate_grid(virtual_loop):
+    target = Flaky({1, 2})
+    (_, _, _, periods) = _run(
+        virtual_loop,
+        target,
+        6,
+        on_error="backoff",
+        backoff_jitter=0,
+        mode="fixed_rate",
+        missed_tick_policy="catch_up",
+    )
+    # No burst of the ticks missed while backing off
+    assert periods == [1.0, 2.0, 4.0, 1.0, 1.0]
+
+
+def test_overlapping_calls_continue(virtual_loop):
+    target = Flaky({1})
+    (timer, results, errors, _) = _run(
+        virtual_loop, target, 4, on_error="continue", max_concurrency=2
+    )
+    assert errors == [1]
+    assert [isinstance(el, ValueError) for el in results] == [
+        False,
+        True,
+        False,
+        False,
+    ]
+
+
+def test_generator_is_recreated(virtual_loop):
+    calls = []
+
+    def _gen():
+        for idx in range(100):
+            calls.append(idx)
+            if idx == 1:
+                raise ValueError(idx)
+            yield idx
+
+    async def _main():
+        timer = async_timer.Timer(1.0, target=_gen, on_error="continue")
+        async with timer:
+            results = []
+            for _ in range(5):
+                try:
+                    results.append(await timer.join())
+                except ValueError as err:
+                    results.append(err.args)
+            return results
+
+    assert virtual_loop.run_until_complete(_main()) == [0, (1,), 0, (1,), 0]
+    assert calls[:5] == [0, 1, 0, 1, 0]
+
+
+def test_default_callback_does_not_stop_the_timer(virtual_loop, caplog):
+    target = Flaky({0})
+
+    async def _main():
+        timer = async_timer.Timer(1.0, target=target, on_error="continue")
+        async with timer:
+            with pytest.raises(ValueError):
+                await timer.join()
+            assert await timer.join() == 1
+            assert timer.is_running()
+
+    virtual_loop.run_until_complete(_main())
+    assert "carrying on" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_invalid_on_error():
+    with pytest.raises(ValueError):
+        async_timer.Timer(1, target=lambda: None, on_error="ignore")
@@ -0,0 +1,155 @@
+"""Test the `max_concurrency` timers (using the virtual clock loop)"""
+import asyncio
+import itertools
+
+import pytest
+
+import async_timer
+
+
+class _Target:
+    """Returns the call index after sleeping `durations[idx]`"""
+
+    def __init__(self, loop, durations):
+        self.loop = loop
+        self.durations = durations
+        self.counter = itertools.count()
+        self.started = []
+        self.cancelled = []
+
+    async def __call__(self):
+        idx = next(self.counter)
+        self.started.append((idx, self.loop.time()))
+        try:
+            await asyncio.sleep(self.durations[idx])
+        except asyncio.CancelledError:
+            self.cancelled.append(idx)
+            raise
+        return idx
+
+
+def _run_timer(virtual_loop, target, run_for: float, **kwargs):
+    published = []
+
+    async def _main():
+        timer = async_timer.Timer(1.0, target=target, **kwargs)
+        subscription = timer.subscribe(maxsize=100)
+        timer.start()
+        await asyncio.sleep(run_for)
+        await timer.cancel()
+        published.extend([val async for val in subscription])
+        return timer
+
+    timer = virtual_loop.run_until_complete(_main())
+    return (timer, published)
+
+
+def test_queue(virtual_loop):
+    target = _Target(virtual_loop, [2.5] * 100)
+    (timer, published) = _run_timer(virtual_loop, target, 6.9, max_concurrency=2)
+    assert target.started == [(0, 0), (1, 1), (2, 2.5), (3, 3.5), (4, 5), (5, 6)]
+    assert published == [0, 1, 2, 3]
+    assert timer.overruns == 4
+
+
+def test_skip(virtual_loop):
+    target = _Target(virtual_loop, [2.5] * 100)
+    (timer, published) = _run_timer(
+        virtual_loop, target, 6.9, max_concurrency=2, overrun="skip"
+    )
+    assert target.started == [(0, 0), (1, 1), (2, 3), (3, 4), (4, 6)]
+    assert published == [0, 1, 2, 3]
+    assert timer.overruns == 2
+
+
+def test_cancel_previous(virtual_loop):
+    target = _Target(virtual_loop, [10, 10, 10, 0.5, 0.5, 10])
+    (timer, published) = _run_timer(
+        virtual_loop, target, 5.9, max_concurrency=2, overrun="cancel_previous"
+    )
+    assert target.started == [(idx, idx) for idx in range(6)]
+    assert target.cancelled[:3] == [0, 1, 2]
+    assert published == [3, 4]
+
+
+@pytest.mark.parametrize(
+    "publish_order, exp_published",
+    [("hit", [0, 1, 2, 3]), ("completion", [1, 0, 3, 2])],
+)
+def test_publish_order(virtual_loop, publish_order, exp_published):
+    target = _Target(virtual_loop, [3, 1.5, 3, 1.5] + [100] * 10)
+    (_, published) = _run_timer(
+        virtual_loop,
+        target,
+        6.9,
+        max_concurrency=10,
+        publish_order=publish_order,
+    )
+    assert published == exp_published
+
+
+def test_failure_stops_the_timer(virtual_loop):
+    exceptions = []
+
+    async def _target():
+        await asyncio.sleep(1.5)
+        if len(exceptions) == 0 and virtual_loop.time() > 3:
+            raise NameError("boom")
+        return virtual_loop.time()
+
+    async def _main():
+        timer = async_timer.Timer(
+            1.0,
+            target=_target,
+            max_concurrency=3,
+            exc_cb=lambda *_: exceptions.append(True),
+            history=100,
+        )
+        async with timer:
+            with pytest.raises(NameError):
+                async for _ in timer:
+                    pass
+            await timer.main_task
+        return timer
+
+    timer = virtual_loop.run_until_complete(_main())
+    assert exceptions == [True]
+    assert timer.hit_count == 2
+    assert not timer.is_running()
+
+
+def test_async_generators_do_not_overlap():
+    async def _target():
+        yield 42
+
+    with pytest.raises(ValueError):
+        async_timer.Timer(1.0, target=_target, max_concurrency=2)
+
+
+def test_wrapped_async_generators_do_not_overlap(virtual_loop):
+    async def _gen():
+        yield 42
+
+    async def _main():
+        timer = async_timer.Timer(
+            1.0,
+            target=lambda: _gen(),
+            max_concurrency=2,
+            exc_cb=lambda *_: None,
+            start=True,
+        )
+        await timer.main_task
+        return timer
+
+    timer = virtual_loop.run_until_complete(_main())
+    assert isinstance(timer.last_exception, ValueError)
+    assert timer.hit_count == 0
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"max_concurrency": 0}, {"overrun": "explode"}, {"publish_order": "random"}],
+)
+def test_bad_config(kwargs):
+    with pytest.raises(ValueError):
+        async_timer.Timer(1.0, target=lambda: 42, **kwargs)
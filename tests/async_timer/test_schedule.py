@@ -0,0 +1,144 @@
+"""Test the cron schedules"""
+import datetime
+import time
+import unittest.mock
+
+import pytest
+
+import async_timer
+import mock_async_timer
+from async_timer.schedule import CronSchedule
+
+UTC = datetime.timezone.utc
+
+
+def _ts(text: str) -> float:
+    return datetime.datetime.fromisoformat(text).replace(tzinfo=UTC).timestamp()
+
+
+def _fires(expr: str, after: str, count: int = 1, tz=UTC) -> list:
+    schedule = CronSchedule(expr, tz=tz)
+    out = []
+    now = _ts(after)
+    for _ in range(count):
+        now = schedule.next_fire(now)
+        out.append(datetime.datetime.fromtimestamp(now, UTC).isoformat()[:16])
+    return out
+
+
+@pytest.mark.parametrize(
+    "expr, after, expected",
+    [
+        ("* * * * *", "2024-01-01T10:07:30", ["2024-01-01T10:08", "2024-01-01T10:09"]),
+        ("*/15 * * * *", "2024-01-01T10:07", ["2024-01-01T10:15", "2024-01-01T10:30"]),
+        ("*/15 * * * *", "2024-01-01T23:50", ["2024-01-02T00:00", "2024-01-02T00:15"]),
+        ("0 2 * * *", "2024-12-31T02:00", ["2025-01-01T02:00", "2025-01-02T02:00"]),
+        (
+            "0 9 * * mon-fri",
+            "2024-01-05T10:00",
+            ["2024-01-08T09:00", "2024-01-09T09:00"],
+        ),
+        ("0 0 29 feb *", "2024-03-01T00:00", ["2028-02-29T00:00", "2032-02-29T00:00"]),
+        ("0 0 31 * *", "2024-01-31T00:00", ["2024-03-31T00:00", "2024-05-31T00:00"]),
+        # Both day fields restricted - either one matches
+        ("0 0 13 * fri", "2024-01-01T00:00", ["2024-01-05T00:00", "2024-01-12T00:00"]),
+        ("30 4 1,15 * 7", "2024-01-01T05:00", ["2024-01-07T04:30", "2024-01-14T04:30"]),
+        ("0 12 * * sun", "2024-01-01T00:00", ["2024-01-07T12:00", "2024-01-14T12:00"]),
+        ("0 0 * * 0", "2024-01-01T00:00", ["2024-01-07T00:00", "2024-01-14T00:00"]),
+        (
+            "5-10/5 8-9 * 1 *",
+            "2024-01-01T08:05",
+            ["2024-01-01T08:10", "2024-01-01T09:05"],
+        ),
+        ("@monthly", "2024-01-31T00:00", ["2024-02-01T00:00", "2024-03-01T00:00"]),
+        ("@hourly", "2024-01-01T10:00", ["2024-01-01T11:00", "2024-01-01T12:00"]),
+    ],
+)
+def test_next_fire(expr, after, expected):
+    assert _fires(expr, after, len(expected)) == expected
+
+
+def test_next_fire_in_time_zone():
+    tz = datetime.timezone(datetime.timedelta(hours=2))
+    assert _fires("0 2 * * *", "2024-01-01T10:00", tz=tz) == ["2024-01-02T00:00"]
+
+
+@pytest.mark.parametrize(
+    "expr",
+    ["* * * *", "60 * * * *", "* 24 * * *", "* * 0 * *", "* * * foo *", "*/0 * * * *"],
+)
+def test_invalid_expression(expr):
+    with pytest.raises(ValueError):
+        CronSchedule(expr)
+
+
+def test_never_fires():
+    with pytest.raises(ValueError):
+        CronSchedule("0 0 30 2 *").next_fire(0)
+
+
+def test_incomplete_schedule():
+    class _NoFireTimes(async_timer.schedule.Schedule):
+        pass
+
+    with pytest.raises(TypeError):
+        _NoFireTimes()
+
+
+def _timer_fire_times(virtual_loop, n_ticks: int, **kwargs) -> list:
+    fire_times = []
+    epoch = _ts("2024-01-01T10:07:30") - virtual_loop.time()
+
+    async def _target():
+        for _ in range(n_ticks):
+            fire_times.append(time.time())
+            yield None
+
+    async def _main():
+        timer = async_timer.Timer(None, target=_target, start=True, **kwargs)
+        await timer.main_task
+
+    with unittest.mock.patch.object(
+        time, "time", side_effect=lambda: epoch + virtual_loop.time()
+    ):
+        virtual_loop.run_until_complete(_main())
+    return [
+        datetime.datetime.fromtimestamp(val, UTC).isoformat()[:19] for val in fire_times
+    ]
+
+
+def test_timer_on_schedule(virtual_loop):
+    schedule = async_timer.CronSchedule("*/15 * * * *")
+    assert _timer_fire_times(virtual_loop, 3, schedule=schedule) == [
+        "2024-01-01T10:15:00",
+        "2024-01-01T10:30:00",
+        "2024-01-01T10:45:00",
+    ]
+
+
+def test_timer_on_schedule_initial_delay(virtual_loop):
+    schedule = async_timer.CronSchedule("*/15 * * * *")
+    fire_times = _timer_fire_times(
+        virtual_loop, 2, schedule=schedule, initial_delay=3600
+    )
+    assert fire_times == ["2024-01-01T11:15:00", "2024-01-01T11:30:00"]
+
+
+@pytest.mark.asyncio
+async def test_schedule_or_delay_required():
+    with pytest.raises(ValueError):
+        async_timer.Timer(None, target=lambda: None)
+    with pytest.raises(ValueError):
+        async_timer.Timer(
+            None,
+            target=lambda: None,
+            schedule=CronSchedule("@daily"),
+            splay_key="key",
+        )
+
+
+@pytest.mark.asyncio
+async def test_mock_timer_keeps_the_schedule():
+    schedule = CronSchedule("@daily")
+    timer = mock_async_timer.MockTimer(None, target=lambda: None, schedule=schedule)
+    assert timer.pacemaker.schedule is schedule
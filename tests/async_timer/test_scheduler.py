@@ -0,0 +1,88 @@
+import asyncio
+import time
+
+import pytest
+
+import async_timer
+import async_timer.pacemaker as pacemaker
+
+
+@pytest.mark.asyncio
+async def test_schedule_at():
+    scheduler = async_timer.Scheduler()
+    loop = asyncio.get_running_loop()
+    fut = scheduler.schedule_at(loop.time() + 0.05)
+    assert len(scheduler) == 1
+    assert await fut is True
+    assert len(scheduler) == 0
+
+
+@pytest.mark.asyncio
+async def test_earlier_deadline_rearms_driver():
+    scheduler = async_timer.Scheduler()
+    loop = asyncio.get_running_loop()
+    late_fut = scheduler.schedule_at(loop.time() + 10_000)
+    await asyncio.sleep(0)  # let the driver go to sleep
+    start_time = time.monotonic()
+    assert await scheduler.schedule_at(loop.time() + 0.01) is True
+    assert time.monotonic() - start_time < 0.5
+    assert not late_fut.done()
+    scheduler.cancel(late_fut)
+    assert late_fut.result() is False
+
+
+@pytest.mark.asyncio
+async def test_batch_dispatch():
+    scheduler = async_timer.Scheduler()
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + 0.01
+    futs = [scheduler.schedule_at(deadline) for _ in range(1000)]
+    assert await asyncio.gather(*futs) == [True] * 1000
+
+
+@pytest.mark.asyncio
+async def test_compaction():
+    scheduler = async_timer.Scheduler()
+    loop = asyncio.get_running_loop()
+    futs = [scheduler.schedule_at(loop.time() + 10_000) for _ in range(200)]
+    for fut in futs[:150]:
+        scheduler.cancel(fut)
+    assert len(scheduler) == 50
+    assert len(scheduler._heap) < 200, "cancelled entries were dropped"
+    for fut in futs[150:]:
+        scheduler.cancel(fut)
+    assert len(scheduler) == 0
+
+
+@pytest.mark.asyncio
+async def test_pacemaker_stop():
+    scheduler = async_timer.Scheduler()
+    pm = pacemaker.TimerPacemaker(delay=10_000, scheduler=scheduler)
+    iter_count = 0
+
+    async def _stop_soon():
+        await asyncio.sleep(0.05)
+        pm.stop()
+
+    stop_task = asyncio.ensure_future(_stop_soon())
+    async for _ in pm:
+        iter_count += 1
+    await stop_task
+    assert iter_count == 1
+    assert len(scheduler) == 0
+
+
+@pytest.mark.asyncio
+async def test_many_timers():
+    scheduler = async_timer.Scheduler()
+    timers = [
+        async_timer.Timer(10e-3, target=lambda: 42, scheduler=scheduler, start=True)
+        for _ in range(500)
+    ]
+    await asyncio.gather(*(timer.wait(hit_count=5) for timer in timers))
+    assert all(timer.hit_count >= 5 for timer in timers)
+    for timer in timers:
+        await timer.cancel()
+    assert not any(timer.is_running() for timer in timers)
+    await asyncio.sleep(0)
+    assert len(scheduler) == 0
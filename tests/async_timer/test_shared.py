@@ -0,0 +1,99 @@
+"""Test sharing the results across the processes"""
+import asyncio
+import itertools
+import multiprocessing
+import os
+import sys
+
+import pytest
+
+import async_timer
+from async_timer.shared import SharedResultPublisher, SharedResultReader
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="POSIX only")
+
+
+def test_publish_and_read(tmp_path):
+    reader = SharedResultReader("db", tmp_path)
+    assert (reader.generation, reader.last_result) == (0, None)
+    publisher = SharedResultPublisher("db", size=1024, directory=tmp_path)
+    publisher.publish({"rows": [1, 2, 3]})
+    assert reader.generation == publisher.generation == 1
+    first = reader.last_result
+    assert first == {"rows": [1, 2, 3]}
+    # Unpickled once per generation
+    assert reader.last_result is first
+    assert reader.snapshot().last_hit_monotonic is not None
+    publisher.publish("next")
+    assert (reader.generation, reader.last_result) == (2, "next")
+    publisher.close()
+    reader.close()
+
+
+def test_too_large_result(tmp_path):
+    publisher = SharedResultPublisher("db", size=16, directory=tmp_path)
+    with pytest.raises(ValueError):
+        publisher.publish("x" * 100)
+    assert publisher.generation == 0
+
+
+def test_torn_write_is_dropped(tmp_path):
+    publisher = SharedResultPublisher("db", size=64, directory=tmp_path)
+    publisher.publish(1)
+    # The publisher dies in the middle of the next write
+    publisher._mmap[:8] = (publisher._seq + 1).to_bytes(8, "little")
+    publisher._mmap[24:30] = b"\xff" * 6
+    reader = SharedResultReader("db", tmp_path)
+    assert reader.last_result is None
+    # The next publisher starts a fresh generation
+    successor = SharedResultPublisher("db", size=64, directory=tmp_path)
+    assert reader.last_result is None
+    successor.publish(2)
+    assert (reader.generation, reader.last_result) == (3, 2)
+
+
+def test_growing_segment(tmp_path):
+    reader = SharedResultReader("db", tmp_path)
+    SharedResultPublisher("db", size=16, directory=tmp_path).publish(1)
+    assert reader.last_result == 1
+    SharedResultPublisher("db", size=4096, directory=tmp_path).publish("x" * 1000)
+    assert reader.last_result == "x" * 1000
+
+
+def test_untrusted_segment(tmp_path):
+    path = async_timer.shared.segment_path("db", tmp_path)
+    path.write_bytes(bytes(64))
+    path.chmod(0o666)
+    with pytest.raises(PermissionError):
+        SharedResultReader("db", tmp_path).snapshot()
+
+
+def _run_publisher(directory: str, count: int):
+    async def _main():
+        counter = itertools.count()
+        timer = async_timer.Timer(
+            0.01,
+            target=lambda: (os.getpid(), next(counter)),
+            hooks=SharedResultPublisher("counter", directory=directory),
+        )
+        async with timer:
+            await timer.wait(hit_count=count)
+
+    asyncio.run(_main())
+
+
+@pytest.mark.asyncio
+async def test_other_process(tmp_path):
+    reader = SharedResultReader("counter", tmp_path, poll_interval=0.001)
+    proc = multiprocessing.get_context("fork").Process(
+        target=_run_publisher, args=(str(tmp_path), 50)
+    )
+    proc.start()
+    try:
+        (pid, first) = await reader.join(timeout=1)
+        (_, second) = await reader.join(timeout=1)
+        assert pid == proc.pid
+        assert second > first
+    finally:
+        proc.join()
+    assert reader.last_result == (proc.pid, 49)
@@ -0,0 +1,70 @@
+"""Test the wake up coalescing (`slack`) option"""
+import asyncio
+
+import pytest
+
+import async_timer
+import async_timer.pacemaker as pacemaker
+import mock_async_timer
+
+
+def _fire_times(virtual_loop, timers_kwargs: list, n_ticks: int = 3) -> list:
+    fire_times = [[] for _ in timers_kwargs]
+
+    def _target(times):
+        async def _gen():
+            for _ in range(n_ticks):
+                times.append(round(virtual_loop.time(), 6))
+                yield None
+
+        return _gen
+
+    async def _main():
+        timers = [
+            async_timer.Timer(target=_target(times), start=True, **kwargs)
+            for (times, kwargs) in zip(fire_times, timers_kwargs)
+        ]
+        await asyncio.wait([timer.main_task for timer in timers])
+
+    virtual_loop.run_until_complete(_main())
+    return fire_times
+
+
+@pytest.mark.parametrize(
+    "mode, expected",
+    [
+        # The fixed rate grid does not drift, only the wake ups are late
+        ("fixed_rate", [0.5, 1.5, 2.5]),
+        ("fixed_delay", [0.5, 2.0, 3.5]),
+    ],
+)
+def test_slack_rounds_the_wakeups(virtual_loop, mode, expected):
+    kwargs = {"delay": 1.2, "initial_delay": 0.1, "slack": 0.5, "mode": mode}
+    assert _fire_times(virtual_loop, [kwargs]) == [expected]
+
+
+def test_timers_share_wakeups(virtual_loop):
+    fire_times = _fire_times(
+        virtual_loop,
+        [
+            {"delay": 1, "initial_delay": 0.1, "slack": 0.5},
+            {"delay": 1, "initial_delay": 0.4, "slack": 0.5},
+        ],
+    )
+    assert fire_times == [[0.5, 1.5, 2.5]] * 2
+
+
+def test_no_slack(virtual_loop):
+    kwargs = {"delay": 1, "initial_delay": 0.1}
+    assert _fire_times(virtual_loop, [kwargs]) == [[0.1, 1.1, 2.1]]
+
+
+def test_invalid_slack():
+    with pytest.raises(ValueError):
+        pacemaker.TimerPacemaker(1, slack=-1)
+
+
+@pytest.mark.asyncio
+async def test_mock_timer_keeps_the_slack():
+    timer = mock_async_timer.MockTimer(1, target=lambda: None, slack=0.1)
+    assert timer.pacemaker.slack == 0.1
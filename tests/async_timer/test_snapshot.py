@@ -0,0 +1,91 @@
+"""Test the synchronous last call accessors"""
+import asyncio
+import time
+
+import pytest
+
+import async_timer
+
+
+def test_snapshot(virtual_loop):
+    results = iter([1, ValueError("boom"), 3])
+
+    async def _target():
+        await asyncio.sleep(0.5)
+        rv = next(results)
+        if isinstance(rv, Exception):
+            raise rv
+        return rv
+
+    async def _main():
+        timer = async_timer.Timer(
+            1, target=_target, on_error="continue", exc_cb=lambda *_: None
+        )
+        assert timer.snapshot() == (None, None, None, None)
+        snapshots = []
+        async with timer:
+            for _ in range(3):
+                await asyncio.sleep(1.5)
+                snapshots.append(timer.snapshot())
+        return (timer, snapshots)
+
+    (timer, snapshots) = virtual_loop.run_until_complete(_main())
+    assert [snap.last_result for snap in snapshots] == [1, 1, 3]
+    assert [type(snap.last_exception) for snap in snapshots] == [
+        type(None),
+        ValueError,
+        type(None),
+    ]
+    # (The durations are measured in the real time)
+    assert all(snap.last_duration is not None for snap in snapshots)
+    assert snapshots[0].last_hit_monotonic <= snapshots[1].last_hit_monotonic
+    assert isinstance(snapshots[0], async_timer.TimerSnapshot)
+    # The snapshots are immutable
+    with pytest.raises(AttributeError):
+        snapshots[0].last_result = 42
+
+
+@pytest.mark.asyncio
+async def test_accessors():
+    timer = async_timer.Timer(1, target=lambda: 42)
+    before = time.monotonic()
+    async with timer:
+        await timer.join()
+        assert timer.last_result == 42
+        assert timer.last_exception is None
+        assert before <= timer.last_hit_monotonic <= time.monotonic()
+        assert timer.snapshot().last_duration == timer.last_duration
+
+
+class _SnapshotHooks(async_timer.hooks.TimerHooks):
+    def __init__(self):
+        self.snapshots = []
+
+    def on_publish(self, timer, result, failed):
+        self.snapshots.append(timer.snapshot())
+
+
+@pytest.mark.asyncio
+async def test_overlapping_call_durations():
+    durations = iter([0.3, 0.05])
+
+    async def _target():
+        duration = next(durations, 0)
+        await asyncio.sleep(duration)
+        return duration
+
+    hooks = _SnapshotHooks()
+    timer = async_timer.Timer(
+        0.1, target=_target, max_concurrency=2, publish_order="hit", hooks=hooks
+    )
+    async with timer:
+        await timer.wait(hits=2)
+        task = timer.main_task
+    # (Let the in-flight calls finish cancelling)
+    await asyncio.wait([task])
+    (first, second) = hooks.snapshots[:2]
+    # The slow call is published first, each with its own duration
+    assert (first.last_result, second.last_result) == (0.3, 0.05)
+    assert 0.3 <= first.last_duration < 0.35
+    assert 0.05 <= second.last_duration < 0.1
+    assert timer.last_duration == timer.snapshot().last_duration
@@ -0,0 +1,113 @@
+"""Test the initial delay, jitter and splay options (using the virtual clock loop)"""
+import asyncio
+import random
+import time
+import unittest.mock
+
+import pytest
+
+import async_timer
+import async_timer.pacemaker as pacemaker
+import mock_async_timer
+
+
+def _fire_times(virtual_loop, n_ticks: int, delay: float = 1.0, **kwargs) -> list:
+    fire_times = []
+
+    async def _target():
+        for _ in range(n_ticks):
+            fire_times.append(virtual_loop.time())
+            yield None
+
+    async def _main():
+        timer = async_timer.Timer(delay, target=_target, start=True, **kwargs)
+        await timer.main_task
+
+    start = virtual_loop.time()
+    virtual_loop.run_until_complete(_main())
+    return [round(val - start, 6) for val in fire_times]
+
+
+def test_first_tick_is_immediate_by_default(virtual_loop):
+    assert _fire_times(virtual_loop, 3) == [0.0, 1.0, 2.0]
+
+
+def test_initial_delay(virtual_loop):
+    assert _fire_times(virtual_loop, 3, initial_delay=5) == [5.0, 6.0, 7.0]
+
+
+@pytest.mark.parametrize("mode", ["fixed_delay", "fixed_rate"])
+def test_jitter_bounds(virtual_loop, mode):
+    random.seed(42)
+    fire_times = _fire_times(virtual_loop, 200, jitter=0.5, mode=mode)
+    periods = [b - a for (a, b) in zip(fire_times, fire_times[1:])]
+    assert 0 <= fire_times[0] < 0.5
+    assert len(set(periods)) > 100
+    if mode == "fixed_delay":
+        assert all(1.0 <= val < 1.5 for val in periods)
+    else:
+        # The jitter does not accumulate
+        assert all(idx <= val < idx + 1.0 for (idx, val) in enumerate(fire_times))
+
+
+def test_jitter_ratio(virtual_loop):
+    random.seed(42)
+    fire_times = _fire_times(virtual_loop, 100, delay=10.0, jitter_ratio=0.1)
+    periods = [b - a for (a, b) in zip(fire_times, fire_times[1:])]
+    assert all(10.0 <= val < 11.0 for val in periods)
+
+
+@pytest.mark.parametrize("slot, first_tick", [(0, 0.0), (1, 1.0), (3, 3.0)])
+def test_splay_slot_phase(virtual_loop, slot, first_tick):
+    with unittest.mock.patch.object(time, "time", return_value=1000.0):
+        fire_times = _fire_times(
+            virtual_loop, 3, delay=4.0, mode="fixed_rate", splay_key=(slot, 4)
+        )
+    assert fire_times == [first_tick, first_tick + 4, first_tick + 8]
+
+
+def test_splay_aligns_to_wall_clock(virtual_loop):
+    """Processes started at different times share the same phase"""
+    phases = set()
+    for now in (1000.0, 1001.3, 1777.7):
+        with unittest.mock.patch.object(time, "time", return_value=now):
+            (first_tick,) = _fire_times(virtual_loop, 1, delay=4.0, splay_key="db")
+        phases.add(round((now + first_tick) % 4.0, 6))
+    assert len(phases) == 1
+
+
+def test_splay_fraction():
+    assert pacemaker.splay_fraction("refresh") == pacemaker.splay_fraction("refresh")
+    assert pacemaker.splay_fraction((3, 4)) == 0.75
+    fractions = [pacemaker.splay_fraction(f"worker-{idx}") for idx in range(1000)]
+    assert all(0 <= val < 1 for val in fractions)
+    quarters = [
+        sum(1 for val in fractions if idx <= val * 4 < idx + 1) for idx in range(4)
+    ]
+    assert all(200 < val < 300 for val in quarters)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"initial_delay": -1},
+        {"jitter": -1},
+        {"jitter_ratio": -0.1},
+        {"splay_key": (0, 0)},
+    ],
+)
+async def test_invalid_options(kwargs):
+    with pytest.raises(ValueError):
+        pacemaker.TimerPacemaker(1, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_mock_timer_keeps_the_options():
+    timer = mock_async_timer.MockTimer(
+        1, target=lambda: None, initial_delay=2, jitter=0.5, splay_key="key"
+    )
+    assert timer.pacemaker.initial_delay == 2
+    assert timer.pacemaker.jitter == 0.5
+    assert timer.pacemaker.splay_key == "key"
+    await asyncio.sleep(0)
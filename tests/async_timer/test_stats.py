@@ -0,0 +1,184 @@
+"""Test the timer metrics"""
+import asyncio
+import gc
+import math
+import random
+
+import pytest
+
+import async_timer
+from async_timer.stats import Histogram, TimerStats
+
+
+def test_histogram_quantiles():
+    random.seed(42)
+    values = sorted(random.expovariate(100) for _ in range(10_000))
+    hist = Histogram()
+    for val in values:
+        hist.record(val)
+    assert hist.count == len(values)
+    assert hist.total == pytest.approx(sum(values))
+    assert (hist.minimum, hist.maximum) == (values[0], values[-1])
+    for q in (0.5, 0.9, 0.99):
+        exact = values[int(q * len(values)) - 1]
+        assert hist.quantile(q) == pytest.approx(exact, rel=0.07)
+
+
+def test_histogram_buckets():
+    hist = Histogram()
+    for val in (0, 1e-7, 1e-3, 1e-3, 1.0, 1e9):
+        hist.record(val)
+    buckets = list(hist.buckets())
+    assert [count for (_, count) in buckets] == [2, 2, 1, 1]
+    assert buckets[1][0] == pytest.approx(1e-3, rel=0.07)
+    assert buckets[1][0] >= 1e-3
+    assert hist.quantile(1.0) == 1e9
+
+
+def test_histogram_overflow():
+    hist = Histogram()
+    top = 2**42 * 1e-6 * 0.99  # The highest regular bucket
+    hist.record(top)
+    hist.record(1e9)
+    buckets = list(hist.buckets())
+    assert [count for (_, count) in buckets] == [1, 1]
+    assert buckets[0][0] == pytest.approx(top, rel=0.07)
+    assert buckets[1][0] == math.inf
+    assert hist.quantile(0.5) == pytest.approx(top, rel=0.07)
+    assert hist.quantile(1.0) == 1e9
+
+
+def test_histogram_merge():
+    (first, second) = (Histogram(), Histogram())
+    first.record(1)
+    second.record(2)
+    second.record(3)
+    first.merge(second)
+    assert first.as_dict()["count"] == 3
+    assert (first.minimum, first.maximum) == (1, 3)
+    assert Histogram().as_dict() == {"count": 0}
+
+
+def test_timer_stats(virtual_loop):
+    calls = iter([0.1, 2.5, ValueError(), 0.1, 0.1])
+
+    async def _target():
+        val = next(calls)
+        if isinstance(val, Exception):
+            raise val
+        await asyncio.sleep(val)
+
+    async def _main():
+        timer = async_timer.Timer(
+            1.0,
+            target=_target,
+            mode="fixed_rate",
+            on_error="continue",
+            exc_cb=lambda *_: None,
+            stats=True,
+        )
+        async with timer:
+            with pytest.raises(ValueError):
+                await timer.wait(hits=5)
+            await timer.wait(hit_count=5)
+        return timer.stats
+
+    stats = virtual_loop.run_until_complete(_main())
+    assert stats.ticks == 5
+    assert stats.errors == 1
+    # The 2.5 seconds call skipped two ticks
+    assert stats.skips == 2
+    assert stats.lateness.count == 5
+    assert stats.lateness.maximum < 1e-6
+    assert stats.duration.count == 5
+    assert stats.fanout_latency.count == 5
+
+
+@pytest.mark.asyncio
+async def test_subscription_fanout_latency():
+    timer = async_timer.Timer(0.01, target=lambda: None, stats=True)
+    subscription = timer.subscribe(maxsize=10)
+    async with timer:
+        received = [await subscription.__anext__() for _ in range(3)]
+    assert received == [None] * 3
+    assert timer.stats.fanout_latency.count == 3
+    assert 0 <= timer.stats.fanout_latency.maximum < 1
+
+
+def test_overrun_stats(virtual_loop):
+    async def _target():
+        await asyncio.sleep(2.5)
+
+    async def _main():
+        timer = async_timer.Timer(
+            1.0,
+            target=_target,
+            mode="fixed_rate",
+            max_concurrency=2,
+            overrun="skip",
+            stats=True,
+        )
+        async with timer:
+            await asyncio.sleep(10.5)
+        return timer.stats
+
+    stats = virtual_loop.run_until_complete(_main())
+    assert stats.ticks == 11
+    assert stats.overruns > 0
+    assert stats.skips == stats.overruns
+
+
+def test_timeout_stats(virtual_loop):
+    async def _hang():
+        await asyncio.sleep(100)
+
+    async def _main():
+        timer = async_timer.Timer(
+            1.0,
+            target=_hang,
+            target_timeout=1,
+            on_error="continue",
+            exc_cb=lambda *_: None,
+            stats=True,
+        )
+        async with timer:
+            await asyncio.sleep(5)
+        return timer.stats.as_dict()
+
+    stats = virtual_loop.run_until_complete(_main())
+    assert stats["errors"] == stats["timeouts"] > 0
+
+
+@pytest.mark.asyncio
+async def test_durations():
+    async def _sleep():
+        await asyncio.sleep(0.02)
+
+    timer = async_timer.Timer(0.01, target=_sleep, stats=True)
+    async with timer:
+        await timer.wait(hits=2)
+    assert timer.stats.duration.minimum >= 0.02
+    assert timer.stats.duration.maximum < 1
+
+
+@pytest.mark.asyncio
+async def test_stats_are_off_by_default():
+    timer = async_timer.Timer(1, target=lambda: None)
+    assert timer.stats is None
+
+
+@pytest.mark.asyncio
+async def test_aggregate():
+    gc.collect()
+    baseline = async_timer.stats.aggregate().ticks
+    timers = [
+        async_timer.Timer(0.01, target=lambda: None, stats=True) for _ in range(3)
+    ]
+    for timer in timers:
+        timer.start()
+    for timer in timers:
+        await timer.wait(hits=2)
+        await timer.cancel()
+    total = async_timer.stats.aggregate()
+    assert total.ticks - baseline == sum(timer.stats.ticks for timer in timers)
+    assert isinstance(total, TimerStats)
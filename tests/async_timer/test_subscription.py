@@ -0,0 +1,109 @@
+import asyncio
+import gc
+
+import pytest
+
+import async_timer
+from async_timer.subscription import Subscription
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "policy, exp_buffer",
+    [
+        ("drop_oldest", [7, 8, 9]),
+        ("drop_newest", [0, 1, 2]),
+        ("latest_only", [9]),
+    ],
+)
+async def test_policies(policy, exp_buffer):
+    subscription = Subscription(maxsize=3, policy=policy)
+    for idx in range(10):
+        await subscription.put(idx)
+    assert len(subscription) == len(exp_buffer)
+    assert subscription.dropped == 10 - len(exp_buffer)
+    subscription.close()
+    assert [val async for val in subscription] == exp_buffer
+
+
+@pytest.mark.asyncio
+async def test_block_producer():
+    subscription = Subscription(maxsize=2, policy="block_producer")
+    published = []
+
+    async def _producer():
+        for idx in range(10):
+            await subscription.put(idx)
+            published.append(idx)
+        subscription.close()
+
+    producer = asyncio.ensure_future(_producer())
+    await asyncio.sleep(0.01)
+    assert published == [0, 1], "The producer waits for the consumer"
+    assert [val async for val in subscription] == list(range(10))
+    await producer
+    assert subscription.dropped == 0
+
+
+@pytest.mark.asyncio
+async def test_exception_is_delivered_in_order():
+    subscription = Subscription(maxsize=3)
+    await subscription.put(1)
+    await subscription.put(NameError("boom"), failed=True)
+    assert await subscription.__anext__() == 1
+    with pytest.raises(NameError):
+        await subscription.__anext__()
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{"policy": "drop_everything"}, {"maxsize": 0}, {"maxsize": -1}]
+)
+def test_bad_config(kwargs):
+    with pytest.raises(ValueError):
+        Subscription(**kwargs)
+
+
+@pytest.mark.asyncio
+async def test_timer_subscribe_latest_only(count_fn):
+    slow_vals = []
+    async with async_timer.Timer(10e-5, target=count_fn) as timer:
+        subscription = timer.subscribe(policy="latest_only")
+        async for val in subscription:
+            slow_vals.append(val)
+            await asyncio.sleep(0.01)
+            if len(slow_vals) >= 5:
+                break
+        hit_count = timer.hit_count
+    assert slow_vals == sorted(slow_vals)
+    assert slow_vals[-1] - slow_vals[0] > 5, "The slow consumer skips results"
+    assert subscription.dropped > 0
+    assert hit_count > 20, "The slow consumer does not hold back the timer"
+
+
+@pytest.mark.asyncio
+async def test_timer_subscribe_block_producer(count_fn):
+    async with async_timer.Timer(10e-5, target=count_fn) as timer:
+        subscription = timer.subscribe(maxsize=2, policy="block_producer")
+        await asyncio.sleep(0.05)
+        assert timer.hit_count <= 4
+        assert [await subscription.__anext__() for _ in range(10)] == list(range(10))
+
+
+@pytest.mark.asyncio
+async def test_timer_stop_ends_subscriptions():
+    def _target():
+        yield from range(5)
+
+    timer = async_timer.Timer(10e-5, target=_target)
+    subscription = timer.subscribe(maxsize=10)
+    timer.start()
+    assert [val async for val in subscription] == list(range(5))
+
+
+@pytest.mark.asyncio
+async def test_forgotten_subscriptions_are_dropped(count_fn):
+    async with async_timer.Timer(10e-5, target=count_fn) as timer:
+        timer.subscribe()
+        gc.collect()
+        await timer.join()
+        assert len(timer._subscriptions) == 0
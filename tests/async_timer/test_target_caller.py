@@ -1,3 +1,7 @@
+import concurrent.futures
+import os
+import threading
+
 import pytest
 
 import async_timer.traget_caller as traget_caller
@@ -61,3 +65,103 @@ async def test_iterable(count_iterable, called):
     assert await caller.next() == 0
     assert await caller.next() == 1
     assert await caller.next() == 2
+
+
+@pytest.fixture
+def thread_pool():
+    with concurrent.futures.ThreadPoolExecutor(2) as pool:
+        yield pool
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("use_default", [True, False])
+async def test_sync_fn_in_executor(thread_pool, use_default):
+    caller = traget_caller.Caller(
+        target=threading.get_ident, executor="default" if use_default else thread_pool
+    )
+    assert await caller.next() != threading.get_ident()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("called", [True, False])
+async def test_sync_gen_in_executor(thread_pool, called):
+    def _gen():
+        for _ in range(3):
+            yield threading.get_ident()
+
+    caller = traget_caller.Caller(
+        target=_gen() if called else _gen, executor=thread_pool
+    )
+    rvs = [await caller.next() for _ in range(3)]
+    assert threading.get_ident() not in rvs
+    with pytest.raises(StopAsyncIteration):
+        await caller.next()
+
+
+@pytest.mark.asyncio
+async def test_async_fn_is_not_offloaded(thread_pool, async_count_fn):
+    caller = traget_caller.Caller(target=async_count_fn, executor=thread_pool)
+    assert [await caller.next() for _ in range(3)] == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_process_pool():
+    with concurrent.futures.ProcessPoolExecutor(1) as pool:
+        caller = traget_caller.Caller(target=os.getpid, executor=pool)
+        assert await caller.next() != os.getpid()
+
+
+def test_process_pool_generator(count_gen):
+    with concurrent.futures.ProcessPoolExecutor(1) as pool:
+        with pytest.raises(ValueError):
+            traget_caller.Caller(target=count_gen, executor=pool)
+
+
+@pytest.mark.asyncio
+async def test_sync_gen_of_awaitables(async_count_fn):
+    def _gen():
+        while True:
+            yield async_count_fn()
+
+    caller = traget_caller.Caller(target=_gen)
+    assert [await caller.next() for _ in range(3)] == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_fn_returning_awaitables(async_count_fn):
+    caller = traget_caller.Caller(target=lambda: async_count_fn())
+    assert [await caller.next() for _ in range(3)] == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("kind", ["fn", "gen"])
+@pytest.mark.parametrize("async_first", [True, False])
+async def test_mixed_awaitables(kind, async_first):
+    async def _async_val(val):
+        return val
+
+    def _values():
+        for idx in range(4):
+            yield _async_val(idx) if (idx % 2 == 0) == async_first else idx
+
+    values = _values()
+    target = (lambda: next(values)) if kind == "fn" else _values
+    caller = traget_caller.Caller(target=target)
+    assert [await caller.next() for _ in range(4)] == [0, 1, 2, 3]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("kind", ["sync", "async"])
+async def test_exhausted_generator_reset(kind):
+    def _sync_gen():
+        yield "a"
+
+    async def _async_gen():
+        yield "a"
+
+    caller = traget_caller.Caller(target=_sync_gen if kind == "sync" else _async_gen)
+    for _ in range(2):
+        assert await caller.next() == "a"
+        with pytest.raises(StopAsyncIteration):
+            await caller.next()
+        caller.reset()
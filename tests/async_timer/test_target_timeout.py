@@ -0,0 +1,120 @@
+"""Test the target call timeouts"""
+import asyncio
+import concurrent.futures
+import threading
+import unittest.mock
+
+import pytest
+
+import async_timer
+from async_timer.traget_caller import Caller
+
+
+def test_hung_call_times_out(virtual_loop):
+    async def _hang():
+        await asyncio.sleep(3600)
+
+    async def _main():
+        timer = async_timer.Timer(1.0, target=_hang, target_timeout=5)
+        async with timer:
+            start = asyncio.get_running_loop().time()
+            with pytest.raises(asyncio.TimeoutError):
+                await timer.join()
+            return (asyncio.get_running_loop().time() - start, timer)
+
+    (elapsed, timer) = virtual_loop.run_until_complete(_main())
+    assert elapsed == pytest.approx(5.0)
+    assert not timer.is_running()
+
+
+def test_timeout_follows_error_policy(virtual_loop):
+    durations = iter([0.5, 10, 2])
+
+    async def _slow():
+        duration = next(durations)
+        await asyncio.sleep(duration)
+        return duration
+
+    async def _main():
+        timer = async_timer.Timer(
+            1.0,
+            target=_slow,
+            target_timeout=3,
+            on_error="continue",
+            exc_cb=lambda *_: None,
+        )
+        async with timer:
+            results = []
+            for _ in range(3):
+                try:
+                    results.append(await timer.join())
+                except asyncio.TimeoutError:
+                    results.append("timeout")
+            return results
+
+    assert virtual_loop.run_until_complete(_main()) == [0.5, "timeout", 2]
+
+
+@pytest.mark.asyncio
+async def test_durations_are_recorded():
+    async def _sleep():
+        await asyncio.sleep(0.05)
+        return 42
+
+    timer = async_timer.Timer(1.0, target=_sleep, target_timeout=1)
+    assert timer.last_duration is None
+    async with timer:
+        assert await timer.join() == 42
+    assert 0.05 <= timer.last_duration < 1
+    assert timer.max_duration == timer.last_duration
+
+
+@pytest.mark.asyncio
+async def test_time_left():
+    seen = []
+
+    async def _target():
+        seen.append(async_timer.time_left())
+
+    caller = Caller(_target, timeout=10)
+    await caller.next()
+    assert 9 < seen[0] <= 10
+    # Not leaked outside of the call
+    assert async_timer.time_left() is None
+
+
+@pytest.mark.asyncio
+async def test_time_left_reset_in_caller_task():
+    async def _in_caller_task(aw, timeout):
+        # (What `wait_for()` does since Python 3.12)
+        return await aw
+
+    caller = Caller(async_timer.time_left, timeout=5)
+    with unittest.mock.patch.object(asyncio, "wait_for", _in_caller_task):
+        assert 4 < await caller.next() <= 5
+    assert async_timer.time_left() is None
+
+
+@pytest.mark.asyncio
+async def test_time_left_without_timeout():
+    caller = Caller(async_timer.time_left)
+    assert await caller.next() is None
+
+
+@pytest.mark.asyncio
+async def test_time_left_in_executor():
+    seen = []
+
+    def _target():
+        seen.append((async_timer.time_left(), threading.current_thread()))
+
+    with concurrent.futures.ThreadPoolExecutor(1) as pool:
+        await Caller(_target, executor=pool, timeout=10).next()
+    ((left, thread),) = seen
+    assert 9 < left <= 10
+    assert thread is not threading.current_thread()
+
+
+def test_invalid_timeout():
+    with pytest.raises(ValueError):
+        Caller(lambda: None, timeout=0)
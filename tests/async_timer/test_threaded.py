@@ -0,0 +1,99 @@
+"""Test the timers for the sync code"""
+import concurrent.futures
+import itertools
+import threading
+
+import pytest
+
+import async_timer
+from async_timer.threaded import BackgroundLoop
+
+
+@pytest.fixture
+def background():
+    rv = BackgroundLoop()
+    yield rv
+    rv.stop()
+
+
+def test_join_and_wait(background):
+    counter = itertools.count()
+    with async_timer.ThreadedTimer(
+        0.01, target=counter.__next__, background=background
+    ) as timer:
+        assert timer.is_running()
+        first = timer.join(timeout=1)
+        assert timer.wait(hits=2, timeout=1) >= first + 2
+        assert timer.last_result == timer.snapshot().last_result >= first + 2
+    assert not timer.is_running()
+
+
+def test_sync_target_runs_in_the_executor(background):
+    with async_timer.ThreadedTimer(
+        1, target=threading.get_ident, background=background
+    ) as timer:
+        timer.wait(hit_count=1, timeout=1)
+        thread_id = timer.last_result
+    assert thread_id not in (threading.get_ident(), background._thread.ident)
+
+
+def test_join_timeout(background):
+    timer = async_timer.ThreadedTimer(
+        10, target=lambda: None, background=background, start=True
+    )
+    timer.wait(hit_count=1, timeout=1)
+    with pytest.raises(concurrent.futures.TimeoutError):
+        timer.join(timeout=0.01)
+    timer.cancel()
+
+
+def test_many_threads_share_the_loop(background):
+    timers = [
+        async_timer.ThreadedTimer(
+            0.01, target=lambda: 42, background=background, start=True
+        )
+        for _ in range(3)
+    ]
+    with concurrent.futures.ThreadPoolExecutor(3) as pool:
+        rvs = list(pool.map(lambda timer: timer.join(timeout=1), timers))
+    assert rvs == [42] * 3
+    assert {timer.timer.main_task.get_loop() for timer in timers} == {background.loop}
+    for timer in timers:
+        timer.cancel()
+
+
+def test_target_exception(background):
+    def _fail():
+        raise ValueError("boom")
+
+    timer = async_timer.ThreadedTimer(
+        0.01,
+        target=_fail,
+        background=background,
+        on_error="continue",
+        exc_cb=lambda *_: None,
+        start=True,
+    )
+    with pytest.raises(ValueError):
+        timer.join(timeout=1)
+    assert isinstance(timer.snapshot().last_exception, ValueError)
+    timer.cancel()
+
+
+def test_trigger_now(background):
+    counter = itertools.count()
+    timer = async_timer.ThreadedTimer(
+        60, target=counter.__next__, background=background, start=True
+    )
+    timer.wait(hit_count=1, timeout=1)
+    assert timer.last_result == 0
+    assert timer.trigger_now().result(timeout=1) == 1
+    timer.cancel()
+
+
+def test_no_blocking_in_the_loop_thread(background):
+    async def _nested():
+        return background.run(_nested())
+
+    with pytest.raises(RuntimeError):
+        background.run(_nested(), timeout=1)
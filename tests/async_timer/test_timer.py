@@ -1,6 +1,7 @@
 import asyncio
 import itertools
 import time
+import weakref
 
 import asyncstdlib
 import pytest
@@ -336,3 +337,31 @@ class TestAsyncFunc:
             t3 = time.monotonic()
         assert t2 - t1 < 0.1
         assert 0.4 < t3 - t2 < 1
+
+    @pytest.mark.asyncio
+    async def test_blocking_target_in_executor(self):
+        loop = asyncio.get_running_loop()
+        lags = []
+        async with async_timer.Timer(
+            10e-3, target=lambda: time.sleep(0.1), executor="default"
+        ) as timer:
+            for _ in range(20):
+                start = loop.time()
+                await asyncio.sleep(0.01)
+                lags.append(loop.time() - start - 0.01)
+            await timer.join()
+        assert max(lags) < 0.05, "The event loop was not blocked"
+
+
+@pytest.mark.asyncio
+async def test_compact_idle_timer():
+    timer = async_timer.Timer(3600, target=lambda: 42)
+    for obj in (timer, timer.pacemaker, timer.target_caller, timer.result_fanout):
+        assert not hasattr(obj, "__dict__"), obj
+    assert weakref.ref(timer)() is timer
+    async with timer:
+        await asyncio.sleep(0)
+        # Nothing to notify, no waiters
+        assert timer.pacemaker._cancel_event is None
+        assert timer.result_fanout.waiters is None
+        assert timer.hit_count == 1
@@ -0,0 +1,174 @@
+"""Test the out-of-band timer triggers"""
+import asyncio
+
+import pytest
+
+import async_timer
+
+
+def _counting_target(virtual_loop, calls: list, duration: float = 0.0):
+    async def _target():
+        calls.append(round(virtual_loop.time(), 6))
+        await asyncio.sleep(duration)
+        return len(calls)
+
+    return _target
+
+
+def test_trigger_while_waiting(virtual_loop):
+    calls = []
+
+    async def _main():
+        timer = async_timer.Timer(10, target=_counting_target(virtual_loop, calls))
+        async with timer:
+            await asyncio.sleep(3)
+            rvs = await asyncio.gather(timer.trigger_now(), timer.trigger_now())
+            await asyncio.sleep(12)
+        return rvs
+
+    rvs = virtual_loop.run_until_complete(_main())
+    # The concurrent triggers share a call, the next tick is `delay` after it
+    assert rvs == [2, 2]
+    assert calls == [0.0, 3.0, 13.0]
+
+
+def test_trigger_right_after_start(virtual_loop):
+    calls = []
+
+    async def _main():
+        timer = async_timer.Timer(1, target=_counting_target(virtual_loop, calls))
+        timer.start()
+        rv = await timer.trigger_now()
+        await asyncio.sleep(1.5)
+        await timer.cancel()
+        return rv
+
+    rv = virtual_loop.run_until_complete(_main())
+    # The first tick answers the trigger
+    assert rv == 1
+    assert calls == [0.0, 1.0]
+
+
+def test_triggers_during_a_call(virtual_loop):
+    calls = []
+
+    async def _main():
+        timer = async_timer.Timer(
+            10, target=_counting_target(virtual_loop, calls, duration=2)
+        )
+        async with timer:
+            await asyncio.sleep(1)
+            waiters = [timer.trigger_now() for _ in range(3)]
+            rvs = await asyncio.gather(*waiters)
+            return (rvs, virtual_loop.time())
+
+    (rvs, now) = virtual_loop.run_until_complete(_main())
+    # A single follow-up call right after the running one
+    assert calls == [0.0, 2.0]
+    assert rvs == [2, 2, 2]
+    assert now == pytest.approx(4)
+
+
+def test_debounce(virtual_loop):
+    calls = []
+
+    async def _main():
+        timer = async_timer.Timer(10, target=_counting_target(virtual_loop, calls))
+        async with timer:
+            await asyncio.sleep(1)
+            first = timer.trigger_now(debounce=1)
+            await asyncio.sleep(0.5)
+            second = timer.trigger_now(debounce=1)
+            return await asyncio.gather(first, second)
+
+    rvs = virtual_loop.run_until_complete(_main())
+    # One call a `debounce` after the last trigger
+    assert calls == [0.0, 2.5]
+    assert rvs == [2, 2]
+
+
+def test_debounce_satisfied_by_the_tick(virtual_loop):
+    calls = []
+
+    async def _main():
+        timer = async_timer.Timer(2, target=_counting_target(virtual_loop, calls))
+        async with timer:
+            await asyncio.sleep(1)
+            rv = await timer.trigger_now(debounce=5)
+            await asyncio.sleep(3)
+            return rv
+
+    assert virtual_loop.run_until_complete(_main()) == 2
+    assert calls == [0.0, 2.0, 4.0]
+
+
+def test_trigger_gets_the_exception(virtual_loop):
+    def _fail():
+        raise ValueError("boom")
+
+    async def _main():
+        timer = async_timer.Timer(
+            10, target=_fail, on_error="continue", exc_cb=lambda *_: None
+        )
+        async with timer:
+            await asyncio.sleep(1)
+            with pytest.raises(ValueError):
+                await timer.trigger_now()
+            # Nobody awaits this one
+            timer.trigger_now()
+            await asyncio.sleep(1)
+
+    virtual_loop.run_until_complete(_main())
+
+
+def test_trigger_fixed_rate_with_scheduler(virtual_loop):
+    calls = []
+
+    async def _main():
+        timer = async_timer.Timer(
+            10,
+            target=_counting_target(virtual_loop, calls),
+            mode="fixed_rate",
+            scheduler=async_timer.Scheduler(),
+        )
+        async with timer:
+            await asyncio.sleep(3)
+            await timer.trigger_now()
+            await asyncio.sleep(18)
+
+    virtual_loop.run_until_complete(_main())
+    # The trigger took the place of the tick at 10, the grid carries on
+    assert calls == [0.0, 3.0, 20.0]
+
+
+def test_cancelled_waiter(virtual_loop):
+    calls = []
+
+    async def _main():
+        timer = async_timer.Timer(
+            10, target=_counting_target(virtual_loop, calls, duration=1)
+        )
+        async with timer:
+            await asyncio.sleep(2)
+            first = asyncio.ensure_future(timer.trigger_now())
+            second = timer.trigger_now()
+            await asyncio.sleep(0.5)
+            first.cancel()
+            return await second
+
+    assert virtual_loop.run_until_complete(_main()) == 2
+
+
+def test_stopped_timer_cancels_the_triggers(virtual_loop):
+    async def _main():
+        timer = async_timer.Timer(10, target=lambda: None)
+        with pytest.raises(RuntimeError):
+            timer.trigger_now()
+        timer.start()
+        await asyncio.sleep(1)
+        waiter = timer.trigger_now(debounce=5)
+        await timer.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+    virtual_loop.run_until_complete(_main())